@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""잡플래닛 페이지 추출 벤치마크 (요소별 WebDriver 호출 vs execute_script 1회)
+
+사용법 (Chrome 필요, 로그인 없이 볼 수 있는 페이지 기준):
+    python benchmarks/jobplanet_extract_bench.py --query 삼성전자
+    python benchmarks/jobplanet_extract_bench.py --url https://www.jobplanet.co.kr/companies/30139
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+from src.jobplanet.crawler import JobplanetCrawler
+from src.jobplanet.extract import snapshot_page, parse_company_snapshot, find_address
+
+
+def extract_legacy(driver) -> dict:
+    """기존 방식: find_elements 후 요소마다 get_attribute/text 호출"""
+    links = []
+    salary_url = None
+    for link in driver.find_elements(By.TAG_NAME, "a"):
+        href = link.get_attribute("href") or ""
+        if not salary_url and "/salaries" in href:
+            salary_url = href
+        text = link.text.strip() if link.text else ""
+        if re.search(r"/companies/\d+", href) and text:
+            links.append((text, href))
+
+    rating = None
+    try:
+        rating = driver.find_element(By.CSS_SELECTOR, ".rate_point").text.strip()
+    except NoSuchElementException:
+        pass
+
+    title = driver.title
+    address = find_address(driver.find_element(By.TAG_NAME, "body").text)
+    return {"links": links, "salaryUrl": salary_url, "rating": rating,
+            "title": title, "address": address}
+
+
+def extract_snapshot(driver) -> dict:
+    """새 방식: execute_script 1회 + Python 측 정규식"""
+    page = snapshot_page(driver)
+    data = parse_company_snapshot(page)
+    return {"links": page["links"], "salaryUrl": page.get("salaryUrl"),
+            "rating": page.get("rating"), "title": page.get("title"),
+            "address": data.address}
+
+
+def measure(func, driver, repeat: int) -> tuple[float, dict]:
+    result = None
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(driver)
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="잡플래닛 추출 벤치마크")
+    parser.add_argument("--query", help="검색어 (검색 결과 페이지 측정)")
+    parser.add_argument("--url", help="회사 페이지 URL")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-headless", action="store_true")
+    args = parser.parse_args()
+
+    url = args.url or f"{JobplanetCrawler.SEARCH_URL}{args.query or '삼성전자'}"
+
+    with JobplanetCrawler(headless=not args.no_headless) as crawler:
+        crawler._init_driver()
+        crawler.driver.get(url)
+        time.sleep(3)
+
+        legacy_time, legacy = measure(extract_legacy, crawler.driver, args.repeat)
+        snapshot_time, snapshot = measure(extract_snapshot, crawler.driver, args.repeat)
+
+    print(f"페이지: {url}")
+    print(f"  회사 링크: 기존 {len(legacy['links'])}개 / 새 방식 {len(snapshot['links'])}개")
+    print(f"  기존 (요소별 호출):     {legacy_time * 1000:.1f}ms")
+    print(f"  새 방식 (스크립트 1회): {snapshot_time * 1000:.1f}ms")
+    print(f"  배속: {legacy_time / snapshot_time:.1f}x")
+    if legacy["links"] != snapshot["links"] or legacy["address"] != snapshot["address"]:
+        print("  [경고] 추출 결과가 다릅니다.")
+
+
+if __name__ == "__main__":
+    main()
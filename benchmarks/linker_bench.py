@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""회사 연결 벤치마크 (모든 쌍 similarity_score vs 블로킹 + 컬럼 단위 점수)
+
+합성 병무청 회사 목록(10%는 다른 지역의 같은 이름 회사)과, 그중 70%를 다른 표기로 바꾸고 다른 회사를 섞은
+플랫폼 회사 목록을 만들어 연결 정확도와 시간을 잽니다. 기존 방식(병무청 회사마다 플랫폼 회사 전체와
+similarity_score)은 너무 느리므로 --sample개 회사만 돌려 전체 시간을 추정합니다.
+
+사용법:
+    python benchmarks/linker_bench.py
+    python benchmarks/linker_bench.py --companies 20000 --sample 20
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import Company, MmaData
+from src.pipeline.linker import company_frame, prepare_records, resolve
+from src.utils import similarity_score
+
+SIDOS = {
+    "서울": ["강남구", "서초구", "구로구", "금천구"], "경기": ["성남시", "수원시", "화성시", "안산시"],
+    "부산": ["해운대구", "사상구"], "대전": ["유성구"], "경남": ["창원시", "김해시"], "충북": ["청주시"],
+}
+SIDO_FULL = {"서울": "서울특별시", "경기": "경기도", "부산": "부산광역시", "대전": "대전광역시",
+             "경남": "경상남도", "충북": "충청북도"}
+SUFFIXES = ["", "", "테크", "전자", "정밀", "산업", "시스템", "바이오", "엔지니어링"]
+
+
+def random_core(rng: random.Random) -> str:
+    """임의 한글 2~4글자 + 흔한 업종 접미사"""
+    syllables = "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 4)))
+    return syllables + rng.choice(SUFFIXES)
+
+
+def synthetic(count: int, rng: random.Random):
+    """(병무청 회사 목록, 플랫폼 회사 목록, 정답 {회사 ID: URL})"""
+    companies, records, truth = [], [], {}
+    cores = []
+    for i in range(count):
+        # 10%는 다른 지역의 같은 이름 회사
+        core = rng.choice(cores) if cores and rng.random() < 0.1 else random_core(rng)
+        cores.append(core)
+        sido = rng.choice(list(SIDOS))
+        sigungu = rng.choice(SIDOS[sido])
+        phone = f"0{rng.randint(2, 64)}-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}"
+        name = rng.choice(["(주){}", "{}", "주식회사 {}", "{}(주)"]).format(core)
+        company = Company(
+            id=f"c{i}", name=name, sido=sido, sigungu=sigungu,
+            mma=MmaData(phone=phone if rng.random() < 0.9 else None),
+        )
+        companies.append(company)
+
+        if rng.random() < 0.7:  # 플랫폼에도 있는 회사
+            url = f"https://example.com/company/{i}"
+            shown = rng.choice(["{}", "㈜{}", "{} 주식회사", "{}(주)", "{} 본사", "{}(Co., Ltd.)"]).format(core)
+            records.append({
+                "name": shown,
+                "url": url,
+                "region": f"{SIDO_FULL[sido]} {sigungu} 어딘가로 {rng.randint(1, 300)}"
+                if rng.random() < 0.6 else None,
+                "phone": phone if rng.random() < 0.3 else None,
+            })
+            truth[company.id] = url
+
+    # 병무청에 없는 플랫폼 회사
+    for j in range(count - len(records)):
+        core = random_core(rng)
+        records.append({"name": core, "url": f"https://example.com/other/{j}", "region": None})
+    rng.shuffle(records)
+    return companies, records, truth
+
+
+def run_legacy(companies, records, threshold: float = 0.85) -> dict:
+    """기존 방식: 회사마다 플랫폼 회사 전체와 similarity_score"""
+    links = {}
+    for company in companies:
+        best, best_score = None, 0.0
+        for record in records:
+            score = similarity_score(company.name, record["name"])
+            if score > best_score:
+                best, best_score = record, score
+        if best and best_score >= threshold:
+            links[company.id] = best["url"]
+    return links
+
+
+def run_linker(companies, records) -> tuple[dict, dict]:
+    left = company_frame(companies)
+    right = prepare_records(pd.DataFrame(records))
+    links, stats = resolve(left, right)
+    accepted = links[links["score"] >= 0.85]
+    ids = left["id"].to_numpy()[accepted["l"].to_numpy()]
+    urls = right["url"].to_numpy()[accepted["r"].to_numpy()]
+    return dict(zip(ids, urls)), stats
+
+
+def accuracy(links: dict, truth: dict) -> str:
+    correct = sum(1 for cid, url in links.items() if truth.get(cid) == url)
+    precision = correct / len(links) if links else 0.0
+    recall = correct / len(truth) if truth else 0.0
+    return f"정밀도 {precision:.3f}, 재현율 {recall:.3f} (연결 {len(links):,}개)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회사 연결 벤치마크")
+    parser.add_argument("--companies", type=int, default=100_000, help="병무청/플랫폼 회사 수")
+    parser.add_argument("--sample", type=int, default=10, help="기존 방식으로 돌려볼 회사 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    companies, records, truth = synthetic(args.companies, rng)
+
+    sample = companies[: args.sample]
+    started = time.perf_counter()
+    legacy = run_legacy(sample, records)
+    legacy_time = (time.perf_counter() - started) / len(sample) * len(companies)
+
+    started = time.perf_counter()
+    linked, stats = run_linker(companies, records)
+    linker_time = time.perf_counter() - started
+
+    sample_truth = {c.id: truth[c.id] for c in sample if c.id in truth}
+    sample_linked = {cid: url for cid, url in linked.items() if cid in {c.id for c in sample}}
+    print(f"합성 목록: 병무청 {len(companies):,}개 × 플랫폼 {len(records):,}개 (정답 {len(truth):,}쌍)")
+    print(f"  기존 (모든 쌍):      약 {legacy_time / 60:.0f}분 ({args.sample}개 회사로 추정)")
+    print(f"  블로킹 + 컬럼 점수:  {linker_time:.1f}초 (후보 쌍 {stats['pairs']:,}개)")
+    print(f"  배속: 약 {legacy_time / linker_time:.0f}x")
+    print(f"  전체 연결: {accuracy(linked, truth)}")
+    print(f"  표본 {args.sample}개 - 기존: {accuracy(legacy, sample_truth)}")
+    print(f"  표본 {args.sample}개 - 새 방식: {accuracy(sample_linked, sample_truth)}")
+
+
+if __name__ == "__main__":
+    main()
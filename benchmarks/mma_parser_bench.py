@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""병무청 엑셀 파싱 벤치마크 (행 단위 iterrows vs 컬럼 단위 처리)
+
+합성 시트(기본 10만 행)를 만들어 기존 방식과 새 방식의 결과가 같은지 확인하고
+파싱 시간을 비교합니다.
+
+사용법:
+    python benchmarks/mma_parser_bench.py
+    python benchmarks/mma_parser_bench.py --rows 20000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import Company, MmaData
+from src.mma.parser import frame_to_companies, generate_company_id, map_columns
+
+SIDOS = [
+    "서울특별시", "서울", "부산광역시", "대구광역시", "인천광역시", "광주광역시", "대전광역시",
+    "울산광역시", "세종특별자치시", "경기도", "경기", "강원도", "충청북도", "충남",
+    "전라북도", "전남", "경상북도", "경남", "제주특별자치도",
+]
+SIGUNGUS = ["강남구", "성남시 분당구", "수원시 영통구", "해운대구", "유성구", "청주시", "양평군"]
+ROADS = ["테헤란로", "판교역로", "광교로", "센텀중앙로", "대학로", "중앙로"]
+INDUSTRIES = ["정보처리", "기계", "전기", "화학", "섬유", "식음료", None]
+SIZES = ["중소기업", "중견기업", "대기업", None]
+
+
+def extract_region_legacy(address: str):
+    """기존 extract_region (호출마다 패턴 목록/매핑 생성)"""
+    if not address:
+        return None, None
+    address = address.strip()
+    sido_patterns = [
+        r"^(서울|부산|대구|인천|광주|대전|울산|세종)",
+        r"^(경기|강원|충북|충남|전북|전남|경북|경남|제주)",
+        r"^(충청북도|충청남도|전라북도|전라남도|경상북도|경상남도)",
+        r"^(서울특별시|부산광역시|대구광역시|인천광역시|광주광역시|대전광역시|울산광역시|세종특별자치시)",
+        r"^(경기도|강원도|제주특별자치도|제주도)",
+    ]
+    sido = None
+    for pattern in sido_patterns:
+        match = re.match(pattern, address)
+        if match:
+            sido = match.group(1)
+            sido_map = {
+                "서울특별시": "서울", "부산광역시": "부산", "대구광역시": "대구",
+                "인천광역시": "인천", "광주광역시": "광주", "대전광역시": "대전",
+                "울산광역시": "울산", "세종특별자치시": "세종", "경기도": "경기",
+                "강원도": "강원", "충청북도": "충북", "충청남도": "충남",
+                "전라북도": "전북", "전라남도": "전남", "경상북도": "경북",
+                "경상남도": "경남", "제주특별자치도": "제주", "제주도": "제주",
+            }
+            sido = sido_map.get(sido, sido)
+            break
+    sigungu = None
+    sigungu_match = re.search(r"(?:시|도)\s*([가-힣]+(?:시|군|구))", address)
+    if sigungu_match:
+        sigungu = sigungu_match.group(1)
+    else:
+        sigungu_match = re.search(r"(?:서울|부산|대구|인천|광주|대전|울산)\s*([가-힣]+구)", address)
+        if sigungu_match:
+            sigungu = sigungu_match.group(1)
+    return sido, sigungu
+
+
+def parse_legacy(df: pd.DataFrame, col_map: dict) -> list[Company]:
+    """기존 방식: iterrows로 행마다 정리/변환"""
+    companies = []
+    for idx, row in df.iterrows():
+        try:
+            name = str(row.get(col_map.get("name", ""), "")).strip()
+            if not name or name == "nan":
+                continue
+            address = str(row.get(col_map.get("address", ""), "")).strip()
+            if address == "nan":
+                address = ""
+            region = str(row.get(col_map.get("region", ""), "")).strip()
+            if region == "nan":
+                region = ""
+            sido, sigungu = extract_region_legacy(address or region)
+
+            year_val = row.get(col_map.get("year", ""), None)
+            year = None
+            if pd.notna(year_val):
+                try:
+                    year = int(float(year_val))
+                except (ValueError, TypeError):
+                    pass
+
+            texts = {}
+            for field in ("phone", "industry", "companySize", "mainProduct"):
+                texts[field] = None
+                if field in col_map:
+                    val = row.get(col_map[field], "")
+                    if pd.notna(val) and str(val).strip() != "nan":
+                        texts[field] = str(val).strip()
+
+            def safe_int(val):
+                try:
+                    return int(float(val or 0))
+                except (ValueError, TypeError):
+                    return 0
+
+            companies.append(Company(
+                id=generate_company_id(name, address),
+                name=name,
+                sido=sido,
+                sigungu=sigungu,
+                address=address if address else None,
+                mma=MmaData(
+                    selectedYear=year,
+                    address=address if address else None,
+                    region=region if region else sido,
+                    phone=texts["phone"],
+                    industry=texts["industry"],
+                    companySize=texts["companySize"],
+                    mainProduct=texts["mainProduct"],
+                    reserveQuota=safe_int(row.get(col_map.get("reserveQuota", ""), 0)),
+                    reserveServing=safe_int(row.get(col_map.get("reserveServing", ""), 0)),
+                    activeQuota=safe_int(row.get(col_map.get("activeQuota", ""), 0)),
+                    activeServing=safe_int(row.get(col_map.get("activeServing", ""), 0)),
+                ),
+            ))
+        except Exception as e:
+            print(f"행 {idx} 파싱 오류: {e}")
+    return companies
+
+
+def make_sheet(rows: int, seed: int = 0) -> pd.DataFrame:
+    """병무청 엑셀과 같은 컬럼의 합성 시트 (빈 칸, "nan", 문자열 숫자 포함)"""
+    rng = random.Random(seed)
+
+    def address():
+        if rng.random() < 0.03:
+            return np.nan
+        return (
+            f" {rng.choice(SIDOS)} {rng.choice(SIGUNGUS)} {rng.choice(ROADS)} "
+            f"{rng.randint(1, 300)}{rng.choice(['', ', 3층', ' (역삼동)'])}"
+        )
+
+    def number():
+        value = rng.choice([rng.randint(0, 20), float(rng.randint(0, 20)), np.nan, "3", " 2.7 ", ""])
+        return value
+
+    return pd.DataFrame({
+        "업체명": [
+            rng.choice([f"(주)회사{i}", f"회사{i} ", "nan", np.nan]) if i % 97 == 0 else f"회사{i}"
+            for i in range(rows)
+        ],
+        "사업장주소": [address() for _ in range(rows)],
+        "지역": [rng.choice(SIDOS + ["", np.nan]) for _ in range(rows)],
+        "선정년도": [rng.choice([2015.0, 2020.0, np.nan, "2019", "미정"]) for _ in range(rows)],
+        "전화번호": [rng.choice(["02-123-4567", " 031-000-0000 ", np.nan, "nan", ""]) for _ in range(rows)],
+        "업종": [rng.choice(INDUSTRIES) for _ in range(rows)],
+        "기업규모": [rng.choice(SIZES) for _ in range(rows)],
+        "주생산품": [rng.choice(["소프트웨어", "반도체", np.nan]) for _ in range(rows)],
+        "현역배정인원": [number() for _ in range(rows)],
+        "현역복무인원": [number() for _ in range(rows)],
+        "보충역배정인원": [rng.randint(0, 10) for _ in range(rows)],
+        "보충역복무인원": [float(rng.randint(0, 10)) for _ in range(rows)],
+    })
+
+
+def measure(func, df: pd.DataFrame, col_map: dict) -> tuple[float, list[Company]]:
+    started = time.perf_counter()
+    companies = func(df, col_map)
+    return time.perf_counter() - started, companies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병무청 엑셀 파싱 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = make_sheet(args.rows)
+    col_map = map_columns(df.columns)
+
+    legacy_time, legacy = measure(parse_legacy, df, col_map)
+    columnar_time, columnar = measure(frame_to_companies, df, col_map)
+
+    print(f"합성 시트: {args.rows:,}행 → {len(columnar):,}개 회사")
+    print(f"  기존 (iterrows):  {legacy_time:.2f}초")
+    print(f"  새 방식 (컬럼):   {columnar_time:.2f}초")
+    print(f"  배속: {legacy_time / columnar_time:.1f}x")
+    if [c.to_dict() for c in legacy] != [c.to_dict() for c in columnar]:
+        print("  [경고] 파싱 결과가 다릅니다.")
+    else:
+        print("  결과 동일")
+
+
+if __name__ == "__main__":
+    main()
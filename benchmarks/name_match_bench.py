@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""회사명 매칭 벤치마크 (매번 정규화하는 is_good_match vs NameMatcher)
+
+검색 결과 페이지처럼 회사마다 후보 목록(기본 20개)을 검색 변형 수만큼 비교하고,
+기존 구현과 결과가 같은지 확인합니다. data/companies.json이 있으면 실제 병무청 회사명을 씁니다.
+
+사용법:
+    python benchmarks/name_match_bench.py
+    python benchmarks/name_match_bench.py --companies 2000 --candidates 30
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline.enricher import load_companies
+from src.utils import NameMatcher, normalize_company_name
+
+CORES = [
+    "한빛소프트", "대한정밀", "삼우기계", "에이치엘비", "코리아테크", "미래전자", "동양화학",
+    "세원정공", "한국알앤디", "누리텔레콤", "태영섬유", "우진산업", "그린바이오", "성진이엔지",
+]
+FORMS = ["(주){}", "{}(주)", "주식회사 {}", "{} 주식회사", "㈜{}", "{}", "유한회사 {}", "{} ({})"]
+ENGLISH = ["Hanbit Co., Ltd.", "Daehan Inc.", "Samwoo Corp.", "Korea Tech LLC", "Mirae"]
+
+
+def legacy_normalize(name: str) -> dict:
+    """기존 normalize_company_name (매번 re.sub)"""
+    if not name:
+        return {'korean': '', 'english': None}
+    english = None
+    eng_match = re.search(r'\(([A-Za-z][A-Za-z0-9\s.,&]+(?:Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)?)\s*\)', name)
+    if eng_match:
+        english = eng_match.group(1).strip()
+        english = re.sub(r'\s*(Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)\s*$', '', english, flags=re.IGNORECASE).strip()
+    korean = name
+    korean = re.sub(r'^(?:[\(（]주[\)）]?|주[\)）])\s*', '', korean)  # 주로 시작하는 이름 보존 (현재 규칙과 동일)
+    korean = re.sub(r'^㈜\s*', '', korean)
+    korean = re.sub(r'\s*주식회사\s*', '', korean)
+    korean = re.sub(r'\s*유한회사\s*', '', korean)
+    korean = re.sub(r'\s*유한책임회사\s*', '', korean)
+    korean = re.sub(r'\s*\([A-Za-z][^)]*\)\s*', '', korean)
+    korean = re.sub(r'\s*[\(（]주[\)）]$', '', korean)
+    korean = re.sub(r'\s+', ' ', korean).strip()
+    # 검색 변형 생성 비용도 기존과 같게
+    variants = [korean, english, korean.replace(' ', ''), re.sub(r'[&\-.,]', '', korean)]
+    list(dict.fromkeys(v for v in variants if v))
+    return {'korean': korean, 'english': english}
+
+
+def legacy_similarity(name1: str, name2: str) -> float:
+    if not name1 or not name2:
+        return 0.0
+    n1 = legacy_normalize(name1)['korean'].lower()
+    n2 = legacy_normalize(name2)['korean'].lower()
+    if not n1 or not n2:
+        return 0.0
+    if n1 == n2:
+        return 1.0
+    if n1 in n2:
+        return len(n1) / len(n2)
+    if n2 in n1:
+        return len(n2) / len(n1)
+    set1 = set(n1.replace(' ', ''))
+    set2 = set(n2.replace(' ', ''))
+    if not set1 or not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+def legacy_is_good_match(search_name: str, result_name: str, threshold: float = 0.6) -> bool:
+    """기존 is_good_match"""
+    if legacy_similarity(search_name, result_name) >= threshold:
+        return True
+    s_norm = legacy_normalize(search_name)
+    r_norm = legacy_normalize(result_name)
+    if s_norm['korean'] and r_norm['korean']:
+        if s_norm['korean'] in r_norm['korean'] or r_norm['korean'] in s_norm['korean']:
+            return True
+    if s_norm['english'] and r_norm['english']:
+        if s_norm['english'].lower() == r_norm['english'].lower():
+            return True
+    return False
+
+
+def synthetic_names(count: int, rng: random.Random) -> list[str]:
+    names = []
+    for i in range(count):
+        core = rng.choice(CORES) + ("" if i < len(CORES) else str(rng.randint(1, 999)))
+        form = rng.choice(FORMS)
+        names.append(form.format(core, rng.choice(ENGLISH)))
+    return names
+
+
+def make_workload(names: list[str], candidates: int, rng: random.Random):
+    """(회사명, 검색 변형 수, 후보 목록) - 후보에는 같은 회사의 다른 표기와 다른 회사가 섞임"""
+    pool = names + synthetic_names(len(names), rng)
+    workload = []
+    for name in names:
+        page = rng.sample(pool, min(candidates - 1, len(pool)))
+        page.insert(rng.randrange(len(page) + 1), f"(주){normalize_company_name(name)['korean']}")
+        workload.append((name, len(normalize_company_name(name)['search_variants']), page))
+    return workload
+
+
+def run_legacy(workload) -> list[list[bool]]:
+    results = []
+    for name, variants, page in workload:
+        for _ in range(variants):
+            flags = [legacy_is_good_match(name, text) for text in page]
+        results.append(flags)
+    return results
+
+
+def run_matcher(workload) -> list[list[bool]]:
+    matcher = NameMatcher()
+    results = []
+    for name, variants, page in workload:
+        for _ in range(variants):
+            flags = matcher.matches(name, page)
+        results.append(flags)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회사명 매칭 벤치마크")
+    parser.add_argument("--companies", type=int, default=1000)
+    parser.add_argument("--candidates", type=int, default=20, help="검색 결과 페이지당 후보 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [c.name for c in load_companies()][: args.companies]
+    source = "data/companies.json" if names else "합성 회사명"
+    if len(names) < args.companies:
+        source += " + 합성 회사명" if names else ""
+        names += synthetic_names(args.companies - len(names), rng)
+    workload = make_workload(names, args.candidates, rng)
+    comparisons = sum(variants * len(page) for _, variants, page in workload)
+
+    started = time.perf_counter()
+    legacy = run_legacy(workload)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matched = run_matcher(workload)
+    matcher_time = time.perf_counter() - started
+
+    print(f"{source}: 회사 {len(names):,}개, 비교 {comparisons:,}회")
+    print(f"  기존 (is_good_match):  {legacy_time * 1000:.0f}ms ({legacy_time / comparisons * 1e6:.1f}us/회)")
+    print(f"  NameMatcher.matches:  {matcher_time * 1000:.0f}ms ({matcher_time / comparisons * 1e6:.1f}us/회)")
+    print(f"  배속: {legacy_time / matcher_time:.1f}x")
+    if legacy != matched:
+        differs = [
+            (name, text, old)
+            for (name, _, page), old_flags, new_flags in zip(workload, legacy, matched)
+            for text, old, new in zip(page, old_flags, new_flags)
+            if old != new
+        ]
+        print(f"  [경고] 매칭 결과가 다릅니다: {len(differs)}개 비교")
+        for name, text, old in differs[:5]:
+            print(f"    {name} ↔ {text}: 기존 {old}, NameMatcher {not old}")
+    else:
+        print(f"  결과 동일 (매칭 {sum(map(sum, matched)):,}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""ProgressTracker 저장 방식 벤치마크 (json vs journal)
+
+사용법:
+    python benchmarks/progress_bench.py
+    python benchmarks/progress_bench.py --sizes 10000 100000 --json-max 10000
+
+json 방식은 mark 한 번마다 파일 전체를 다시 쓰므로 O(n²)입니다.
+--json-max 보다 큰 크기는 여러 채움 구간에서 mark 비용을 샘플링해 전체 시간을 추정합니다.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline.progress import ProgressTracker
+
+
+# 실제 잡플래닛 결과와 비슷한 크기의 레코드
+SAMPLE_RESULT = {
+    "rating": 3.4,
+    "reviewCount": 128,
+    "avgSalary": 4520,
+    "address": "서울 강남구 테헤란로 123 4층",
+    "url": "https://www.jobplanet.co.kr/companies/123456/reviews/회사",
+}
+
+
+def run_full(backend: str, n: int) -> float:
+    """n번 mark_completed 실행 시간 (초)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = ProgressTracker("bench", backend=backend, progress_dir=Path(tmp))
+        start = time.perf_counter()
+        for i in range(n):
+            tracker.mark_completed(f"c{i:08d}", SAMPLE_RESULT)
+        elapsed = time.perf_counter() - start
+
+        # 재로드 후 상태 검증
+        reloaded = ProgressTracker("bench", backend=backend, progress_dir=Path(tmp))
+        assert reloaded.get_stats()["completed"] == n
+        return elapsed
+
+
+def estimate_json(n: int, samples: int = 5, marks_per_sample: int = 20) -> float:
+    """json 방식 전체 시간을 채움 구간별 샘플로 추정 (초)"""
+    points = []
+    for k in range(samples + 1):
+        fill = n * k // samples
+        with tempfile.TemporaryDirectory() as tmp:
+            tracker = ProgressTracker("bench", backend="json", progress_dir=Path(tmp))
+            tracker.data["completed"] = {f"p{i:08d}": SAMPLE_RESULT for i in range(fill)}
+            start = time.perf_counter()
+            for i in range(marks_per_sample):
+                tracker.mark_completed(f"c{i:08d}", SAMPLE_RESULT)
+            points.append((time.perf_counter() - start) / marks_per_sample)
+
+    # 사다리꼴 적분: 구간 평균 mark 비용 × 구간 길이
+    step = n / samples
+    return sum((points[k] + points[k + 1]) / 2 * step for k in range(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProgressTracker 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument(
+        "--json-max",
+        type=int,
+        default=10000,
+        help="json 방식을 실제로 끝까지 실행할 최대 크기 (초과 시 추정)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'marks':>8} | {'json':>14} | {'journal':>10} | {'배속':>8}")
+    print("-" * 50)
+    for n in args.sizes:
+        journal = run_full("journal", n)
+        if n <= args.json_max:
+            json_time = run_full("json", n)
+            json_str = f"{json_time:.2f}s"
+        else:
+            json_time = estimate_json(n)
+            json_str = f"~{json_time:.1f}s(추정)"
+        print(f"{n:>8} | {json_str:>14} | {journal:>9.2f}s | {json_time / journal:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
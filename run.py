@@ -7,12 +7,20 @@ from pathlib import Path
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.config import OUTPUT_FILE, MMA_EXCEL_PATH
-from src.mma.download import download_all_companies
+from src.company_index import CompanyIndex
+from src.config import GEOCODE_HEDGE, GEOCODE_WORKERS, OUTPUT_FILE
+from src.mma.download import download_all_companies, excel_source
 from src.mma.parser import parse_excel, save_parsed_data
+from src.mma.snapshot import apply_snapshot
 from src.jobplanet.crawler import JobplanetCrawler
+from src.jobplanet.pool import JobplanetCrawlerPool
+from src.jobplanet.http_crawler import JobplanetHttpCrawler
+from src.jobplanet.extract import parse_archived_pages
 from src.wanted.crawler import WantedCrawler
-from src.geocoding.naver import NaverGeocoder
+from src.wanted.async_crawler import AsyncWantedCrawler
+from src.geocoding.engine import GeocodeEngine
+from src.http_cache import set_offline
+from src.ratelimit import parse_rate_spec, set_rate_override
 from src.pipeline.enricher import (
     load_companies,
     save_companies,
@@ -20,30 +28,38 @@ from src.pipeline.enricher import (
     merge_jobplanet_data,
     merge_wanted_data,
     merge_geocode_data,
+    update_address_priority,
 )
+from src.pipeline.linker import PLATFORM_URLS, link_platform, linked_urls, read_records
+from src.pipeline.store import SqliteStore
+from src.pipeline.reparse import reparse_source
 
 
-def step_download():
-    """병무청 엑셀 다운로드"""
+def step_download() -> bool:
+    """병무청 엑셀 다운로드 (내용이 바뀌었으면 True)"""
     print("\n=== 병무청 데이터 다운로드 ===")
-    download_all_companies()
+    _, changed = download_all_companies()
+    return changed
 
 
 def step_parse():
     """엑셀 파싱"""
     print("\n=== 엑셀 파싱 ===")
 
-    if not MMA_EXCEL_PATH.exists():
-        print(f"엑셀 파일이 없습니다: {MMA_EXCEL_PATH}")
+    source = excel_source()
+    if not source.exists():
+        print(f"엑셀 파일이 없습니다: {source}")
         print("먼저 --step download를 실행하세요.")
         return []
 
-    companies = parse_excel(MMA_EXCEL_PATH)
+    companies = parse_excel(source)
+    # 이전 목록과 비교해 주소/이름이 바뀐 회사도 ID(수집 결과)를 이어받음
+    apply_snapshot(companies, fallback=load_companies())
     save_companies(companies, OUTPUT_FILE)
     return companies
 
 
-def step_jobplanet(limit: int = None):
+def step_jobplanet(limit: int = None, workers: int = 1, http: bool = False):
     """잡플래닛 크롤링"""
     print("\n=== 잡플래닛 크롤링 ===")
 
@@ -52,15 +68,27 @@ def step_jobplanet(limit: int = None):
         print("회사 데이터가 없습니다. 먼저 --step parse를 실행하세요.")
         return
 
-    with JobplanetCrawler(headless=True) as crawler:
-        crawler.crawl_companies(companies, limit=limit)
+    # 연결 테이블로 찾은 회사는 검색 없이 URL로 조회
+    links = linked_urls("jobplanet")
+
+    # HTTP 모드: 로그인만 브라우저로 하고 페이지는 HTML로 직접 파싱
+    crawler_cls = JobplanetHttpCrawler if http else JobplanetCrawler
+    if workers > 1:
+        crawler = JobplanetCrawlerPool(
+            workers=workers, headless=True, crawler_cls=crawler_cls
+        )
+    else:
+        crawler = crawler_cls(headless=True)
+
+    with crawler:
+        crawler.crawl_companies(companies, limit=limit, links=links)
 
     # 결과 병합
     companies = merge_jobplanet_data(companies)
     save_companies(companies, OUTPUT_FILE)
 
 
-def step_wanted(limit: int = None):
+def step_wanted(limit: int = None, workers: int = 1):
     """원티드 크롤링"""
     print("\n=== 원티드 크롤링 ===")
 
@@ -69,15 +97,23 @@ def step_wanted(limit: int = None):
         print("회사 데이터가 없습니다. 먼저 --step parse를 실행하세요.")
         return
 
-    with WantedCrawler(headless=True) as crawler:
-        crawler.crawl_companies(companies, limit=limit)
+    # 연결 테이블로 찾은 회사는 검색 없이 URL로 조회
+    links = linked_urls("wanted")
+
+    if workers > 1:
+        crawler = AsyncWantedCrawler(headless=True, concurrency=workers)
+    else:
+        crawler = WantedCrawler(headless=True)
+
+    with crawler:
+        crawler.crawl_companies(companies, limit=limit, links=links)
 
     # 결과 병합
     companies = merge_wanted_data(companies)
     save_companies(companies, OUTPUT_FILE)
 
 
-def step_geocode(limit: int = None):
+def step_geocode(limit: int = None, workers: int = 1, hedge: bool = False):
     """Geocoding"""
     print("\n=== Geocoding ===")
 
@@ -86,14 +122,40 @@ def step_geocode(limit: int = None):
         print("회사 데이터가 없습니다. 먼저 --step parse를 실행하세요.")
         return
 
-    geocoder = NaverGeocoder()
-    geocoder.geocode_companies(companies, limit=limit)
+    # 원티드 > 잡플래닛 > 병무청 주소로 변환 (주소가 바뀐 회사는 다시 변환)
+    companies = update_address_priority(companies)
+    engine = GeocodeEngine(
+        workers=workers if workers > 1 else GEOCODE_WORKERS,
+        hedge=hedge or GEOCODE_HEDGE,
+    )
+    engine.geocode_companies(companies, limit=limit)
 
     # 결과 병합
     companies = merge_geocode_data(companies)
     save_companies(companies, OUTPUT_FILE)
 
 
+def step_link(link_file: str = None, platform: str = None):
+    """병무청 회사 ↔ 잡플래닛/원티드 회사 일괄 연결 (목록 파일이 없으면 회사 인덱스 사용)"""
+    print("\n=== 회사 연결 ===")
+
+    companies = load_companies()
+    if not companies:
+        print("회사 데이터가 없습니다. 먼저 --step parse를 실행하세요.")
+        return
+
+    platforms = [platform] if platform else list(PLATFORM_URLS)
+    for name in platforms:
+        if link_file:
+            records = read_records(link_file, name)
+        else:
+            records = CompanyIndex.open(name).records()
+        if not records:
+            print(f"연결({name}): 비교할 회사 없음")
+            continue
+        link_platform(companies, name, records)
+
+
 def step_merge():
     """모든 데이터 병합"""
     print("\n=== 데이터 병합 ===")
@@ -107,13 +169,54 @@ def step_merge():
     save_companies(companies, OUTPUT_FILE)
 
 
-def step_all(limit: int = None):
+def step_reparse():
+    """보관된 원본으로 잡플래닛/원티드 데이터 다시 추출 후 병합"""
+    print("\n=== 원본 재파싱 ===")
+
+    parsers = {
+        "jobplanet": parse_archived_pages,
+        "wanted": WantedCrawler().parse_archived_pages,
+    }
+    for source, parse in parsers.items():
+        stats = reparse_source(source, parse)
+        print(
+            f"  {source}: 추출 {stats['parsed']}개 (변경 {stats['changed']}), "
+            f"추출 실패 {stats['empty']}, 에러 {stats['error']} ({stats['seconds']:.1f}초)"
+        )
+
+    step_merge()
+
+
+def step_import():
+    """기존 JSON 파일 → SQLite 가져오기"""
+    print("\n=== SQLite 가져오기 ===")
+
+    store = SqliteStore.open()
+    imported = store.import_json()
+    for name, count in imported.items():
+        print(f"  {name}: {count}개")
+    print(f"[완료] {store.db_path}")
+
+
+def step_export():
+    """SQLite → companies.json 내보내기 (map.html용)"""
+    print("\n=== companies.json 내보내기 ===")
+
+    count = SqliteStore.open().export_json(OUTPUT_FILE)
+    print(f"[완료] {OUTPUT_FILE} ({count}개 회사)")
+
+
+def step_all(limit: int = None, workers: int = 1, http: bool = False):
     """전체 파이프라인 실행"""
-    step_download()
-    step_parse()
-    step_jobplanet(limit)
-    step_wanted(limit)
-    step_geocode(limit)
+    # 병무청 목록이 그대로면 파싱(회사 목록 다시 만들기)은 생략
+    if step_download() or not OUTPUT_FILE.exists():
+        step_parse()
+    else:
+        print("병무청 목록 변경 없음 - 파싱 생략")
+    step_link()
+    step_jobplanet(limit, workers, http)
+    step_wanted(limit, workers)
+    step_geocode(limit, workers)
     step_merge()
 
 
@@ -125,16 +228,23 @@ def main():
 
     parser.add_argument(
         "--step",
-        choices=["all", "download", "parse", "jobplanet", "wanted", "geocode", "merge"],
+        choices=[
+            "all", "download", "parse", "link", "jobplanet", "wanted", "geocode", "merge",
+            "reparse", "import", "export",
+        ],
         default="all",
         help="""실행할 단계:
   all       - 전체 파이프라인 (기본값)
   download  - 병무청 엑셀 다운로드
   parse     - 엑셀 → JSON 변환
+  link      - 병무청 회사 ↔ 잡플래닛/원티드 회사 일괄 연결 (data/links.csv)
   jobplanet - 잡플래닛 크롤링
   wanted    - 원티드 크롤링
   geocode   - 주소 → 좌표 변환
-  merge     - 모든 데이터 통합""",
+  merge     - 모든 데이터 통합
+  reparse   - 보관된 원본(data/raw/)으로 잡플래닛/원티드 데이터 다시 추출 후 병합
+  import    - 기존 JSON 파일 → SQLite (STORAGE_BACKEND=sqlite 용)
+  export    - SQLite → companies.json (map.html 용)""",
     )
 
     parser.add_argument(
@@ -144,6 +254,56 @@ def main():
         help="처리할 회사 수 제한 (테스트용)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="동시 처리 수 (잡플래닛: 브라우저 수, 원티드: 2 이상이면 비동기 모드,\n"
+        "geocode: 동시 변환 회사 수, 1이면 GEOCODE_WORKERS)",
+    )
+
+    parser.add_argument(
+        "--link-file",
+        default=None,
+        metavar="경로",
+        help="link: 플랫폼 회사 목록 CSV/JSON (name, url 또는 id, address, phone, founded_year)\n"
+        "없으면 검색 중 모은 회사 인덱스(data/company_index.db)와 연결",
+    )
+
+    parser.add_argument(
+        "--platform",
+        choices=list(PLATFORM_URLS),
+        default=None,
+        help="link: 연결할 플랫폼 (--link-file을 쓰면 필수, 없으면 둘 다)",
+    )
+
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="잡플래닛 페이지를 브라우저 대신 HTTP로 조회 (파싱 실패 시 브라우저)",
+    )
+
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="geocode: 네이버 응답이 평소보다 늦으면 카카오에도 동시 요청",
+    )
+
+    parser.add_argument(
+        "--rate",
+        action="append",
+        default=[],
+        metavar="이름=시작[:최대]",
+        help="호스트별 초당 요청 수 재정의 (jobplanet, wanted, naver, kakao)\n"
+        "예: --rate naver=8:10 --rate jobplanet=0.5",
+    )
+
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="원티드/네이버/카카오 API를 호출하지 않고 HTTP 캐시만 사용",
+    )
+
     parser.add_argument(
         "--no-headless",
         action="store_true",
@@ -151,25 +311,43 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.link_file and not args.platform:
+        parser.error("--link-file에는 --platform이 필요합니다")
+    if args.offline:
+        set_offline(True)
+    for spec in args.rate:
+        name, _, rate = spec.partition("=")
+        try:
+            set_rate_override(name, *parse_rate_spec(rate))
+        except ValueError:
+            parser.error(f"--rate 형식 오류: {spec}")
 
     print("=" * 50)
     print("병역지정업체 데이터 수집")
     print("=" * 50)
 
     if args.step == "all":
-        step_all(args.limit)
+        step_all(args.limit, args.workers, args.http)
     elif args.step == "download":
         step_download()
     elif args.step == "parse":
         step_parse()
+    elif args.step == "link":
+        step_link(args.link_file, args.platform)
     elif args.step == "jobplanet":
-        step_jobplanet(args.limit)
+        step_jobplanet(args.limit, args.workers, args.http)
     elif args.step == "wanted":
-        step_wanted(args.limit)
+        step_wanted(args.limit, args.workers)
     elif args.step == "geocode":
-        step_geocode(args.limit)
+        step_geocode(args.limit, args.workers, args.hedge)
     elif args.step == "merge":
         step_merge()
+    elif args.step == "reparse":
+        step_reparse()
+    elif args.step == "import":
+        step_import()
+    elif args.step == "export":
+        step_export()
 
     print("\n" + "=" * 50)
     print("완료!")
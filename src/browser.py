@@ -0,0 +1,214 @@
+"""브라우저(Selenium) 공통 모듈 - 가벼운 Chrome 프로필, 주기적 재시작, 성능 측정"""
+import os
+import time
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from src.config import BROWSER_WINDOW_SIZE
+from src.ratelimit import AdaptiveRateLimiter
+
+
+# 리소스 종류별 확장자
+RESOURCE_EXTENSIONS = {
+    "image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif"],
+    "media": ["mp4", "webm", "mp3", "m4a", "ogg", "wav"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "stylesheet": ["css"],
+}
+# 리소스 종류별 차단 URL 패턴 (Network.setBlockedURLs는 URL 전체와 비교하므로 쿼리 문자열이 붙은
+# "a.png?v=3"도 막도록 확장자 뒤 "?"/"#" 패턴 추가, "*.ico*"처럼 쓰면 "a.icons.js"까지 막힘)
+RESOURCE_PATTERNS = {
+    resource: [f"*.{ext}{suffix}" for ext in extensions for suffix in ("", "?*", "#*")]
+    for resource, extensions in RESOURCE_EXTENSIONS.items()
+}
+
+# 데이터 추출과 무관한 분석/광고 호스트
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*analytics.tiktok.com*",
+    "*hotjar.com*",
+    "*criteo.com*",
+    "*clarity.ms*",
+    "*amplitude.com*",
+]
+
+
+def create_chrome(
+    headless: bool = True,
+    allow: tuple = (),
+    user_agent: Optional[str] = None,
+) -> webdriver.Chrome:
+    """
+    가벼운 Chrome 드라이버 생성
+
+    allow에 없는 리소스 종류(image, media, font, stylesheet)와
+    분석/광고 호스트 요청은 차단합니다.
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument(f"--window-size={BROWSER_WINDOW_SIZE}")
+    if user_agent:
+        options.add_argument(f"user-agent={user_agent}")
+    if "image" not in allow:
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.implicitly_wait(5)
+
+    blocked = list(TRACKER_PATTERNS)
+    for resource, patterns in RESOURCE_PATTERNS.items():
+        if resource not in allow:
+            blocked.extend(patterns)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+    except Exception as e:
+        print(f"  [경고] 리소스 차단 설정 실패: {e}")
+
+    return driver
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """pid와 모든 하위 프로세스의 RSS 합계 (MB, Linux /proc 기준)"""
+    if not os.path.isdir("/proc"):
+        return None
+
+    children: dict[int, list[int]] = {}
+    rss_kb: dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status", "r") as f:
+                ppid, rss = None, 0
+                for line in f:
+                    if line.startswith("PPid:"):
+                        ppid = int(line.split()[1])
+                    elif line.startswith("VmRSS:"):
+                        rss = int(line.split()[1])
+        except (OSError, ValueError):
+            continue
+        rss_kb[int(entry)] = rss
+        if ppid is not None:
+            children.setdefault(ppid, []).append(int(entry))
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += rss_kb.get(current, 0)
+        stack.extend(children.get(current, []))
+    return total / 1024
+
+
+class ManagedDriver:
+    """
+    WebDriver 래퍼
+
+    get()마다 페이지 로드 시간을 기록하고 (limiter가 있으면 속도 조절에도 반영),
+    recycle_every 페이지마다 브라우저를 새로 띄워 Chrome 메모리 증가를 제한합니다
+    (쿠키는 새 브라우저로 옮김). 그 외 속성/메서드는 실제 WebDriver로 그대로 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome],
+        recycle_every: int = 0,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        self._factory = factory
+        self.recycle_every = recycle_every
+        self.limiter = limiter
+        self.driver = factory()
+        self.pages_since_start = 0
+        self.load_times: list[float] = []
+        self.recycles = 0
+        self.peak_rss_mb: Optional[float] = None
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def get(self, url: str):
+        """페이지 이동 (필요하면 먼저 브라우저 재시작)"""
+        if self.recycle_every and self.pages_since_start >= self.recycle_every:
+            self.recycle()
+
+        started = time.perf_counter()
+        try:
+            self.driver.get(url)
+        except Exception:
+            if self.limiter:
+                self.limiter.record(time.perf_counter() - started, error=True)
+            raise
+        elapsed = time.perf_counter() - started
+        self.load_times.append(elapsed)
+        self.pages_since_start += 1
+        if self.limiter:
+            self.limiter.record(elapsed)
+
+    def recycle(self):
+        """브라우저 재시작 (현재 도메인 쿠키 유지)"""
+        self._sample_rss()
+        current_url = self.driver.current_url
+        cookies = self.driver.get_cookies()
+        self.driver.quit()
+
+        self.driver = self._factory()
+        self.pages_since_start = 0
+        self.recycles += 1
+
+        parsed = urlparse(current_url)
+        if cookies and parsed.scheme.startswith("http"):
+            # 쿠키는 같은 도메인 페이지에서만 추가 가능
+            self.driver.get(f"{parsed.scheme}://{parsed.netloc}")
+            for cookie in cookies:
+                cookie = {k: v for k, v in cookie.items() if k != "sameSite"}
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    pass
+
+    def rss_mb(self) -> Optional[float]:
+        """현재 브라우저(chromedriver + Chrome) 메모리 사용량"""
+        try:
+            return process_tree_rss_mb(self.driver.service.process.pid)
+        except Exception:
+            return None
+
+    def _sample_rss(self) -> Optional[float]:
+        rss = self.rss_mb()
+        if rss is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0, rss)
+        return rss
+
+    def report(self) -> str:
+        """페이지 로드 시간/메모리 요약"""
+        rss = self._sample_rss()
+        parts = []
+        if self.load_times:
+            avg_ms = sum(self.load_times) / len(self.load_times) * 1000
+            parts.append(f"페이지 로드 평균 {avg_ms:.0f}ms ({len(self.load_times)}회)")
+        if rss is not None:
+            parts.append(f"브라우저 메모리 {rss:.0f}MB (최대 {self.peak_rss_mb:.0f}MB)")
+        if self.recycles:
+            parts.append(f"재시작 {self.recycles}회")
+        return ", ".join(parts) if parts else "브라우저 사용 없음"
+
+    def quit(self):
+        self.driver.quit()
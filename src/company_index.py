@@ -0,0 +1,242 @@
+"""플랫폼 회사 인덱스 모듈 - 검색 결과에서 본 회사를 모아 검색 없이 URL 찾기"""
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.config import COMPANY_INDEX_PATH, COMPANY_INDEX_SCORE
+from src.utils import CandidateRanker, name_matcher, name_ngrams
+
+# 점수를 매길 후보 수 (공유 bigram이 많은 순)
+LOOKUP_CANDIDATES = 20
+
+
+class CompanyIndex:
+    """
+    검색 결과 페이지에 나온 플랫폼 회사 (회사명 → URL) 인덱스 (SQLite)
+
+    검색한 회사 외에 결과 페이지의 다른 회사도 모두 기록해 두고, 다음 회사를 검색하기 전에
+    정규화 회사명의 문자 bigram 역색인으로 먼저 찾습니다. CandidateRanker 점수가
+    COMPANY_INDEX_SCORE 이상인 후보가 하나뿐일 때만 사용합니다 (같은 이름 회사가 여럿이면 검색).
+    정규화 회사명이 같은 회사는 bigram 순위와 관계없이 모두 후보에 넣습니다.
+
+    company_index:
+        platform      TEXT ("wanted" | "jobplanet")
+        url           TEXT (회사 페이지 URL)
+        name          TEXT (플랫폼 표기 회사명)
+        key           TEXT (정규화 회사명, 소문자)
+        region        TEXT (후보에 있으면 주소/지역)
+        founded_year  INTEGER
+        seen_at       ISO 시각
+    company_grams:
+        platform, gram (정규화 회사명 bigram), url
+    """
+
+    _instances: dict = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, platform: str, db_path: Path = COMPANY_INDEX_PATH):
+        self.platform = platform
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self.stats = {"hit": 0, "ambiguous": 0, "miss": 0, "added": 0}
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS company_index (
+                    platform TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    region TEXT,
+                    founded_year INTEGER,
+                    seen_at TEXT NOT NULL,
+                    PRIMARY KEY (platform, url)
+                )
+                """
+            )
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS company_grams (
+                    platform TEXT NOT NULL,
+                    gram TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (platform, gram, url)
+                )
+                """
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_company_grams_url ON company_grams (platform, url)"
+            )
+            self._add_key_column()
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_company_index_key ON company_index (platform, key)"
+            )
+
+    def _add_key_column(self):
+        """key 컬럼이 없던 인덱스 파일이면 추가하고 기존 회사명으로 채움"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(company_index)")]
+        if "key" in columns:
+            return
+        self.conn.execute("ALTER TABLE company_index ADD COLUMN key TEXT")
+        rows = self.conn.execute("SELECT platform, url, name FROM company_index").fetchall()
+        self.conn.executemany(
+            "UPDATE company_index SET key = ? WHERE platform = ? AND url = ?",
+            [(name_matcher.normalized(name).lower, platform, url) for platform, url, name in rows],
+        )
+
+    @classmethod
+    def open(cls, platform: str, db_path: Path = COMPANY_INDEX_PATH) -> "CompanyIndex":
+        """플랫폼별로 하나의 인덱스를 공유 (워커 간)"""
+        key = (platform, str(Path(db_path).resolve()))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(platform, db_path)
+            return cls._instances[key]
+
+    def _count(self, name: str, n: int = 1):
+        with self.lock:
+            self.stats[name] += n
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM company_index WHERE platform = ?", (self.platform,)
+            ).fetchone()[0]
+
+    def records(self) -> list[dict]:
+        """기록된 회사 전체 {name, url, region, foundedYear} (연결 테이블 생성용)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT name, url, region, founded_year FROM company_index WHERE platform = ?",
+                (self.platform,),
+            ).fetchall()
+        return [
+            {"name": name, "url": url, "region": region, "foundedYear": founded_year}
+            for name, url, region, founded_year in rows
+        ]
+
+    def add(self, entries: list[dict]) -> int:
+        """
+        검색 결과 후보 기록 (entries: {name, url, region?, foundedYear?} 목록, 새로 추가한 수 반환)
+
+        이름이 같은 기존 항목은 그대로 두고, 새 회사나 이름이 바뀐 회사만 bigram을 다시 씁니다.
+        """
+        by_url = {}
+        for entry in entries:
+            if entry.get("url") and name_matcher.korean(entry.get("name")):
+                by_url.setdefault(entry["url"], entry)  # 같은 URL은 첫 번째 표기
+        if not by_url:
+            return 0
+
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            known = dict(
+                self.conn.execute(
+                    f"SELECT url, name FROM company_index WHERE platform = ? "
+                    f"AND url IN ({','.join('?' * len(by_url))})",
+                    (self.platform, *by_url),
+                ).fetchall()
+            )
+            changed = [e for url, e in by_url.items() if known.get(url) != e["name"]]
+            for entry in changed:
+                url = entry["url"]
+                self.conn.execute(
+                    """
+                    INSERT INTO company_index
+                        (platform, url, name, key, region, founded_year, seen_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(platform, url) DO UPDATE SET
+                        name = excluded.name, key = excluded.key, region = excluded.region,
+                        founded_year = excluded.founded_year, seen_at = excluded.seen_at
+                    """,
+                    (
+                        self.platform, url, entry["name"], name_matcher.normalized(entry["name"]).lower,
+                        entry.get("region"), entry.get("foundedYear"), now,
+                    ),
+                )
+                self.conn.execute(
+                    "DELETE FROM company_grams WHERE platform = ? AND url = ?", (self.platform, url)
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO company_grams (platform, gram, url) VALUES (?, ?, ?)",
+                    [
+                        (self.platform, gram, url)
+                        for gram in name_ngrams(name_matcher.korean(entry["name"]))
+                    ],
+                )
+        added = sum(1 for url in by_url if url not in known)
+        self._count("added", added)
+        return added
+
+    def _candidates(self, key: str, grams: frozenset) -> tuple[list[tuple], bool]:
+        """
+        (url, name, region, founded_year) 후보 목록과, 잘린 후보 중 확실한 회사가 있을 수 있는지
+
+        정규화 회사명이 key와 같은 회사는 모두, 나머지는 공유 bigram이 많은 순으로
+        LOOKUP_CANDIDATES개까지. 검색어 bigram을 모두 가진 회사가 잘렸으면 (짧은 이름이
+        긴 이름 여럿에 포함될 때) 어느 쪽인지 확신할 수 없으므로 두 번째 값이 True입니다.
+        """
+        with self.lock:
+            exact = {
+                url for (url,) in self.conn.execute(
+                    "SELECT url FROM company_index WHERE platform = ? AND key = ?",
+                    (self.platform, key),
+                )
+            }
+            shared = Counter(
+                url for (url,) in self.conn.execute(
+                    f"SELECT url FROM company_grams WHERE platform = ? "
+                    f"AND gram IN ({','.join('?' * len(grams))})",
+                    (self.platform, *grams),
+                )
+                if url not in exact
+            )
+            ranked = shared.most_common()
+            top = [url for url, _ in ranked[:LOOKUP_CANDIDATES]]
+            truncated = len(ranked) > LOOKUP_CANDIDATES and ranked[LOOKUP_CANDIDATES][1] >= len(grams)
+            urls = [*exact, *top]
+            if not urls:
+                return [], truncated
+            rows = self.conn.execute(
+                f"SELECT url, name, region, founded_year FROM company_index "
+                f"WHERE platform = ? AND url IN ({','.join('?' * len(urls))})",
+                (self.platform, *urls),
+            ).fetchall()
+        return rows, truncated
+
+    def lookup(
+        self, ranker: CandidateRanker, min_score: float = COMPANY_INDEX_SCORE
+    ) -> Optional[dict]:
+        """ranker의 회사와 확실히 같은 회사 {name, url, region, foundedYear, score} (없거나 여럿이면 None)"""
+        if not ranker.grams:
+            return None
+
+        candidates, truncated = self._candidates(ranker.query.lower, ranker.grams)
+        confident = []
+        for url, name, region, founded_year in candidates:
+            score = ranker.score(name, region=region, founded_year=founded_year)
+            if score >= min_score:
+                confident.append(
+                    {"name": name, "url": url, "region": region,
+                     "foundedYear": founded_year, "score": score}
+                )
+
+        if len(confident) == 1 and not truncated:
+            self._count("hit")
+            return confident[0]
+        self._count("ambiguous" if confident else "miss")
+        return None
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"회사 인덱스({self.platform}): {len(self):,}개 회사 (이번 실행 추가 {s['added']}), "
+            f"검색 생략 {s['hit']}회 (같은 이름 여럿 {s['ambiguous']}, 없음 {s['miss']})"
+        )
@@ -19,27 +19,141 @@ for d in [DATA_DIR, RAW_DIR, PROGRESS_DIR]:
 # 병무청 설정
 MMA_DOWNLOAD_URL = "https://work.mma.go.kr/caisBYIS/search/downloadBYJJEopCheExcel.do"
 MMA_EXCEL_PATH = DATA_DIR / "all_companies.xls"  # 기존 위치 유지
+MMA_PARTS_DIR = DATA_DIR / "mma_parts"  # 시/도별 나눠 받은 엑셀
+MMA_MANIFEST_PATH = DATA_DIR / "mma_download.json"  # 받은 파일 해시/시각
+MMA_REFRESH_HOURS = float(os.getenv("MMA_REFRESH_HOURS", "24"))  # 이 시간 안에 받았으면 다시 받지 않음
+MMA_DOWNLOAD_PARTITIONED = os.getenv("MMA_DOWNLOAD_PARTITIONED", "0") == "1"  # 시/도별로 나눠 받기
+MMA_DOWNLOAD_WORKERS = int(os.getenv("MMA_DOWNLOAD_WORKERS", "4"))
+MMA_DOWNLOAD_TIMEOUT = float(os.getenv("MMA_DOWNLOAD_TIMEOUT", "120"))  # 초 (응답 조각 사이 최대 대기)
+MMA_SNAPSHOT_DIR = DATA_DIR / "mma_snapshots"  # 파싱할 때마다 남기는 회사 목록 스냅샷
+MMA_SNAPSHOT_KEEP = int(os.getenv("MMA_SNAPSHOT_KEEP", "10"))  # 최근 N개만 보관
+MMA_CHANGES_PATH = DATA_DIR / "mma_changes.json"  # 스냅샷 간 변경 내역 (재수집 대상)
+
+# 브라우저(Selenium) 설정
+BROWSER_WINDOW_SIZE = "1280,800"
+BROWSER_RECYCLE_PAGES = int(os.getenv("BROWSER_RECYCLE_PAGES", "200"))  # N페이지마다 재시작 (0이면 안 함)
 
 # 잡플래닛 설정
 JOBPLANET_EMAIL = os.getenv("JOBPLANET_EMAIL", "")
 JOBPLANET_PASSWORD = os.getenv("JOBPLANET_PASSWORD", "")
-JOBPLANET_RATE_LIMIT = 3.0  # 초
+JOBPLANET_RATE_LIMIT = 3.0  # 초 (시작 요청 간격, RATE_LIMITS 참고)
+JOBPLANET_SESSION_PATH = DATA_DIR / "jobplanet_session.json"  # 로그인 쿠키 저장
+JOBPLANET_SESSION_TTL_HOURS = 12  # 저장된 로그인 쿠키 최대 사용 시간
 
 # 원티드 설정
-WANTED_RATE_LIMIT = 2.0  # 초
+WANTED_REQUESTS_PER_SECOND = 5.0  # API 초당 요청 수 (시작값)
+WANTED_CONCURRENCY = 8  # 비동기 모드 동시 처리 회사 수
 
 # 네이버 Geocoding API 설정
 NAVER_CLIENT_ID = os.getenv("NAVER_GEOCODING_API_KEY_ID", "")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_GEOCODING_API_KEY", "")
 NAVER_GEOCODE_URL = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-NAVER_RATE_LIMIT = 0.1  # 초 (초당 10회)
+NAVER_RATE_LIMIT = 0.1  # 초 (시작 요청 간격, 초당 10회)
 
 # 카카오 로컬 API 설정 (회사명으로 주소 검색)
 KAKAO_API_KEY = os.getenv("KAKAO_API_KEY", "")
+KAKAO_RATE_LIMIT = 0.1  # 초 (시작 요청 간격)
+
+# 호스트별 요청 속도 (초당 요청 수: 시작값, 최대값)
+# 응답이 정상이고 빠르면 조금씩 올리고, 429/5xx나 응답 지연이 늘면 절반으로 줄임
+# .env의 {이름}_RATE=시작[:최대] (예: NAVER_RATE=8:10) 또는 run.py --rate로 재정의
+RATE_LIMITS = {
+    "jobplanet": (1 / JOBPLANET_RATE_LIMIT, 1.0),
+    "wanted": (WANTED_REQUESTS_PER_SECOND, 10.0),
+    "naver": (1 / NAVER_RATE_LIMIT, 10.0),  # 네이버 Geocoding 초당 10회 제한
+    "kakao": (1 / KAKAO_RATE_LIMIT, 20.0),
+    "mma": (2.0, 4.0),  # 병무청 엑셀 다운로드 (시/도별)
+}
+
+# 프로세스 간 요청 속도/일일 한도 공유 (여러 단계를 동시에 실행해도 합산 속도 유지)
+RATE_SHARED = os.getenv("RATE_SHARED", "1") == "1"
+RATE_LEDGER_PATH = DATA_DIR / "ratelimit.db"
+# 일일 요청 한도 (0이면 제한 없음) - 소진되면 남은 회사는 실패 처리 없이 다음 실행으로 미룸
+DAILY_QUOTAS = {
+    "naver": int(os.getenv("NAVER_DAILY_QUOTA", "100000")),
+    "kakao": int(os.getenv("KAKAO_DAILY_QUOTA", "100000")),
+    "wanted": int(os.getenv("WANTED_DAILY_QUOTA", "0")),
+}
 
 # 재시도 설정
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2.0  # exponential backoff 배수
+RETRY_BASE_DELAY = 1.0  # 첫 재시도 최대 대기 (초), 이후 RETRY_BACKOFF배씩 증가 (0~최대 사이 무작위)
+RETRY_MAX_DELAY = 30.0  # 재시도 대기 상한 (초, Retry-After가 더 길면 그만큼 대기)
+# 회사 하나에 쓰는 최대 시간 (초) - 넘으면 실패로 기록하고 다음 회사로 (다음 실행에서 재시도)
+COMPANY_DEADLINES = {
+    "jobplanet": float(os.getenv("JOBPLANET_DEADLINE", "180")),
+    "wanted": float(os.getenv("WANTED_DEADLINE", "60")),
+    "geocode": float(os.getenv("GEOCODE_DEADLINE", "45")),
+    "kakao": float(os.getenv("KAKAO_DEADLINE", "30")),
+    "default": 60.0,
+}
+
+# 진행상황 저장 방식 ("journal": append-only 로그 + 스냅샷, "json": 매번 전체 저장)
+PROGRESS_BACKEND = os.getenv("PROGRESS_BACKEND", "journal")
+PROGRESS_JOURNAL_COMPACT_THRESHOLD = 1000  # journal 줄 수가 넘으면 스냅샷으로 압축 (최소값)
+
+# 저장소 ("json": companies.json + 진행상황 파일, "sqlite": 회사/진행상황을 하나의 DB에 저장)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json")
+SQLITE_PATH = DATA_DIR / "byjjec.db"
+
+# 재수집 주기 (일) - 수집한 지 이보다 오래된 결과만 다시 수집
+# 채용 여부는 자주 바뀌고, 평점/연봉/좌표는 거의 바뀌지 않음
+REFRESH_TTL_DAYS = {
+    "jobplanet": float(os.getenv("JOBPLANET_TTL_DAYS", "90")),
+    "wanted": float(os.getenv("WANTED_TTL_DAYS", "1")),
+    "geocode": float(os.getenv("GEOCODE_TTL_DAYS", "365")),
+}
+
+# HTTP 응답 캐시 (원티드/네이버/카카오 API)
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+HTTP_OFFLINE = os.getenv("HTTP_OFFLINE", "") == "1"  # 캐시된 응답만 사용
+HTTP_CACHE_DEFAULT_TTL_HOURS = 24
+# URL 접두사별 캐시 유지 시간 (시간) - 재수집 주기보다 짧게 잡아 재수집 시 새 응답을 받음
+HTTP_CACHE_TTL_HOURS = {
+    "https://www.wanted.co.kr/api/v4/search": 24 * 7,
+    "https://www.wanted.co.kr/api/v4/companies": 20,
+    NAVER_GEOCODE_URL: 24 * 180,
+    "https://dapi.kakao.com/": 24 * 30,
+}
+
+# 검색 결과 캐시 (검색어 → 후보 목록, 플랫폼별)
+SEARCH_CACHE_PATH = DATA_DIR / "search_cache.db"
+SEARCH_CACHE_TTL_DAYS = float(os.getenv("SEARCH_CACHE_TTL_DAYS", "30"))
+SEARCH_CACHE_NEGATIVE_TTL_DAYS = float(os.getenv("SEARCH_CACHE_NEGATIVE_TTL_DAYS", "7"))  # 결과 없음
+
+# 검색 결과 후보 선택 (회사명 n-gram 유사도 + 영문명/지역/설립연도 보너스, 0~1)
+MATCH_ACCEPT_SCORE = float(os.getenv("MATCH_ACCEPT_SCORE", "0.85"))  # 이 점수 이상이면 남은 검색어 생략
+MATCH_MIN_SCORE = float(os.getenv("MATCH_MIN_SCORE", "0.5"))  # 모든 검색어를 시도한 뒤 최고 후보의 최소 점수
+
+# 검색 결과에서 본 플랫폼 회사 인덱스 (회사명 bigram 역색인, 검색 전에 먼저 조회)
+COMPANY_INDEX_PATH = DATA_DIR / "company_index.db"
+COMPANY_INDEX_ENABLED = os.getenv("COMPANY_INDEX", "1") != "0"
+COMPANY_INDEX_SCORE = float(os.getenv("COMPANY_INDEX_SCORE", "0.9"))  # 검색 없이 바로 쓸 최소 점수
+
+# 병무청 회사 ↔ 잡플래닛/원티드 회사 일괄 연결 (--step link, 크롤링에서 검색 대신 사용)
+LINKS_PATH = DATA_DIR / "links.csv"
+LINK_ACCEPT_SCORE = float(os.getenv("LINK_ACCEPT_SCORE", "0.85"))  # 이 점수 이상인 연결만 크롤링에 사용
+LINK_MAX_BLOCK_PAIRS = int(os.getenv("LINK_MAX_BLOCK_PAIRS", "200000"))  # 이보다 큰 블록은 비교 생략
+
+# 주소 → 좌표 캐시 (정규화한 건물 주소 기준, 같은 건물의 회사끼리 공유)
+GEOCODE_CACHE_TTL_DAYS = float(os.getenv("GEOCODE_CACHE_TTL_DAYS", "180"))
+# Geocoding 동시 처리 (네이버 주소 검색 → 못 찾으면 카카오 회사명+지역 검색)
+GEOCODE_WORKERS = int(os.getenv("GEOCODE_WORKERS", "8"))  # 초당 요청 수는 호스트별 limiter가 제한
+GEOCODE_HEDGE = os.getenv("GEOCODE_HEDGE", "") == "1"  # 네이버 응답이 늦으면 카카오에도 동시 요청
+GEOCODE_HEDGE_PERCENTILE = 0.9  # 네이버 응답 시간이 이 분위수를 넘으면 카카오 요청
+GEOCODE_HEDGE_BUDGET = 0.1  # 동시 요청은 전체 회사 수의 이 비율까지만
+# 오프라인 지명 사전 (시/도청 좌표 + 지역 좌표 CSV + 이미 구한 좌표의 접두사별 평균)
+# "fallback": 네이버/카카오로 못 찾으면 사용, "first": 사전 결과가 충분히 정확하면 API 생략, "off"
+GAZETTEER_MODE = os.getenv("GAZETTEER_MODE", "fallback")
+GAZETTEER_FIRST_PRECISION = os.getenv("GAZETTEER_FIRST_PRECISION", "road")  # first 모드 기준
+# 이보다 대략적인 사전 좌표는 쓰지 않음 (기본: 시/도만 아는 회사를 시/도청 한 점에 모으지 않음)
+GAZETTEER_MIN_PRECISION = os.getenv("GAZETTEER_MIN_PRECISION", "sigungu")
+GAZETTEER_PATH = DATA_DIR / "gazetteer.csv"  # address,lat,lng[,precision]
+GAZETTEER_URL = os.getenv("GAZETTEER_URL", "")  # 설정하면 gazetteer.csv가 없을 때 한 번 받음
+
+# 크롤링 원본 보관 (data/raw/, run.py --step reparse로 재크롤링 없이 다시 파싱)
+RAW_ARCHIVE = os.getenv("RAW_ARCHIVE", "1") == "1"
 
 # 출력 파일
 OUTPUT_FILE = DATA_DIR / "companies.json"
@@ -0,0 +1,82 @@
+"""주소 정규화 모듈 - 같은 건물 주소를 하나의 키로"""
+import re
+
+# 시/도 정식 명칭 → 약칭
+SIDO_ALIASES = {
+    "서울특별시": "서울",
+    "서울시": "서울",
+    "부산광역시": "부산",
+    "부산시": "부산",
+    "대구광역시": "대구",
+    "대구시": "대구",
+    "인천광역시": "인천",
+    "인천시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "대전시": "대전",
+    "울산광역시": "울산",
+    "울산시": "울산",
+    "세종특별자치시": "세종",
+    "세종시": "세종",
+    "경기도": "경기",
+    "강원도": "강원",
+    "강원특별자치도": "강원",
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "제주특별자치도": "제주",
+    "제주도": "제주",
+}
+
+_PARENTHESES = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+# 도로명 주소: "...로 123", "...길 12-3" / 지번 주소: "...동 123-4", "...리 산 12"
+# "판교로 256번길", "성서공단로 11길"처럼 띄어 쓴 이면도로 번호는 도로명에 붙임 (번지로 보지 않음)
+_SUB_ROAD = re.compile(r"([가-힣\d]+로)\s+(\d+(?:번길|가길|길))(?![가-힣])")
+_ROAD_NUMBER = re.compile(
+    r"^(.*?[가-힣\d]+(?:로|길))\s*(\d+(?:-\d+)?)(?![\d가]|\s*(?:번길|길)(?![가-힣]))"
+)
+_JIBUN_NUMBER = re.compile(r"^(.*?[가-힣\d]+(?:동|리|가))\s*((?:산\s*)?\d+(?:-\d+)?)(?!\d)")
+# 번지 뒤에 붙는 층/호/동(건물) 정보
+_DETAIL = re.compile(r"(?:지하|B)?\s*\d+\s*층|\d+(?:-\d+)?\s*호|[A-Za-z\d]+\s*동(?=\s|$)")
+
+
+def canonical_address(address: str) -> str:
+    """
+    geocode 캐시 키용 주소 정규화
+
+    - 괄호 내용 제거, 공백 정리, 시/도 약칭 통일
+    - 띄어 쓴 이면도로 번호를 도로명에 붙임 ("판교로 256번길" → "판교로256번길")
+    - 도로명/지번 번호 뒤의 건물명, 층, 호수 제거
+
+    >>> canonical_address("경기도 성남시 분당구 판교로 256번길 25 3층")
+    '경기 성남시 분당구 판교로256번길 25'
+    >>> canonical_address("대구광역시 달서구 성서공단로 11길 62")
+    '대구 달서구 성서공단로11길 62'
+    >>> canonical_address("경기 성남시 분당구 판교로256번길 25")
+    '경기 성남시 분당구 판교로256번길 25'
+    >>> canonical_address("서울특별시 강남구 테헤란로 123, 4층 (역삼동)")
+    '서울 강남구 테헤란로 123'
+    >>> canonical_address("서울 종로구 세종대로 12가길 5 2층")
+    '서울 종로구 세종대로12가길 5'
+    """
+    if not address:
+        return ""
+
+    text = _PARENTHESES.sub(" ", address)
+    tokens = text.replace(",", " ").split()
+    if not tokens:
+        return ""
+    tokens[0] = SIDO_ALIASES.get(tokens[0], tokens[0])
+    text = _SUB_ROAD.sub(r"\1\2", " ".join(tokens))
+
+    for pattern in (_ROAD_NUMBER, _JIBUN_NUMBER):
+        match = pattern.match(text)
+        if match:
+            return f"{match.group(1)} {' '.join(match.group(2).split())}"
+
+    # 번호를 못 찾으면 층/호수만 제거
+    return " ".join(_DETAIL.sub(" ", text).split())
@@ -0,0 +1,349 @@
+"""Geocoding 엔진 - 네이버 → 카카오 순서로 여러 회사를 동시에 변환"""
+import contextvars
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Optional
+
+from src.config import (
+    NAVER_CLIENT_ID,
+    NAVER_CLIENT_SECRET,
+    KAKAO_API_KEY,
+    GEOCODE_WORKERS,
+    GEOCODE_HEDGE,
+    GEOCODE_HEDGE_PERCENTILE,
+    GEOCODE_HEDGE_BUDGET,
+    GAZETTEER_MODE,
+    GAZETTEER_FIRST_PRECISION,
+    GAZETTEER_MIN_PRECISION,
+)
+from src.geocoding.address import canonical_address
+from src.geocoding.gazetteer import PRECISIONS, Gazetteer, is_more_precise, is_usable_coords
+from src.geocoding.kakao import KakaoLocalSearch
+from src.geocoding.naver import NaverGeocoder
+from src.pipeline.scheduler import RefreshScheduler
+from src.ratelimit import QuotaExceeded
+from src.retry import LatencyStats
+
+# 한도 소진으로 처리하지 않은 회사
+DEFERRED = object()
+
+
+class GeocodeEngine:
+    """
+    여러 회사 좌표 변환
+
+    - 회사마다 네이버(주소)로 먼저 찾고, 못 찾으면 카카오(회사명 + 시/도)로 찾습니다.
+    - workers개 회사를 동시에 처리하고, 초당 요청 수는 호스트별 limiter가 제한합니다.
+    - hedge가 켜져 있으면 네이버 응답이 최근 응답 시간의 GEOCODE_HEDGE_PERCENTILE
+      분위수보다 늦을 때 카카오에도 요청을 보내 먼저 찾은 결과를 씁니다
+      (전체 회사 수의 GEOCODE_HEDGE_BUDGET 비율까지만).
+    - 오프라인 지명 사전(gazetteer)은 mode에 따라 API 전에("first", 사전 결과가
+      GAZETTEER_FIRST_PRECISION 이상으로 정확할 때) 또는 API로 못 찾은 뒤에("fallback") 씁니다.
+      GAZETTEER_MIN_PRECISION(기본 sigungu)보다 대략적인 사전 좌표는 쓰지 않습니다.
+      네이버 API 키가 없으면 카카오/사전만 사용합니다.
+    - 결과에는 좌표를 찾은 provider("naver" | "kakao" | "gazetteer")와
+      precision("building" | "road" | "dong" | "sigungu" | "sido")을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        naver: Optional[NaverGeocoder] = None,
+        kakao=None,
+        workers: int = GEOCODE_WORKERS,
+        hedge: bool = GEOCODE_HEDGE,
+        gazetteer_mode: str = GAZETTEER_MODE,
+    ):
+        self.naver = naver or NaverGeocoder()
+        self.use_naver = bool(NAVER_CLIENT_ID and NAVER_CLIENT_SECRET)
+        # kakao=None이면 API 키가 있을 때만 사용, False면 네이버만 사용
+        if kakao is None and KAKAO_API_KEY:
+            kakao = KakaoLocalSearch(KAKAO_API_KEY)
+        self.kakao = kakao or None
+        self.workers = max(1, workers)
+        self.hedge = hedge and self.kakao is not None and self.use_naver
+        self.gazetteer_mode = gazetteer_mode
+        self.gazetteer: Optional[Gazetteer] = None
+        self.progress = self.naver.progress
+        self.latency = LatencyStats("geocode")
+        self.stats = {
+            "naver": 0, "kakao": 0, "gazetteer": 0, "miss": 0, "hedged": 0, "hedge_won": 0,
+        }
+        self.stats_lock = threading.Lock()
+        self.hedge_limit = 0
+        self._stop = threading.Event()
+        # 회사 하나 안에서 네이버/카카오 요청을 동시에 보내기 위한 풀
+        self._requests: Optional[ThreadPoolExecutor] = None
+
+    def _count(self, name: str):
+        with self.stats_lock:
+            self.stats[name] += 1
+
+    def _submit(self, fn, *args):
+        """요청 풀에 제출 (회사별 제한 시간이 요청 스레드에도 적용되도록 context 복사)"""
+        return self._requests.submit(contextvars.copy_context().run, fn, *args)
+
+    def _naver(self, address: str) -> Optional[dict]:
+        coords = self.naver.geocode(address)
+        if not coords:
+            return None
+        return {"lat": coords[0], "lng": coords[1], "provider": "naver", "precision": "building"}
+
+    def _kakao(self, company) -> Optional[dict]:
+        """회사명 + 시/도로 검색 (시/군/구를 알면 결과 주소에 포함된 경우만 사용)"""
+        place = self.kakao.search_company(company.name, company.sido)
+        if not place or not place.get("lat"):
+            return None
+        if company.sigungu and company.sigungu not in (place.get("address") or ""):
+            return None
+        return {
+            "lat": place["lat"],
+            "lng": place["lng"],
+            "provider": "kakao",
+            "precision": "building",
+            "place": place.get("place_name"),
+        }
+
+    def _local(self, company) -> Optional[dict]:
+        """지명 사전 조회 (주소가 없으면 시/도 + 시/군/구)"""
+        address = company.address or " ".join(filter(None, (company.sido, company.sigungu)))
+        found = self.gazetteer.lookup(address) if address else None
+        if not found or not is_more_precise(found["precision"], GAZETTEER_MIN_PRECISION):
+            return None
+        return {
+            "lat": found["lat"],
+            "lng": found["lng"],
+            "provider": "gazetteer",
+            "precision": found["precision"],
+        }
+
+    def _hedge_delay(self) -> Optional[float]:
+        """카카오 동시 요청을 보낼 네이버 대기 시간 (보내지 않으면 None)"""
+        if not self.hedge:
+            return None
+        with self.stats_lock:
+            if self.stats["hedged"] >= self.hedge_limit:
+                return None
+        return self.naver.session.limiter.latency_percentile(GEOCODE_HEDGE_PERCENTILE)
+
+    def _take_hedge(self) -> bool:
+        """동시 요청 1회 사용 (한도를 다 썼으면 False)"""
+        with self.stats_lock:
+            if self.stats["hedged"] >= self.hedge_limit:
+                return False
+            self.stats["hedged"] += 1
+            return True
+
+    def _geocode_one(self, company) -> Optional[dict]:
+        """회사 하나 변환: (사전) → 네이버 → (느리면 동시에) 카카오 → (사전)"""
+        if self._stop.is_set():
+            return DEFERRED
+
+        local = self._local(company) if self.gazetteer else None
+        if local and self.gazetteer_mode == "first":
+            if is_more_precise(local["precision"], GAZETTEER_FIRST_PRECISION):
+                return local
+
+        with self.latency.company():
+            result = self._geocode_remote(company)
+        return result or local
+
+    def _geocode_remote(self, company) -> Optional[dict]:
+        """네이버 → (느리면 동시에) 카카오"""
+        futures = {}
+        if company.address and self.use_naver:
+            futures["naver"] = self._submit(self._naver, company.address)
+
+        delay = self._hedge_delay() if futures else None
+        if delay is not None:
+            done, _ = wait(list(futures.values()), timeout=delay)
+            if not done and self._take_hedge():
+                futures["kakao"] = self._submit(self._kakao, company)
+
+        # 먼저 좌표를 찾은 쪽 사용
+        for future in as_completed(list(futures.values())):
+            result = future.result()
+            if result:
+                if "kakao" in futures and result["provider"] == "kakao":
+                    self._count("hedge_won")
+                return result
+
+        # 네이버에서 못 찾으면 카카오로
+        if self.kakao and "kakao" not in futures:
+            return self._kakao(company)
+        return None
+
+    def select(self, companies: list, limit: Optional[int] = None) -> list:
+        """이번 실행에서 변환할 회사 (미처리/만료 + 주소가 바뀐 회사)"""
+        # 주소가 없는 회사는 카카오(회사명 검색)나 사전(시/도, 시/군/구)으로만 찾을 수 있음
+        area = "sigungu" if is_more_precise("sigungu", GAZETTEER_MIN_PRECISION) else "sido"
+        candidates = [
+            c for c in companies
+            if c.address or (self.kakao and c.name) or (self.gazetteer and getattr(c, area))
+        ]
+        by_id = {c.id: c for c in candidates}
+        pending = RefreshScheduler(self.progress).select(list(by_id))
+
+        moved = self.naver.moved_companies(candidates, pending)
+        if moved:
+            print(f"  주소 변경: {len(moved)}개 회사 다시 변환")
+        pending = pending + moved
+
+        # 사전으로 찍은 대략적 좌표는 API로 다시 시도 (못 찾은 검색은 캐시되어 요청하지 않음)
+        # API가 없어도 GAZETTEER_MIN_PRECISION보다 대략적인 이전 좌표는 다시 처리해 버림
+        approximate = self.approximate_companies(
+            candidates, pending, coarse_only=not (self.use_naver or self.kakao)
+        )
+        if approximate:
+            print(f"  대략적 좌표: {len(approximate)}개 회사 다시 시도")
+        pending = pending + approximate
+        if limit:
+            pending = pending[:limit]
+        return [by_id[company_id] for company_id in pending]
+
+    def approximate_companies(
+        self, companies: list, exclude: list[str], coarse_only: bool = False
+    ) -> list[str]:
+        """
+        사전 좌표로 완료했지만 API로 더 정확히 찾을 수 있는 회사 ID
+
+        coarse_only면 GAZETTEER_MIN_PRECISION보다 대략적인 좌표만 (이전 기본값으로 찍은 시/도청 좌표)
+        """
+        skip = set(exclude)
+        approximate = []
+        for company in companies:
+            if company.id in skip:
+                continue
+            result = self.progress.get_result(company.id) or {}
+            if result.get("provider") != "gazetteer":
+                continue
+            coarse = not is_usable_coords(result)
+            if coarse_only and not coarse:
+                continue
+            if not coarse and self.gazetteer_mode == "first" and is_more_precise(
+                result.get("precision", "sido"), GAZETTEER_FIRST_PRECISION
+            ):
+                continue
+            approximate.append(company.id)
+        return approximate
+
+    def _record(self, company, result: Optional[dict], results: dict):
+        """결과를 진행상황에 기록"""
+        key = canonical_address(company.address)
+        if result:
+            results[company.id] = (result["lat"], result["lng"])
+            self.progress.mark_completed(company.id, {**result, "address": key})
+            self._count(result["provider"])
+            print(
+                f"  {result['provider']}: {result['lat']:.6f}, {result['lng']:.6f} "
+                f"({result['precision']})"
+            )
+        else:
+            # 재수집에서 못 찾으면 기존 결과 유지 (주소가 바뀌었으면 이전 좌표는 버림)
+            previous = self.progress.get_result(company.id) or {}
+            if previous.get("address", key) != key or not is_usable_coords(previous):
+                previous = {}
+            self.progress.mark_completed(company.id, {**previous, "address": key})
+            self._count("miss")
+            print("  좌표 변환 실패")
+
+    def geocode_companies(
+        self, companies: list, limit: Optional[int] = None
+    ) -> dict[str, tuple[float, float]]:
+        """여러 회사 좌표 변환 (workers개씩 동시에)"""
+        results = {}
+        if not self.use_naver:
+            print("[경고] 네이버 API 키가 없어 카카오/지명 사전으로만 변환합니다.")
+        if self.gazetteer_mode != "off":
+            self.gazetteer = Gazetteer.load(self.progress.get_results())
+            print(f"  지명 사전: {len(self.gazetteer)}개 주소/지역 ({self.gazetteer_mode})")
+        targets = self.select(companies, limit=limit)
+        total = len(targets)
+        self.hedge_limit = int(total * GEOCODE_HEDGE_BUDGET)
+        providers = [name for name, on in (("네이버", self.use_naver), ("카카오", self.kakao)) if on]
+        if self.gazetteer:
+            providers.insert(0 if self.gazetteer_mode == "first" else len(providers), "지명 사전")
+        providers = " → ".join(providers)
+        hedge = ", 느린 응답은 카카오 동시 요청" if self.hedge else ""
+        print(f"Geocoding 시작: {total}개 회사 ({providers}, 동시 {self.workers}개{hedge})")
+
+        deferred = None
+        done = 0
+        self._stop.clear()
+        with ThreadPoolExecutor(self.workers * 2) as requests_pool, ThreadPoolExecutor(
+            self.workers
+        ) as pool:
+            self._requests = requests_pool
+            futures = {pool.submit(self._geocode_one, c): c for c in targets}
+            for future in as_completed(futures):
+                company = futures[future]
+                try:
+                    result = future.result()
+                except QuotaExceeded as e:
+                    # 실패로 기록하지 않고 남은 회사는 다음 실행으로 미룸
+                    deferred = deferred or e
+                    self._stop.set()
+                    continue
+                except Exception as e:
+                    done += 1
+                    print(f"[{done}/{total}] {company.name}")
+                    self.progress.mark_failed(company.id, str(e))
+                    print(f"  [에러] {e}")
+                    continue
+                if result is DEFERRED:
+                    continue
+
+                done += 1
+                print(f"[{done}/{total}] {company.name}")
+                self._record(company, result, results)
+            self._requests = None
+
+        if deferred:
+            print(f"  [대기] {deferred}")
+            print(
+                f"  남은 {total - done}개 회사는 "
+                f"{deferred.reset_at:%m-%d %H:%M} 이후 다시 실행하세요."
+            )
+
+        self.print_stats(companies)
+        return results
+
+    def print_stats(self, companies: list):
+        """provider별 결과, 좌표 보유율, 요청/캐시 통계"""
+        s = self.stats
+        stats = self.progress.get_stats()
+        print(f"\nGeocoding 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+        print(
+            f"  이번 실행: 네이버 {s['naver']}, 카카오 {s['kakao']}, "
+            f"지명 사전 {s['gazetteer']}, 못 찾음 {s['miss']}"
+        )
+        if self.hedge:
+            print(f"  카카오 동시 요청 {s['hedged']}회 (카카오가 먼저 찾음 {s['hedge_won']}회)")
+
+        results = {
+            company_id: result for company_id, result in self.progress.get_results().items()
+            if is_usable_coords(result)
+        }
+        with_coords = sum(1 for c in companies if (results.get(c.id) or {}).get("lat"))
+        if companies:
+            print(
+                f"  좌표 보유: {with_coords}/{len(companies)}개 "
+                f"({with_coords / len(companies) * 100:.1f}%)"
+            )
+            precisions = Counter(
+                (results.get(c.id) or {}).get("precision", "building")
+                for c in companies
+                if (results.get(c.id) or {}).get("lat")
+            )
+            approximate = ", ".join(
+                f"{p} {precisions[p]}" for p in PRECISIONS[1:] if precisions[p]
+            )
+            if approximate:
+                print(f"  대략적 좌표: {approximate}")
+        if self.use_naver:
+            print(f"  {self.naver.address_cache.summary()}")
+            print(f"  {self.naver.session.limiter.report()}")
+        if self.kakao:
+            print(f"  {self.kakao.search_cache.summary()}")
+            print(f"  {self.kakao.session.limiter.report()}")
+        print(f"  {self.latency.summary()}")
@@ -0,0 +1,185 @@
+"""오프라인 지명 사전 geocoder - 네트워크 없이 시/도, 시/군/구, 동, 도로 단위 좌표"""
+import csv
+import os
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from src.config import GAZETTEER_MIN_PRECISION, GAZETTEER_PATH, GAZETTEER_URL
+from src.geocoding.address import canonical_address
+
+# 정확한 순서
+PRECISIONS = ("building", "road", "dong", "sigungu", "sido")
+
+# 시/도 대표 좌표 (시/도청 소재지) - 사전에 더 자세한 정보가 없을 때 사용
+SIDO_SEATS = {
+    "서울": (37.5665, 126.9780),
+    "부산": (35.1796, 129.0756),
+    "대구": (35.8714, 128.6014),
+    "인천": (37.4563, 126.7052),
+    "광주": (35.1601, 126.8514),
+    "대전": (36.3504, 127.3845),
+    "울산": (35.5396, 129.3115),
+    "세종": (36.4801, 127.2890),
+    "경기": (37.2893, 127.0535),
+    "강원": (37.8853, 127.7298),
+    "충북": (36.6357, 127.4917),
+    "충남": (36.6588, 126.6728),
+    "전북": (35.8203, 127.1088),
+    "전남": (34.8161, 126.4629),
+    "경북": (36.5760, 128.5056),
+    "경남": (35.2383, 128.6924),
+    "제주": (33.4890, 126.4983),
+}
+
+
+def token_precision(token: str, position: int) -> Optional[str]:
+    """주소 토큰의 단위 (알 수 없는 토큰은 None)"""
+    if position == 0:
+        return "sido"
+    if token.endswith(("로", "길")):
+        return "road"
+    if token.endswith(("동", "읍", "면", "리", "가")):
+        return "dong"
+    if token.endswith(("시", "군", "구")):
+        return "sigungu"
+    return None
+
+
+def is_more_precise(precision: str, than: str) -> bool:
+    """precision이 than보다 정확하거나 같은지"""
+    return PRECISIONS.index(precision) <= PRECISIONS.index(than)
+
+
+def is_usable_coords(result: dict) -> bool:
+    """지도 좌표로 쓸 결과인지 (사전 좌표는 GAZETTEER_MIN_PRECISION 이상만)"""
+    if result.get("provider") != "gazetteer":
+        return True
+    return is_more_precise(result.get("precision", "sido"), GAZETTEER_MIN_PRECISION)
+
+
+class Gazetteer:
+    """
+    정규화 주소 접두사 → 좌표 사전
+
+    "서울 강남구 테헤란로 123"을 좌표와 함께 넣으면 "서울", "서울 강남구",
+    "서울 강남구 테헤란로", 전체 주소에 각각 점을 더하고, 접두사별 좌표는
+    들어온 점들의 평균(회사가 모인 곳의 중심)입니다. CSV/시도청 좌표처럼
+    고정된 지역 좌표는 평균보다 우선합니다.
+
+    조회는 주소를 정규화해 가장 긴 접두사부터 사전을 찾으므로 주소 길이에만 비례합니다.
+    """
+
+    def __init__(self):
+        self._sums: dict[str, list] = {}  # 접두사 -> [위도 합, 경도 합, 개수, 단위]
+        self._fixed: dict[str, tuple[float, float, str]] = {}
+        self.index: dict[str, tuple[float, float, str]] = {}
+
+    def add(self, address: str, lat: float, lng: float):
+        """정확한 좌표를 아는 주소 추가 (모든 접두사에 반영)"""
+        tokens = canonical_address(address).split()
+        for n in range(1, len(tokens) + 1):
+            if n == len(tokens) and tokens[-1][0].isdigit():
+                precision = "building"  # 번지까지 있는 전체 주소
+            else:
+                precision = token_precision(tokens[n - 1], n - 1)
+            if not precision:
+                continue
+            entry = self._sums.setdefault(" ".join(tokens[:n]), [0.0, 0.0, 0, precision])
+            entry[0] += lat
+            entry[1] += lng
+            entry[2] += 1
+
+    def add_area(self, area: str, lat: float, lng: float, precision: Optional[str] = None):
+        """지역 대표 좌표 추가 (예: "경기 성남시 분당구")"""
+        key = canonical_address(area)
+        tokens = key.split()
+        if not tokens:
+            return
+        precision = precision or token_precision(tokens[-1], len(tokens) - 1) or "building"
+        self._fixed[key] = (lat, lng, precision)
+
+    def build(self) -> "Gazetteer":
+        """평균 좌표 계산 후 고정 좌표로 덮어쓰기"""
+        self.index = {
+            key: (lat_sum / count, lng_sum / count, precision)
+            for key, (lat_sum, lng_sum, count, precision) in self._sums.items()
+        }
+        self.index.update(self._fixed)
+        return self
+
+    def lookup(self, address: str) -> Optional[dict]:
+        """주소 → {lat, lng, precision, matched} (가장 긴 접두사, 못 찾으면 None)"""
+        tokens = canonical_address(address).split()
+        for n in range(len(tokens), 0, -1):
+            found = self.index.get(" ".join(tokens[:n]))
+            if found:
+                lat, lng, precision = found
+                return {
+                    "lat": lat,
+                    "lng": lng,
+                    "precision": precision,
+                    "matched": " ".join(tokens[:n]),
+                }
+        return None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def load_csv(self, path: Path) -> int:
+        """address,lat,lng[,precision] CSV 추가 (추가한 행 수)"""
+        count = 0
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    lat, lng = float(row["lat"]), float(row["lng"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self.add_area(row.get("address") or "", lat, lng, row.get("precision") or None)
+                count += 1
+        return count
+
+    @classmethod
+    def load(
+        cls,
+        results: Optional[dict[str, dict]] = None,
+        csv_path: Path = GAZETTEER_PATH,
+    ) -> "Gazetteer":
+        """
+        시도청 좌표 + 지역 좌표 CSV + 이미 구한 geocode 결과로 사전 구성
+
+        results: geocode 진행상황 결과 (네이버/카카오로 구한 좌표만 사용)
+        csv_path가 없고 GAZETTEER_URL이 있으면 한 번 받아 저장합니다.
+        """
+        gazetteer = cls()
+        for sido, (lat, lng) in SIDO_SEATS.items():
+            gazetteer.add_area(sido, lat, lng, "sido")
+
+        csv_path = Path(csv_path)
+        if not csv_path.exists() and GAZETTEER_URL:
+            download_gazetteer(GAZETTEER_URL, csv_path)
+        if csv_path.exists():
+            count = gazetteer.load_csv(csv_path)
+            print(f"  지명 사전: {csv_path.name} {count}개 지역")
+
+        for result in (results or {}).values():
+            if result.get("lat") and result.get("address") and result.get("provider") != "gazetteer":
+                gazetteer.add(result["address"], result["lat"], result["lng"])
+
+        return gazetteer.build()
+
+
+def download_gazetteer(url: str, path: Path):
+    """지역 좌표 CSV 한 번 받기 (받는 중 중단돼도 기존 파일이 깨지지 않도록 임시 파일 → rename)"""
+    print(f"지명 사전 다운로드: {url}")
+    try:
+        response = requests.get(url, timeout=60)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  [경고] 지명 사전 다운로드 실패: {e}")
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(response.content)
+    os.replace(tmp_path, path)
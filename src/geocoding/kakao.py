@@ -1,9 +1,16 @@
 """카카오 로컬 API 모듈 - 회사명으로 주소 검색"""
-import time
-import requests
 from typing import Optional
 
-from src.config import MAX_RETRIES, RETRY_BACKOFF
+from src.http_cache import CachedSession, OfflineCacheMiss
+from src.ratelimit import QuotaExceeded, get_limiter
+from src.retry import (
+    DeadlineExceeded,
+    LatencyStats,
+    RetryPolicy,
+    raise_for_retry,
+    request_timeout,
+)
+from src.search_cache import SearchCache
 
 
 class KakaoLocalSearch:
@@ -12,10 +19,13 @@ class KakaoLocalSearch:
     SEARCH_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 
     def __init__(self, api_key: str):
-        self.session = requests.Session()
+        self.session = CachedSession(limiter=get_limiter("kakao"))
         self.session.headers.update({
             "Authorization": f"KakaoAK {api_key}"
         })
+        self.search_cache = SearchCache.open("kakao")
+        self.retry = RetryPolicy()
+        self.latency = LatencyStats("kakao")
 
     def search_company(self, company_name: str, region: str = None) -> Optional[dict]:
         """
@@ -38,50 +48,50 @@ class KakaoLocalSearch:
         if region:
             query = f"{region} {company_name}"
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                time.sleep(0.1)  # Rate limit
-
-                response = self.session.get(
-                    self.SEARCH_URL,
-                    params={
-                        "query": query,
-                        "category_group_code": "",  # 모든 카테고리
-                        "size": 5
-                    },
-                    timeout=10
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    documents = data.get("documents", [])
-
-                    if documents:
-                        # 첫 번째 결과 사용 (가장 관련성 높음)
-                        doc = documents[0]
-                        return {
-                            'address': doc.get('road_address_name') or doc.get('address_name'),
-                            'address_old': doc.get('address_name'),
-                            'lat': float(doc.get('y', 0)),
-                            'lng': float(doc.get('x', 0)),
-                            'place_name': doc.get('place_name'),
-                            'category': doc.get('category_name'),
-                        }
-
-                elif response.status_code == 401:
-                    print("[에러] 카카오 API 키가 유효하지 않습니다.")
-                    return None
-
-                elif response.status_code == 429:
-                    time.sleep(RETRY_BACKOFF ** (attempt + 1))
-                    continue
-
-            except Exception as e:
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_BACKOFF ** (attempt + 1))
-                else:
-                    print(f"[에러] 카카오 API 검색 실패: {e}")
-
+        documents = self.search_cache.get_or_fetch(query, lambda: self._search(query))
+        if not documents:
+            return None
+
+        # 첫 번째 결과 사용 (가장 관련성 높음)
+        doc = documents[0]
+        return {
+            'address': doc.get('road_address_name') or doc.get('address_name'),
+            'address_old': doc.get('address_name'),
+            'lat': float(doc.get('y', 0)),
+            'lng': float(doc.get('x', 0)),
+            'place_name': doc.get('place_name'),
+            'category': doc.get('category_name'),
+        }
+
+    def _search(self, query: str) -> Optional[list]:
+        """키워드 검색 API 호출 (검색 결과 목록, 요청 실패 시 None)"""
+        def request():
+            response = self.session.get(
+                self.SEARCH_URL,
+                params={
+                    "query": query,
+                    "category_group_code": "",  # 모든 카테고리
+                    "size": 5
+                },
+                timeout=request_timeout(10)
+            )
+            raise_for_retry(response.status_code, response.headers)
+            return response
+
+        try:
+            response = self.retry.call(request, label=query)
+        except OfflineCacheMiss:
+            return None
+        except (QuotaExceeded, DeadlineExceeded):
+            raise
+        except Exception as e:
+            print(f"[에러] 카카오 API 검색 실패: {e}")
+            return None
+
+        if response.status_code == 200:
+            return response.json().get("documents", [])
+        if response.status_code == 401:
+            print("[에러] 카카오 API 키가 유효하지 않습니다.")
         return None
 
     def search_companies_batch(
@@ -99,9 +109,18 @@ class KakaoLocalSearch:
         """
         results = {}
 
-        for company in companies:
+        for idx, company in enumerate(companies):
             region = getattr(company, region_field, None)
-            result = self.search_company(company.name, region)
+            try:
+                with self.latency.company():
+                    result = self.search_company(company.name, region)
+            except QuotaExceeded as e:
+                print(f"[대기] {e}")
+                print(f"  남은 {len(companies) - idx}개 회사는 {e.reset_at:%m-%d %H:%M} 이후 다시 검색하세요.")
+                break
+            except DeadlineExceeded as e:
+                print(f"[카카오] {company.name}: {e}")
+                continue
 
             if result:
                 results[company.id] = result
@@ -109,4 +128,7 @@ class KakaoLocalSearch:
             else:
                 print(f"[카카오] {company.name}: 검색 결과 없음")
 
+        print(self.search_cache.summary())
+        print(self.session.limiter.report())
+        print(self.latency.summary())
         return results
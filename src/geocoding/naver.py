@@ -1,24 +1,32 @@
 """네이버 Geocoding API 모듈"""
-import time
-import requests
+from datetime import datetime
 from typing import Optional
 
 from src.config import (
     NAVER_CLIENT_ID,
     NAVER_CLIENT_SECRET,
     NAVER_GEOCODE_URL,
-    NAVER_RATE_LIMIT,
-    MAX_RETRIES,
-    RETRY_BACKOFF,
+    GEOCODE_CACHE_TTL_DAYS,
 )
+from src.geocoding.address import canonical_address
+from src.http_cache import CachedSession, OfflineCacheMiss
 from src.pipeline.progress import ProgressTracker
+from src.ratelimit import QuotaExceeded, get_limiter
+from src.retry import (
+    DeadlineExceeded,
+    RetryPolicy,
+    raise_for_retry,
+    request_timeout,
+)
+from src.search_cache import SearchCache
 
 
 class NaverGeocoder:
     """네이버 Geocoding API 클라이언트"""
 
     def __init__(self):
-        self.session = requests.Session()
+        # 요청 속도 제한은 캐시에 없는 요청에만 적용
+        self.session = CachedSession(limiter=get_limiter("naver"))
         self.session.headers.update(
             {
                 "X-NCP-APIGW-API-KEY-ID": NAVER_CLIENT_ID,
@@ -26,10 +34,14 @@ class NaverGeocoder:
             }
         )
         self.progress = ProgressTracker("geocode")
+        # 같은 건물(정규화한 주소)의 회사끼리, 실행 간에도 좌표 공유
+        self.address_cache = SearchCache.open("geocode", ttl_days=GEOCODE_CACHE_TTL_DAYS)
+        self.retry = RetryPolicy()
 
     def geocode(self, address: str) -> Optional[tuple[float, float]]:
-        """주소를 좌표로 변환 (lat, lng)"""
-        if not address:
+        """주소를 좌표로 변환 (lat, lng) - 정규화한 주소가 같으면 캐시된 좌표 사용"""
+        key = canonical_address(address)
+        if not key:
             return None
 
         if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
@@ -37,89 +49,72 @@ class NaverGeocoder:
             print("  .env 파일에 NAVER_CLIENT_ID, NAVER_CLIENT_SECRET를 설정하세요.")
             return None
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                time.sleep(NAVER_RATE_LIMIT)
-
-                response = self.session.get(
-                    NAVER_GEOCODE_URL,
-                    params={"query": address},
-                    timeout=10,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    addresses = data.get("addresses", [])
-
-                    if addresses:
-                        addr = addresses[0]
-                        lat = float(addr.get("y"))
-                        lng = float(addr.get("x"))
-                        return (lat, lng)
-                    else:
-                        return None
-
-                elif response.status_code == 429:
-                    # Rate limit
-                    print(f"  Rate limit, 대기 중...")
-                    time.sleep(RETRY_BACKOFF ** (attempt + 1))
-
-                else:
-                    print(f"  API 에러: {response.status_code}")
-                    return None
+        coords = self.address_cache.get_or_fetch(key, lambda: self._request(key))
+        if not coords:
+            return None
+        return (coords[0], coords[1])
+
+    def _request(self, address: str) -> Optional[list]:
+        """Geocoding API 호출 ([lat, lng], 결과 없음은 빈 목록, 요청 실패 시 None)"""
+        def request():
+            response = self.session.get(
+                NAVER_GEOCODE_URL,
+                params={"query": address},
+                timeout=request_timeout(10),
+            )
+            raise_for_retry(response.status_code, response.headers)
+            return response
+
+        try:
+            response = self.retry.call(request)
+        except OfflineCacheMiss:
+            return None
+        except (QuotaExceeded, DeadlineExceeded):
+            raise
+        except Exception as e:
+            print(f"  [에러] {e}")
+            return None
 
-            except Exception as e:
-                if attempt < MAX_RETRIES - 1:
-                    print(f"  [재시도 {attempt + 1}/{MAX_RETRIES}] {e}")
-                    time.sleep(RETRY_BACKOFF ** (attempt + 1))
-                else:
-                    print(f"  [에러] {e}")
-                    return None
+        if response.status_code != 200:
+            print(f"  API 에러: {response.status_code}")
+            return None
 
-        return None
+        addresses = response.json().get("addresses", [])
+        if not addresses:
+            return []
+        addr = addresses[0]
+        return [float(addr.get("y")), float(addr.get("x"))]
+
+    def moved_companies(self, companies: list, exclude: list[str]) -> list[str]:
+        """
+        좌표를 구한 뒤 주소가 바뀐 회사 ID (결과에 기록한 정규화 주소와 비교)
+
+        정규화 주소 없이 저장된 이전 결과는 바뀌지 않은 것으로 보고 지금 주소를 기록합니다
+        (수집 시각은 그대로).
+        """
+        skip = set(exclude)
+        moved = []
+        for company in companies:
+            if company.id in skip or not self.progress.is_completed(company.id):
+                continue
+            result = self.progress.get_result(company.id) or {}
+            key = canonical_address(company.address)
+            if "address" not in result:
+                fetched_at = self.progress.get_fetched_at(company.id)
+                self.progress.mark_completed(
+                    company.id,
+                    {**result, "address": key},
+                    fetched_at.isoformat() if fetched_at and fetched_at != datetime.min else None,
+                )
+            elif result["address"] != key:
+                moved.append(company.id)
+        return moved
 
     def geocode_companies(
         self, companies: list, limit: Optional[int] = None
     ) -> dict[str, tuple[float, float]]:
-        """여러 회사 주소를 좌표로 변환"""
-        results = {}
-
-        # 주소가 있는 회사만 필터링
-        companies_with_address = [c for c in companies if c.address]
-        company_ids = [c.id for c in companies_with_address]
-        pending = self.progress.get_pending(company_ids)
-
-        if limit:
-            pending = pending[:limit]
-
-        total = len(pending)
-        print(f"Geocoding 시작: {total}개 회사")
-
-        for idx, company_id in enumerate(pending, 1):
-            company = next((c for c in companies_with_address if c.id == company_id), None)
-            if not company:
-                continue
-
-            print(f"[{idx}/{total}] {company.name}: {company.address[:30]}...")
-
-            try:
-                coords = self.geocode(company.address)
-
-                if coords:
-                    results[company_id] = coords
-                    self.progress.mark_completed(
-                        company_id, {"lat": coords[0], "lng": coords[1]}
-                    )
-                    print(f"  좌표: {coords[0]:.6f}, {coords[1]:.6f}")
-                else:
-                    self.progress.mark_completed(company_id, {})
-                    print("  좌표 변환 실패")
-
-            except Exception as e:
-                self.progress.mark_failed(company_id, str(e))
-                print(f"  [에러] {e}")
-
-        stats = self.progress.get_stats()
-        print(f"\nGeocoding 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+        """여러 회사 주소를 좌표로 변환 (네이버만, 순차)"""
+        from src.geocoding.engine import GeocodeEngine
 
-        return results
+        engine = GeocodeEngine(naver=self, kakao=False, workers=1, hedge=False)
+        return engine.geocode_companies(companies, limit=limit)
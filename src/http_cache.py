@@ -0,0 +1,229 @@
+"""HTTP 응답 캐시 모듈 - 재실행 시 같은 요청을 다시 보내지 않도록 디스크에 저장"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.config import (
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_TTL_HOURS,
+    HTTP_CACHE_DEFAULT_TTL_HOURS,
+    HTTP_OFFLINE,
+)
+from src.ratelimit import AdaptiveRateLimiter
+
+
+_offline = HTTP_OFFLINE
+
+
+def set_offline(value: bool):
+    """오프라인 모드: 캐시에 있는 응답만 사용 (만료돼도 사용, 없으면 에러)"""
+    global _offline
+    _offline = value
+
+
+def is_offline() -> bool:
+    return _offline
+
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """오프라인 모드에서 캐시에 없는 요청"""
+
+
+class HttpCache:
+    """
+    디스크 HTTP 캐시
+
+    meta/{요청 해시}.json  - URL, 상태 코드, 헤더, 저장 시각, 본문 해시
+    bodies/{본문 해시}.gz  - gzip 압축 본문 (같은 본문은 한 번만 저장)
+    """
+
+    # 캐시에 남길 응답 헤더
+    KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        (self.cache_dir / "meta").mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / "bodies").mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "revalidated": 0, "stored": 0}
+
+    @staticmethod
+    def request_url(url: str, params: Optional[dict] = None) -> str:
+        """파라미터 순서와 무관한 전체 URL"""
+        if params:
+            params = sorted(params.items())
+        return requests.Request("GET", url, params=params).prepare().url
+
+    @staticmethod
+    def key(method: str, full_url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {full_url}".encode()).hexdigest()
+
+    @staticmethod
+    def ttl_for(url: str) -> timedelta:
+        """URL 접두사별 TTL (가장 긴 접두사 우선)"""
+        hours = HTTP_CACHE_DEFAULT_TTL_HOURS
+        best = ""
+        for prefix, prefix_hours in HTTP_CACHE_TTL_HOURS.items():
+            if url.startswith(prefix) and len(prefix) > len(best):
+                best, hours = prefix, prefix_hours
+        return timedelta(hours=hours)
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / "meta" / key[:2] / f"{key}.json"
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.cache_dir / "bodies" / body_hash[:2] / f"{body_hash}.gz"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def load(self, key: str) -> Optional[dict]:
+        """캐시 항목 (본문 포함), 없으면 None"""
+        meta_path = self._meta_path(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            with gzip.open(self._body_path(entry["bodyHash"]), "rb") as f:
+                entry["body"] = f.read()
+            return entry
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        stored_at = datetime.fromisoformat(entry["storedAt"])
+        return datetime.now() - stored_at < self.ttl_for(entry["url"])
+
+    def store(self, key: str, url: str, status: int, headers, body: bytes) -> dict:
+        """응답 저장 (본문은 해시로 중복 제거)"""
+        body_hash = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not body_path.exists():
+            self._atomic_write(body_path, gzip.compress(body))
+
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {k: headers[k] for k in self.KEEP_HEADERS if k in headers},
+            "storedAt": datetime.now().isoformat(),
+            "bodyHash": body_hash,
+        }
+        self._atomic_write(
+            self._meta_path(key), json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        )
+        with self.lock:
+            self.stats["stored"] += 1
+        entry["body"] = body
+        return entry
+
+    def touch(self, key: str, entry: dict):
+        """304 재검증 성공: 저장 시각만 갱신"""
+        entry["storedAt"] = datetime.now().isoformat()
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        self._atomic_write(
+            self._meta_path(key), json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        )
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """만료된 항목 재검증용 헤더 (ETag / Last-Modified)"""
+        if not entry:
+            return {}
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"HTTP 캐시: 적중 {s['hit']}, 재검증 {s['revalidated']}, "
+            f"네트워크 {s['miss']}"
+        )
+
+
+class CachedSession(requests.Session):
+    """
+    GET 요청을 HttpCache로 처리하는 requests.Session
+
+    limiter는 실제 네트워크 요청에만 적용되고 (캐시 적중 시 대기 없음),
+    응답 상태/시간을 limiter에 알려 속도를 조절합니다.
+    200 응답만 저장하고, 만료된 항목은 ETag/Last-Modified로 재검증합니다.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HttpCache] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        super().__init__()
+        self.cache = cache or HttpCache()
+        self.limiter = limiter
+
+    @staticmethod
+    def _to_response(entry: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.url = entry["url"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def request(self, method, url, params=None, **kwargs):
+        if method.upper() != "GET":
+            return super().request(method, url, params=params, **kwargs)
+
+        full_url = self.cache.request_url(url, params)
+        key = self.cache.key(method, full_url)
+        entry = self.cache.load(key)
+
+        if entry and (is_offline() or self.cache.is_fresh(entry)):
+            self.cache.count("hit")
+            return self._to_response(entry)
+        if is_offline():
+            raise OfflineCacheMiss(f"오프라인 모드: 캐시 없음 ({full_url})")
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(self.cache.conditional_headers(entry))
+
+        if self.limiter:
+            self.limiter.acquire()
+        self.cache.count("miss")
+        started = time.monotonic()
+        try:
+            response = super().request(method, full_url, headers=headers, **kwargs)
+        except requests.RequestException:
+            if self.limiter:
+                self.limiter.record(time.monotonic() - started, error=True)
+            raise
+        if self.limiter:
+            self.limiter.record(time.monotonic() - started, response.status_code)
+
+        if response.status_code == 304 and entry:
+            self.cache.count("revalidated")
+            self.cache.touch(key, entry)
+            return self._to_response(entry)
+        if response.status_code == 200:
+            self.cache.store(key, full_url, 200, response.headers, response.content)
+        return response
@@ -1,27 +1,40 @@
 """잡플래닛 크롤러 모듈"""
+import json
 import time
-import re
+from datetime import datetime, timedelta
 from typing import Optional
-from selenium import webdriver
+
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from src.browser import ManagedDriver, create_chrome
+from src.company_index import CompanyIndex
 from src.config import (
+    BROWSER_RECYCLE_PAGES,
+    COMPANY_INDEX_ENABLED,
     JOBPLANET_EMAIL,
     JOBPLANET_PASSWORD,
-    JOBPLANET_RATE_LIMIT,
-    MAX_RETRIES,
-    RETRY_BACKOFF,
+    JOBPLANET_SESSION_PATH,
+    JOBPLANET_SESSION_TTL_HOURS,
 )
 from src.models import JobplanetData
+from src.jobplanet.extract import (
+    snapshot_page,
+    body_text,
+    parse_company_snapshot,
+    parse_avg_salary,
+)
+from src.pipeline.archive import new_archive
 from src.pipeline.progress import ProgressTracker
-from src.utils import normalize_company_name, is_good_match
+from src.pipeline.scheduler import RefreshScheduler
+from src.ratelimit import AdaptiveRateLimiter, get_limiter
+from src.retry import DeadlineExceeded, LatencyStats, RetryPolicy, check_deadline
+from src.search_cache import SearchCache
+from src.utils import CandidateRanker, SearchStats, normalize_company_name
 
 
 class JobplanetCrawler:
@@ -30,35 +43,123 @@ class JobplanetCrawler:
     BASE_URL = "https://www.jobplanet.co.kr"
     LOGIN_URL = "https://www.jobplanet.co.kr/users/sign_in"
     SEARCH_URL = "https://www.jobplanet.co.kr/search?query="  # 통합 검색 URL
-
-    def __init__(self, headless: bool = True):
+    # 차단하지 않을 리소스 종류 (CSS가 없으면 숨김 요소도 innerText에 잡혀 주소 추출이 흔들림)
+    ALLOWED_RESOURCES = ("stylesheet",)
+
+    def __init__(
+        self,
+        headless: bool = True,
+        progress: Optional[ProgressTracker] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        latency: Optional[LatencyStats] = None,
+        search_stats: Optional[SearchStats] = None,
+    ):
         self.driver = None
         self.headless = headless
         self.logged_in = False
-        self.progress = ProgressTracker("jobplanet")
+        # 워커 풀에서는 진행상황 추적기와 속도 제한을 모든 워커가 공유
+        self.progress = progress or ProgressTracker("jobplanet")
+        self.limiter = limiter or get_limiter("jobplanet")
+        self.latency = latency or LatencyStats("jobplanet")
+        self.search_stats = search_stats or SearchStats("jobplanet")
+        self.retry = RetryPolicy()
+        self.extract_times: list[float] = []  # 페이지당 데이터 추출 시간 (초)
+        self.archive = new_archive("jobplanet")
+        self.search_cache = SearchCache.open("jobplanet")
+        self.company_index = CompanyIndex.open("jobplanet") if COMPANY_INDEX_ENABLED else None
+        self.links: dict[str, str] = {}  # 연결 테이블의 회사 ID -> 잡플래닛 URL
+        self._captured: dict[str, dict] = {}  # 현재 회사의 원본 페이지 (종류 -> url, content)
 
     def _init_driver(self):
         """웹드라이버 초기화"""
         if self.driver:
             return
 
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        self.driver = ManagedDriver(
+            lambda: create_chrome(
+                headless=self.headless,
+                allow=self.ALLOWED_RESOURCES,
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            ),
+            recycle_every=BROWSER_RECYCLE_PAGES,
+            limiter=self.limiter,
+        )
+
+    def _load_session(self) -> Optional[list[dict]]:
+        """저장된 로그인 쿠키 (없거나 만료되면 None)"""
+        if not JOBPLANET_SESSION_PATH.exists():
+            return None
+
+        try:
+            with open(JOBPLANET_SESSION_PATH, "r", encoding="utf-8") as f:
+                session = json.load(f)
+            if datetime.fromisoformat(session["expiresAt"]) <= datetime.now():
+                return None
+            return session["cookies"]
+        except (ValueError, KeyError, OSError):
+            return None
+
+    def _save_session(self):
+        """현재 드라이버의 로그인 쿠키 저장"""
+        cookies = self.driver.get_cookies()
+        expires_at = datetime.now() + timedelta(hours=JOBPLANET_SESSION_TTL_HOURS)
+        # 쿠키 자체 만료가 더 빠르면 그 시각까지만 사용
+        cookie_expiries = [c["expiry"] for c in cookies if c.get("expiry")]
+        if cookie_expiries:
+            expires_at = min(expires_at, datetime.fromtimestamp(min(cookie_expiries)))
+
+        JOBPLANET_SESSION_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(JOBPLANET_SESSION_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "savedAt": datetime.now().isoformat(),
+                    "expiresAt": expires_at.isoformat(),
+                    "cookies": cookies,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    def _probe_session(self, cookies: list[dict]) -> bool:
+        """저장된 쿠키가 아직 유효한지 HTTP 요청 한 번으로 확인
+
+        로그인 상태면 로그인 페이지가 다른 곳으로 리다이렉트됨
+        """
+        session = requests.Session()
+        session.headers["User-Agent"] = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         )
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.implicitly_wait(5)
+        try:
+            response = session.get(self.LOGIN_URL, timeout=10)
+            return response.status_code == 200 and "sign_in" not in response.url
+        except requests.RequestException:
+            return False
+
+    def _restore_session(self) -> bool:
+        """저장된 로그인 세션 복원 (성공하면 로그인 생략)"""
+        cookies = self._load_session()
+        if not cookies or not self._probe_session(cookies):
+            return False
+
+        if self.load_cookies(cookies):
+            print("[완료] 저장된 잡플래닛 로그인 세션 사용")
+            return True
+        return False
 
     def login(self) -> bool:
-        """잡플래닛 로그인"""
+        """잡플래닛 로그인 (저장된 세션이 유효하면 재사용)"""
+        if self._restore_session():
+            return True
+
         if not JOBPLANET_EMAIL or not JOBPLANET_PASSWORD:
             print("[에러] 잡플래닛 계정 정보가 설정되지 않았습니다.")
             print("  .env 파일에 JOBPLANET_EMAIL, JOBPLANET_PASSWORD를 설정하세요.")
@@ -106,6 +207,7 @@ class JobplanetCrawler:
             # URL 변경 확인 (로그인 성공 시 리다이렉트)
             if "sign_in" not in self.driver.current_url:
                 self.logged_in = True
+                self._save_session()
                 print("[완료] 잡플래닛 로그인 성공")
                 return True
 
@@ -126,13 +228,29 @@ class JobplanetCrawler:
             print(f"[에러] 로그인 실패: {e}")
             return False
 
+    def load_cookies(self, cookies: list[dict]) -> bool:
+        """다른 드라이버에서 로그인한 세션 쿠키 적용 (로그인 생략)"""
+        self._init_driver()
+
+        try:
+            # 쿠키는 같은 도메인 페이지에서만 추가 가능
+            self.driver.get(self.BASE_URL)
+            for cookie in cookies:
+                cookie = {k: v for k, v in cookie.items() if k != "sameSite"}
+                self.driver.add_cookie(cookie)
+            self.logged_in = True
+            return True
+        except Exception as e:
+            print(f"[에러] 쿠키 적용 실패: {e}")
+            return False
+
     def get_company_by_url(self, url: str) -> Optional[JobplanetData]:
         """이미 알고 있는 URL로 회사 정보 조회"""
         if not self.driver:
             self._init_driver()
 
         try:
-            time.sleep(JOBPLANET_RATE_LIMIT)
+            self.limiter.acquire()
             self.driver.get(url)
             time.sleep(2)
             return self._extract_company_data(url)
@@ -140,158 +258,118 @@ class JobplanetCrawler:
             print(f"  URL 직접 조회 실패: {e}")
         return None
 
-    def search_company(self, company_name: str) -> Optional[JobplanetData]:
-        """회사명으로 검색하여 정보 수집 (다양한 검색어 시도)"""
+    def search_company(self, company_name: str, company=None) -> Optional[JobplanetData]:
+        """회사명으로 검색하여 정보 수집 (확실한 후보를 찾을 때까지 검색어 변형 시도)"""
         if not self.driver:
             self._init_driver()
 
+        ranker = CandidateRanker.for_company(company) if company else CandidateRanker(company_name)
         normalized = normalize_company_name(company_name)
-        search_variants = normalized['search_variants']
-
-        for search_query in search_variants:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    # Rate limit
-                    time.sleep(JOBPLANET_RATE_LIMIT)
-
-                    # 검색 (기업 검색 페이지로 바로 이동)
-                    search_url = f"{self.SEARCH_URL}{search_query}"
-                    self.driver.get(search_url)
-                    time.sleep(2)
-
-                    # 검색 결과에서 회사 링크 찾기 (/companies/숫자 URL 패턴)
-                    company_url = None
-                    try:
-                        # 모든 링크에서 회사 페이지 URL 찾기
-                        links = self.driver.find_elements(By.TAG_NAME, "a")
-                        candidates = []
-                        for link in links:
-                            href = link.get_attribute("href") or ""
-                            text = link.text.strip() if link.text else ""
-                            # /companies/숫자 패턴 (cover 등 제외)
-                            if re.search(r"/companies/\d+", href) and text:
-                                candidates.append((text, href))
-
-                        if not candidates:
-                            continue  # 다음 검색어 시도
-
-                        # 회사명과 가장 유사한 결과 선택
-                        for text, href in candidates:
-                            if is_good_match(company_name, text):
-                                company_url = href
-                                break
-
-                        # 검색어가 결과에 포함된 경우
-                        if not company_url:
-                            for text, href in candidates:
-                                clean_text = normalize_company_name(text)['korean']
-                                if search_query.lower() in clean_text.lower():
-                                    company_url = href
-                                    break
-
-                        # 매칭 실패해도 검색 결과가 3개 이하면 첫 번째 사용
-                        if not company_url and len(candidates) <= 3:
-                            company_url = candidates[0][1]
-                            print(f"    (검색 결과 {len(candidates)}개, 첫 번째 사용)")
-
-                        if not company_url:
-                            continue  # 다음 검색어 시도
-
-                        # 회사 페이지로 이동
-                        self.driver.get(company_url)
-                        time.sleep(2)
-
-                    except Exception:
-                        continue
-
-                    # 회사 정보 페이지에서 데이터 추출
-                    return self._extract_company_data(company_url)
-
-                except Exception as e:
-                    print(f"  [재시도 {attempt + 1}/{MAX_RETRIES}] {search_query}: {e}")
-                    time.sleep(RETRY_BACKOFF ** (attempt + 1))
 
-        return None
+        for search_query in normalized['search_variants']:
+            check_deadline()
 
-    def _extract_company_data(self, company_url: str) -> Optional[JobplanetData]:
-        """회사 상세 페이지에서 데이터 추출"""
-        try:
-            data = JobplanetData(url=self.driver.current_url)
+            def fetch():
+                return self._search_candidates(search_query)
 
-            # 평점 추출 (.rate_point 클래스)
             try:
-                rating_elem = self.driver.find_element(By.CSS_SELECTOR, ".rate_point")
-                rating_text = rating_elem.text.strip()
-                rating_match = re.search(r"(\d+\.?\d*)", rating_text)
-                if rating_match:
-                    data.rating = float(rating_match.group(1))
-            except NoSuchElementException:
-                pass
+                # 검색 결과에서 회사 링크 찾기 (/companies/숫자 URL 패턴, 캐시 우선)
+                candidates = self.retry.call(
+                    lambda: self.search_cache.get_or_fetch(search_query, fetch), label=search_query
+                )
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                print(f"  [에러] {search_query}: {e}")
+                continue
 
-            # 리뷰 수 추출 (타이틀에서: "회사명 | 기업리뷰 328건, 평점")
-            try:
-                title = self.driver.title
-                review_match = re.search(r"(\d+)건", title)
-                if review_match:
-                    data.reviewCount = int(review_match.group(1))
-            except:
-                pass
+            candidates = [tuple(c) for c in candidates or []]
+            self.remember(candidates)
+            if ranker.offer(search_query, candidates, name=lambda c: c[0]):
+                break
 
-            # 주소 추출 시도
-            try:
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                # 주소 패턴: "서울", "경기", "부산" 등으로 시작하는 주소
-                addr_patterns = [
-                    r'(서울[^\n,]{10,50})',
-                    r'(경기[^\n,]{10,50})',
-                    r'(부산[^\n,]{10,50})',
-                    r'(인천[^\n,]{10,50})',
-                    r'(대구[^\n,]{10,50})',
-                    r'(대전[^\n,]{10,50})',
-                    r'(광주[^\n,]{10,50})',
-                    r'(울산[^\n,]{10,50})',
-                    r'(세종[^\n,]{10,50})',
-                    r'(강원[^\n,]{10,50})',
-                    r'(충북[^\n,]{10,50})',
-                    r'(충남[^\n,]{10,50})',
-                    r'(전북[^\n,]{10,50})',
-                    r'(전남[^\n,]{10,50})',
-                    r'(경북[^\n,]{10,50})',
-                    r'(경남[^\n,]{10,50})',
-                    r'(제주[^\n,]{10,50})',
-                ]
-                for pattern in addr_patterns:
-                    addr_match = re.search(pattern, page_text)
-                    if addr_match:
-                        addr = addr_match.group(1).strip()
-                        # 주소로 보이는지 추가 검증 (구, 동, 로, 길 포함)
-                        if re.search(r'(구|동|로|길|읍|면)', addr):
-                            data.address = addr
-                            break
-            except:
-                pass
+        self.search_stats.record(ranker)
+        choice = ranker.choice()
+        if not choice:
+            return None
+
+        company_url = choice[1]
+
+        def visit():
+            # 회사 페이지로 이동 후 데이터 추출
+            self.limiter.acquire()
+            self.driver.get(company_url)
+            time.sleep(2)
+            return self._extract_company_data(company_url)
+
+        try:
+            return self.retry.call(visit, label=company_url)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"  [에러] {company_url}: {e}")
+            return None
+
+    def remember(self, candidates: list[tuple[str, str]]):
+        """검색 결과의 (회사명, URL) 후보를 모두 회사 인덱스에 기록"""
+        if self.company_index:
+            self.company_index.add([{"name": name, "url": url} for name, url in candidates])
+
+    def known_url(self, company) -> Optional[str]:
+        """이미 아는 잡플래닛 URL (수집 결과, 없으면 연결 테이블)"""
+        existing = getattr(company, 'jobplanet', None)
+        return getattr(existing, 'url', None) or self.links.get(company.id)
+
+    def find_in_index(self, company) -> Optional[str]:
+        """검색 전에 회사 인덱스에서 확실한 회사 URL 찾기"""
+        if not self.company_index:
+            return None
+        hit = self.company_index.lookup(CandidateRanker.for_company(company))
+        if hit:
+            print(f"  인덱스에서 찾음: {hit['name']} ({hit['score']:.2f})")
+            return hit["url"]
+        return None
+
+    def _search_candidates(self, search_query: str) -> list[tuple[str, str]]:
+        """검색 페이지의 (회사명, 회사 URL) 후보 목록"""
+        # Rate limit (워커 간 공유)
+        self.limiter.acquire()
+
+        # 검색 (기업 검색 페이지로 바로 이동)
+        self.driver.get(f"{self.SEARCH_URL}{search_query}")
+        time.sleep(2)
+
+        # 페이지의 모든 회사 링크를 한 번에 수집
+        started = time.perf_counter()
+        candidates = snapshot_page(self.driver)["links"]
+        self.extract_times.append(time.perf_counter() - started)
+        return candidates
+
+    def _extract_company_data(self, company_url: str) -> Optional[JobplanetData]:
+        """회사 상세 페이지에서 데이터 추출"""
+        try:
+            # 평점/리뷰 수/주소 후보/연봉 탭 URL을 한 번에 수집
+            started = time.perf_counter()
+            page = snapshot_page(self.driver)
+            data = parse_company_snapshot(page)
+            self.extract_times.append(time.perf_counter() - started)
+            if self.archive:
+                self._capture("company", page.get("url") or company_url, self.driver.page_source)
 
             # 평균 연봉 추출 (연봉 탭으로 이동)
             try:
-                # 연봉 탭 URL 찾기
-                salary_url = None
-                links = self.driver.find_elements(By.TAG_NAME, "a")
-                for link in links:
-                    href = link.get_attribute("href") or ""
-                    if "/salaries" in href:
-                        salary_url = href
-                        break
-
+                salary_url = page.get("salaryUrl")
                 if salary_url:
+                    self.limiter.acquire()
                     self.driver.get(salary_url)
                     time.sleep(1.5)
 
                     # 연봉 페이지에서 평균 연봉 추출
-                    page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                    # "평균 연봉 6,961만" 패턴
-                    salary_match = re.search(r"평균[^\d]*(\d[\d,]*)\s*만", page_text)
-                    if salary_match:
-                        data.avgSalary = int(salary_match.group(1).replace(",", ""))
+                    started = time.perf_counter()
+                    data.avgSalary = parse_avg_salary(body_text(self.driver))
+                    self.extract_times.append(time.perf_counter() - started)
+                    if self.archive:
+                        self._capture("salary", salary_url, self.driver.page_source)
             except:
                 pass
 
@@ -301,19 +379,64 @@ class JobplanetCrawler:
             print(f"  [에러] 데이터 추출 실패: {e}")
             return None
 
+    def _capture(self, kind: str, url: str, content: str):
+        """현재 회사의 원본 페이지 보관 (crawl_company가 끝나면 RawArchive에 기록)"""
+        if self.archive and content:
+            self._captured[kind] = {"url": url, "content": content}
+
+    def crawl_company(self, company, results: dict):
+        """회사 하나 크롤링 후 진행상황에 기록"""
+        company_id = company.id
+        self._captured = {}
+
+        try:
+            data = None
+
+            with self.latency.company():
+                # 1단계: 이미 URL이 있으면 바로 사용
+                existing_url = self.known_url(company)
+                if existing_url:
+                    print(f"  기존 URL 사용")
+                    data = self.get_company_by_url(existing_url)
+
+                # 2단계: 이전 검색 결과에서 본 회사면 검색 생략
+                if not data:
+                    index_url = self.find_in_index(company)
+                    if index_url:
+                        data = self.get_company_by_url(index_url)
+
+                # 3단계: 못 찾으면 검색
+                if not data:
+                    data = self.search_company(company.name, company)
+
+            if data:
+                results[company_id] = data
+                self.progress.mark_completed(company_id, data.__dict__)
+                if self.archive:
+                    self.archive.record(company_id, self._captured)
+                salary_str = f", 연봉: {data.avgSalary}만" if data.avgSalary else ""
+                print(f"  평점: {data.rating}, 리뷰: {data.reviewCount}{salary_str}")
+            else:
+                # 재수집에서 못 찾으면 기존 결과 유지 (수집 시각만 갱신)
+                previous = self.progress.get_result(company_id) or {}
+                self.progress.mark_completed(company_id, previous)
+                print("  검색 결과 없음")
+
+        except Exception as e:
+            self.progress.mark_failed(company_id, str(e))
+            print(f"  [에러] {e}")
+
     def crawl_companies(
-        self, companies: list, limit: Optional[int] = None
+        self, companies: list, limit: Optional[int] = None, links: Optional[dict] = None
     ) -> dict[str, JobplanetData]:
-        """여러 회사 크롤링"""
+        """여러 회사 크롤링 (links: 연결 테이블의 회사 ID -> URL)"""
+        self.links = links or {}
         if not self.login():
             return {}
 
         results = {}
         company_ids = [c.id for c in companies]
-        pending = self.progress.get_pending(company_ids)
-
-        if limit:
-            pending = pending[:limit]
+        pending = RefreshScheduler(self.progress).select(company_ids, limit=limit)
 
         total = len(pending)
         print(f"잡플래닛 크롤링 시작: {total}개 회사")
@@ -324,38 +447,28 @@ class JobplanetCrawler:
                 continue
 
             print(f"[{idx}/{total}] {company.name}")
-
-            try:
-                data = None
-
-                # 1단계: 이미 URL이 있으면 바로 사용
-                existing_jp = getattr(company, 'jobplanet', None)
-                if existing_jp and hasattr(existing_jp, 'url') and existing_jp.url:
-                    print(f"  기존 URL 사용")
-                    data = self.get_company_by_url(existing_jp.url)
-
-                # 2단계: URL 없으면 검색
-                if not data:
-                    data = self.search_company(company.name)
-
-                if data:
-                    results[company_id] = data
-                    self.progress.mark_completed(company_id, data.__dict__)
-                    salary_str = f", 연봉: {data.avgSalary}만" if data.avgSalary else ""
-                    print(f"  평점: {data.rating}, 리뷰: {data.reviewCount}{salary_str}")
-                else:
-                    self.progress.mark_completed(company_id, {})
-                    print("  검색 결과 없음")
-
-            except Exception as e:
-                self.progress.mark_failed(company_id, str(e))
-                print(f"  [에러] {e}")
+            self.crawl_company(company, results)
 
         stats = self.progress.get_stats()
         print(f"\n잡플래닛 크롤링 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+        self.print_extract_stats()
+        print(f"  {self.search_cache.summary()}")
+        print(f"  {self.limiter.report()}")
+        print(f"  {self.search_stats.summary()}")
+        if self.company_index:
+            print(f"  {self.company_index.summary()}")
+        print(f"  {self.latency.summary()}")
+        if self.driver:
+            print(f"  {self.driver.report()}")
 
         return results
 
+    def print_extract_stats(self):
+        """페이지당 데이터 추출 시간 출력"""
+        if self.extract_times:
+            avg_ms = sum(self.extract_times) / len(self.extract_times) * 1000
+            print(f"  페이지 추출 평균 {avg_ms:.1f}ms ({len(self.extract_times)}회)")
+
     def close(self):
         """드라이버 종료"""
         if self.driver:
@@ -0,0 +1,202 @@
+"""잡플래닛 페이지 데이터 추출 모듈 (브라우저/HTML 공용)"""
+import re
+from typing import Optional
+from urllib.parse import urljoin
+
+from src.models import JobplanetData
+
+
+# /companies/숫자 패턴 (cover 등 제외)
+COMPANY_HREF_RE = re.compile(r"/companies/\d+")
+RATING_RE = re.compile(r"(\d+\.?\d*)")
+REVIEW_COUNT_RE = re.compile(r"(\d+)건")
+# "평균 연봉 6,961만" 패턴
+AVG_SALARY_RE = re.compile(r"평균[^\d]*(\d[\d,]*)\s*만")
+
+# 주소 패턴: "서울", "경기", "부산" 등으로 시작하는 주소
+ADDRESS_PATTERNS = [
+    re.compile(rf"({sido}[^\n,]{{10,50}})")
+    for sido in [
+        "서울", "경기", "부산", "인천", "대구", "대전", "광주", "울산", "세종",
+        "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
+    ]
+]
+# 주소로 보이는지 추가 검증 (구, 동, 로, 길 포함)
+ADDRESS_CHECK_RE = re.compile(r"(구|동|로|길|읍|면)")
+
+
+def parse_rating(text: str) -> Optional[float]:
+    """.rate_point 텍스트에서 평점"""
+    match = RATING_RE.search(text or "")
+    return float(match.group(1)) if match else None
+
+
+def parse_review_count(title: str) -> Optional[int]:
+    """타이틀에서 리뷰 수 ("회사명 | 기업리뷰 328건, 평점")"""
+    match = REVIEW_COUNT_RE.search(title or "")
+    return int(match.group(1)) if match else None
+
+
+def find_address(page_text: str) -> Optional[str]:
+    """페이지 텍스트에서 주소 추출"""
+    for pattern in ADDRESS_PATTERNS:
+        match = pattern.search(page_text or "")
+        if match:
+            addr = match.group(1).strip()
+            if ADDRESS_CHECK_RE.search(addr):
+                return addr
+    return None
+
+
+def parse_avg_salary(page_text: str) -> Optional[int]:
+    """연봉 페이지 텍스트에서 평균 연봉 (만원)"""
+    match = AVG_SALARY_RE.search(page_text or "")
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+# ============================================================
+# 브라우저 (execute_script 한 번으로 필요한 값 수집)
+# ============================================================
+
+# 링크/평점/타이틀/주소 후보 줄을 한 번의 WebDriver 호출로 가져옴
+# (find_elements 후 요소마다 get_attribute/text를 부르면 링크 수만큼 왕복 발생)
+PAGE_SNAPSHOT_JS = r"""
+const companyRe = /\/companies\/\d+/;
+const sidoRe = /(서울|경기|부산|인천|대구|대전|광주|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)/;
+const links = [];
+let salaryUrl = null;
+for (const a of document.querySelectorAll('a[href]')) {
+    const href = a.href || '';
+    if (!salaryUrl && href.includes('/salaries')) salaryUrl = href;
+    if (companyRe.test(href)) {
+        const text = (a.innerText || '').trim();
+        if (text) links.push([text, href]);
+    }
+}
+const rate = document.querySelector('.rate_point');
+const bodyText = document.body ? document.body.innerText : '';
+return {
+    url: location.href,
+    title: document.title,
+    rating: rate ? rate.innerText.trim() : null,
+    links: links,
+    salaryUrl: salaryUrl,
+    addressLines: bodyText.split('\n').filter(line => sidoRe.test(line)),
+};
+"""
+
+BODY_TEXT_JS = "return document.body ? document.body.innerText : '';"
+
+
+def snapshot_page(driver) -> dict:
+    """현재 페이지의 링크/평점/타이틀/주소 후보 (WebDriver 호출 1회)"""
+    page = driver.execute_script(PAGE_SNAPSHOT_JS) or {}
+    page["links"] = [tuple(link) for link in page.get("links", [])]
+    return page
+
+
+def body_text(driver) -> str:
+    """현재 페이지 본문 텍스트 (WebDriver 호출 1회)"""
+    return driver.execute_script(BODY_TEXT_JS) or ""
+
+
+def parse_company_snapshot(page: dict) -> JobplanetData:
+    """snapshot_page 결과에서 회사 데이터 (연봉 제외)"""
+    data = JobplanetData(url=page.get("url"))
+    data.rating = parse_rating(page.get("rating") or "")
+
+    review_count = parse_review_count(page.get("title") or "")
+    if review_count is not None:
+        data.reviewCount = review_count
+
+    data.address = find_address("\n".join(page.get("addressLines", [])))
+    return data
+
+
+# ============================================================
+# HTML (lxml) 파싱
+# ============================================================
+
+def _parse_html(html: str):
+    from lxml import html as lxml_html
+
+    doc = lxml_html.fromstring(html)
+    # 화면에 보이지 않는 텍스트 제외 (브라우저의 .text와 비슷하게)
+    for elem in doc.xpath("//script | //style | //noscript"):
+        elem.drop_tree()
+    return doc
+
+
+def _body_text(doc) -> str:
+    body = doc.find("body")
+    root = body if body is not None else doc
+    lines = (line.strip() for line in root.text_content().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def parse_search_html(html: str, base_url: str) -> list[tuple[str, str]]:
+    """검색 결과 HTML에서 (회사명, 회사 URL) 후보 목록"""
+    doc = _parse_html(html)
+    candidates = []
+    for link in doc.xpath("//a[@href]"):
+        href = urljoin(base_url, link.get("href"))
+        text = " ".join(link.text_content().split())
+        if COMPANY_HREF_RE.search(href) and text:
+            candidates.append((text, href))
+    return candidates
+
+
+def parse_company_html(html: str, url: str) -> tuple[Optional[JobplanetData], Optional[str]]:
+    """
+    회사 페이지 HTML에서 (데이터, 연봉 페이지 URL)
+
+    평점도 리뷰 수도 찾지 못하면 클라이언트 렌더링 페이지로 보고 (None, None)
+    """
+    doc = _parse_html(html)
+    data = JobplanetData(url=url)
+
+    rating_elems = doc.xpath(
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' rate_point ')]"
+    )
+    if rating_elems:
+        data.rating = parse_rating(rating_elems[0].text_content().strip())
+
+    title = doc.findtext(".//title") or ""
+    review_count = parse_review_count(title)
+    if review_count is not None:
+        data.reviewCount = review_count
+
+    if data.rating is None and review_count is None:
+        return None, None
+
+    data.address = find_address(_body_text(doc))
+
+    salary_url = None
+    for link in doc.xpath("//a[@href]"):
+        href = urljoin(url, link.get("href"))
+        if "/salaries" in href:
+            salary_url = href
+            break
+
+    return data, salary_url
+
+
+def parse_salary_html(html: str) -> Optional[int]:
+    """연봉 페이지 HTML에서 평균 연봉"""
+    return parse_avg_salary(_body_text(_parse_html(html)))
+
+
+def parse_archived_pages(pages: dict[str, dict]) -> Optional[JobplanetData]:
+    """RawArchive에 보관한 회사/연봉 페이지 HTML에서 데이터 다시 추출"""
+    company = pages.get("company")
+    if not company:
+        return None
+
+    data, _ = parse_company_html(company["content"], company["url"])
+    if data is None:
+        return None
+
+    salary = pages.get("salary")
+    if salary:
+        data.avgSalary = parse_salary_html(salary["content"])
+    return data
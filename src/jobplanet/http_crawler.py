@@ -0,0 +1,200 @@
+"""잡플래닛 HTTP 크롤러 모듈 - 브라우저 렌더링 없이 HTML 직접 파싱"""
+import time
+from typing import Optional
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.jobplanet.crawler import JobplanetCrawler
+from src.jobplanet.extract import (
+    parse_search_html,
+    parse_company_html,
+    parse_salary_html,
+    parse_avg_salary,
+    body_text,
+)
+from src.models import JobplanetData
+from src.retry import DeadlineExceeded, raise_for_retry, request_timeout
+from src.utils import CandidateRanker, normalize_company_name
+
+
+class JobplanetHttpCrawler(JobplanetCrawler):
+    """
+    잡플래닛 HTTP 크롤러
+
+    Selenium으로 한 번 로그인한 뒤 쿠키를 requests 세션으로 옮겨
+    검색/회사/연봉 페이지를 HTML로 받아 lxml로 파싱합니다.
+    HTML에서 원하는 데이터를 찾지 못하면 기존 브라우저 방식으로 대체합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "ko-KR,ko;q=0.9",
+            }
+        )
+        self.http_stats = {"http": 0, "browser": 0}
+
+    def _copy_cookies(self):
+        """브라우저 쿠키를 requests 세션으로 복사"""
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+
+    def login(self) -> bool:
+        if not super().login():
+            return False
+        self._copy_cookies()
+        return True
+
+    def load_cookies(self, cookies: list[dict]) -> bool:
+        if not super().load_cookies(cookies):
+            return False
+        self._copy_cookies()
+        return True
+
+    def _get(self, url: str) -> requests.Response:
+        """GET 1회 (429/5xx는 RetryableStatus)"""
+        self.limiter.acquire()
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, timeout=request_timeout(10))
+        except requests.RequestException:
+            self.limiter.record(time.monotonic() - started, error=True)
+            raise
+        self.limiter.record(time.monotonic() - started, response.status_code)
+        raise_for_retry(response.status_code, response.headers)
+        return response
+
+    def _fetch(self, url: str) -> Optional[tuple[str, str]]:
+        """(최종 URL, HTML) - 실패하거나 로그인 페이지로 튕기면 None"""
+        response = self.retry.call(lambda: self._get(url), label=url)
+        if response.status_code != 200 or "sign_in" in response.url:
+            return None
+        return response.url, response.text
+
+    def _fetch_company(self, url: str) -> Optional[JobplanetData]:
+        """회사 페이지 + 연봉 페이지를 HTTP로 조회 (파싱 실패 시 None)"""
+        fetched = self._fetch(url)
+        if not fetched:
+            return None
+
+        final_url, html = fetched
+        data, salary_url = parse_company_html(html, final_url)
+        if data is None:
+            return None
+        self._capture("company", final_url, html)
+
+        if salary_url:
+            fetched = self._fetch(salary_url)
+            if fetched:
+                data.avgSalary = parse_salary_html(fetched[1])
+                self._capture("salary", fetched[0], fetched[1])
+            if data.avgSalary is None:
+                # 연봉 페이지만 브라우저로 다시 확인
+                data.avgSalary = self._browser_salary(salary_url)
+
+        return data
+
+    def _browser_salary(self, salary_url: str) -> Optional[int]:
+        """브라우저로 연봉 페이지 조회"""
+        try:
+            self._init_driver()
+            self.limiter.acquire()
+            self.driver.get(salary_url)
+            if self.archive:
+                self._capture("salary", salary_url, self.driver.page_source)
+            return parse_avg_salary(body_text(self.driver))
+        except Exception:
+            return None
+
+    def get_company_by_url(self, url: str) -> Optional[JobplanetData]:
+        """이미 알고 있는 URL로 회사 정보 조회 (HTTP 우선)"""
+        try:
+            data = self._fetch_company(url)
+            if data:
+                self.http_stats["http"] += 1
+                return data
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"  HTTP 조회 실패, 브라우저로 대체: {e}")
+
+        self.http_stats["browser"] += 1
+        return super().get_company_by_url(url)
+
+    def search_company(self, company_name: str, company=None) -> Optional[JobplanetData]:
+        """회사명으로 검색 (HTTP 우선, 후보를 못 찾으면 브라우저 검색)"""
+        ranker = CandidateRanker.for_company(company) if company else CandidateRanker(company_name)
+        normalized = normalize_company_name(company_name)
+        failed = []
+
+        for search_query in normalized['search_variants']:
+            def fetch():
+                fetched = self._fetch(f"{self.SEARCH_URL}{quote(search_query)}")
+                if not fetched:
+                    failed.append(search_query)
+                    return None
+                # 후보가 없으면 클라이언트 렌더링일 수 있으므로 결과 없음으로 캐시하지 않음
+                final_url, html = fetched
+                return parse_search_html(html, final_url) or None
+
+            try:
+                candidates = self.search_cache.get_or_fetch(search_query, fetch)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                print(f"  HTTP 검색 실패 ({search_query}): {e}")
+                failed.append(search_query)
+            if failed:
+                break
+
+            candidates = [tuple(c) for c in candidates or []]
+            self.remember(candidates)
+            if ranker.offer(search_query, candidates, name=lambda c: c[0]):
+                break
+
+        choice = None if failed else ranker.choice()
+        if choice:
+            self.search_stats.record(ranker)
+            company_url = choice[1]
+            try:
+                data = self._fetch_company(company_url)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                print(f"  HTTP 조회 실패 ({company_url}): {e}")
+                data = None
+
+            if data:
+                self.http_stats["http"] += 1
+                return data
+
+            # 회사 페이지 파싱 실패 → 이 URL만 브라우저로
+            self.http_stats["browser"] += 1
+            return super().get_company_by_url(company_url)
+
+        # HTML 검색 결과에서 찾지 못함 → 브라우저 검색 (클라이언트 렌더링 대비, 검색 수는 브라우저 쪽에서 집계)
+        self.http_stats["browser"] += 1
+        return super().search_company(company_name, company)
+
+    def crawl_companies(
+        self, companies: list, limit: Optional[int] = None, links: Optional[dict] = None
+    ):
+        results = super().crawl_companies(companies, limit=limit, links=links)
+        print(
+            f"  HTTP 처리 {self.http_stats['http']}회, "
+            f"브라우저 대체 {self.http_stats['browser']}회"
+        )
+        return results
@@ -0,0 +1,144 @@
+"""잡플래닛 병렬 크롤러 모듈 - 로그인 세션을 공유하는 여러 브라우저"""
+import queue
+import threading
+from typing import Optional
+
+from src.jobplanet.crawler import JobplanetCrawler
+from src.models import JobplanetData
+from src.pipeline.progress import ProgressTracker
+from src.pipeline.scheduler import RefreshScheduler
+from src.ratelimit import get_limiter
+from src.retry import LatencyStats
+from src.utils import SearchStats
+
+
+class JobplanetCrawlerPool:
+    """
+    잡플래닛 워커 풀
+
+    첫 번째 워커만 로그인하고, 나머지 워커는 그 쿠키를 받아 로그인을 생략합니다.
+    모든 워커는 하나의 큐에서 회사를 가져가고, 진행상황 추적기와
+    잡플래닛 호스트 속도 제한(get_limiter("jobplanet")), 회사별 처리 시간/검색 횟수 기록을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        headless: bool = True,
+        crawler_cls: type = JobplanetCrawler,
+    ):
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.crawler_cls = crawler_cls
+        self.progress = ProgressTracker("jobplanet")
+        self.limiter = get_limiter("jobplanet")
+        self.latency = LatencyStats("jobplanet")
+        self.search_stats = SearchStats("jobplanet")
+        self.crawlers: list[JobplanetCrawler] = []
+
+    def _new_crawler(self) -> JobplanetCrawler:
+        crawler = self.crawler_cls(
+            headless=self.headless,
+            progress=self.progress,
+            limiter=self.limiter,
+            latency=self.latency,
+            search_stats=self.search_stats,
+        )
+        self.crawlers.append(crawler)
+        return crawler
+
+    def _start_workers(self) -> list[JobplanetCrawler]:
+        """로그인 1회 후 쿠키를 나머지 워커에 복사"""
+        leader = self._new_crawler()
+        if not leader.login():
+            return []
+
+        cookies = leader.driver.get_cookies()
+        ready = [leader]
+        for idx in range(1, self.workers):
+            crawler = self._new_crawler()
+            if crawler.load_cookies(cookies):
+                ready.append(crawler)
+            else:
+                print(f"  [경고] 워커 {idx + 1} 시작 실패, 제외")
+
+        print(f"잡플래닛 워커 {len(ready)}개 준비 완료 (로그인 1회)")
+        return ready
+
+    def crawl_companies(
+        self, companies: list, limit: Optional[int] = None, links: Optional[dict] = None
+    ) -> dict[str, JobplanetData]:
+        """여러 회사 병렬 크롤링 (links: 연결 테이블의 회사 ID -> URL)"""
+        workers = self._start_workers()
+        if not workers:
+            return {}
+        for crawler in workers:
+            crawler.links = links or {}
+
+        results = {}
+        company_ids = [c.id for c in companies]
+        pending = RefreshScheduler(self.progress).select(company_ids, limit=limit)
+
+        by_id = {c.id: c for c in companies}
+        jobs = queue.Queue()
+        for company_id in pending:
+            if company_id in by_id:
+                jobs.put(by_id[company_id])
+
+        total = jobs.qsize()
+        counter = {"done": 0}
+        counter_lock = threading.Lock()
+        print(f"잡플래닛 병렬 크롤링 시작: {total}개 회사 (워커 {len(workers)}개)")
+
+        def run(worker_no: int, crawler: JobplanetCrawler):
+            while True:
+                try:
+                    company = jobs.get_nowait()
+                except queue.Empty:
+                    return
+
+                with counter_lock:
+                    counter["done"] += 1
+                    idx = counter["done"]
+                print(f"[w{worker_no} {idx}/{total}] {company.name}")
+                crawler.crawl_company(company, results)
+
+        threads = [
+            threading.Thread(target=run, args=(no, crawler), daemon=True)
+            for no, crawler in enumerate(workers, 1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.progress.get_stats()
+        print(f"\n잡플래닛 크롤링 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+
+        extract_times = [t for crawler in workers for t in crawler.extract_times]
+        if extract_times:
+            avg_ms = sum(extract_times) / len(extract_times) * 1000
+            print(f"  페이지 추출 평균 {avg_ms:.1f}ms ({len(extract_times)}회)")
+        print(f"  {workers[0].search_cache.summary()}")
+        print(f"  {self.search_stats.summary()}")
+        if workers[0].company_index:
+            print(f"  {workers[0].company_index.summary()}")
+        print(f"  {self.limiter.report()}")
+        print(f"  {self.latency.summary()}")
+        for no, crawler in enumerate(workers, 1):
+            if crawler.driver:
+                print(f"  w{no}: {crawler.driver.report()}")
+
+        return results
+
+    def close(self):
+        """모든 드라이버 종료"""
+        for crawler in self.crawlers:
+            crawler.close()
+        self.crawlers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,35 +1,243 @@
 """병무청 엑셀 다운로드 모듈"""
-import requests
+import hashlib
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
-from src.config import MMA_DOWNLOAD_URL, MMA_EXCEL_PATH
+import requests
 
+from src.config import (
+    MMA_DOWNLOAD_URL,
+    MMA_EXCEL_PATH,
+    MMA_PARTS_DIR,
+    MMA_MANIFEST_PATH,
+    MMA_REFRESH_HOURS,
+    MMA_DOWNLOAD_PARTITIONED,
+    MMA_DOWNLOAD_WORKERS,
+    MMA_DOWNLOAD_TIMEOUT,
+)
+from src.ratelimit import get_limiter
+from src.retry import RetryPolicy, raise_for_retry
 
-def download_all_companies(file_path: Path = MMA_EXCEL_PATH) -> Path:
-    """전국 병역지정업체 목록을 한 번에 다운로드합니다."""
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+# 병무청 검색 조건의 시/도 값 (.env의 MMA_SIDO_ADDRS=서울특별시,부산광역시,...로 재정의)
+SIDO_ADDRS = [
+    "서울특별시", "부산광역시", "대구광역시", "인천광역시", "광주광역시", "대전광역시",
+    "울산광역시", "세종특별자치시", "경기도", "강원도", "충청북도", "충청남도",
+    "전라북도", "전라남도", "경상북도", "경상남도", "제주특별자치도",
+]
+
+CHUNK_SIZE = 1 << 16
 
-    if file_path.exists():
-        print(f"[스킵] 이미 존재: {file_path}")
-        return file_path
 
-    # sido_addr를 비우면 전국 데이터
-    params = {
+def _params(sido_addr: str = "") -> dict:
+    """다운로드 요청 파라미터 (sido_addr를 비우면 전국 데이터)"""
+    return {
         "eopjong_gbcd": "1",
         "al_eopjong_gbcd": "11111",
         "eopjong_gbcd_list": "11111",
         "eopjong_cd": "11111",
-        "sido_addr": "",
+        "sido_addr": sido_addr,
     }
 
+
+def sido_addrs() -> list[str]:
+    """나눠 받을 시/도 목록"""
+    env = os.getenv("MMA_SIDO_ADDRS", "")
+    return [s.strip() for s in env.split(",") if s.strip()] or SIDO_ADDRS
+
+
+def load_manifest(path: Path = MMA_MANIFEST_PATH) -> dict:
+    """마지막 다운로드 정보 {mode, path, sha256, downloadedAt, parts}"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest: dict, path: Path = MMA_MANIFEST_PATH):
+    """다운로드 정보 저장 (임시 파일 → rename)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def excel_source() -> Path:
+    """파싱할 엑셀 (시/도별로 받았으면 폴더, 아니면 전국 파일)"""
+    manifest = load_manifest()
+    if manifest.get("mode") == "partitioned" and manifest.get("sha256"):
+        return Path(manifest["path"])
+    return MMA_EXCEL_PATH
+
+
+def _is_fresh(fetched_at: Optional[str]) -> bool:
+    if not fetched_at or MMA_REFRESH_HOURS <= 0:
+        return False
+    age = datetime.now() - datetime.fromisoformat(fetched_at)
+    return age < timedelta(hours=MMA_REFRESH_HOURS)
+
+
+def _stream_once(params: dict, path: Path, limiter) -> str:
+    """
+    POST 응답을 임시 파일로 조금씩 받은 뒤 rename (sha256 반환)
+
+    중간에 끊겨도 기존 파일은 그대로 남고, 메모리는 CHUNK_SIZE만 사용합니다.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    digest = hashlib.sha256()
+    limiter.acquire()
+    started = time.monotonic()
+    try:
+        response = requests.post(
+            MMA_DOWNLOAD_URL,
+            data=params,
+            stream=True,
+            timeout=(10, MMA_DOWNLOAD_TIMEOUT),
+        )
+    except requests.RequestException:
+        limiter.record(time.monotonic() - started, error=True)
+        raise
+
+    with response:
+        limiter.record(time.monotonic() - started, response.status_code)
+        raise_for_retry(response.status_code, response.headers)
+        response.raise_for_status()
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    return digest.hexdigest()
+
+
+def _stream(params: dict, path: Path, label: str) -> str:
+    return RetryPolicy().call(
+        lambda: _stream_once(params, path, get_limiter("mma")), label=label
+    )
+
+
+def _download_single(file_path: Path) -> dict:
+    """전국 데이터를 한 파일로 받기"""
     print("전국 병역지정업체 다운로드 중...")
-    response = requests.post(MMA_DOWNLOAD_URL, data=params, timeout=120)
-    response.raise_for_status()
+    sha256 = _stream(_params(), file_path, label="전국")
+    return {
+        "mode": "single",
+        "path": str(file_path),
+        "sha256": sha256,
+        "downloadedAt": datetime.now().isoformat(),
+    }
+
+
+def _download_partitioned(parts_dir: Path, manifest: dict) -> Optional[dict]:
+    """
+    시/도별로 나눠 동시에 받기
+
+    받은 시/도는 바로 기록하므로 중간에 실패해도 다시 실행하면
+    MMA_REFRESH_HOURS 안에 받은 시/도는 건너뛰고 나머지만 받습니다.
+    """
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    if manifest.get("mode") != "partitioned":
+        manifest = {"mode": "partitioned", "path": str(parts_dir), "parts": {}}
+    parts = manifest.setdefault("parts", {})
+    lock = threading.Lock()
+
+    def done(sido: str) -> bool:
+        fetched_at = parts.get(sido, {}).get("fetchedAt")
+        return _is_fresh(fetched_at) and (parts_dir / f"{sido}.xls").exists()
+
+    pending = [sido for sido in sido_addrs() if not done(sido)]
+    skipped = len(sido_addrs()) - len(pending)
+    print(
+        f"시/도별 병역지정업체 다운로드 중: {len(pending)}개 지역 "
+        f"(동시 {MMA_DOWNLOAD_WORKERS}개, 이어받기 {skipped}개)"
+    )
+
+    def fetch(sido: str) -> str:
+        return _stream(_params(sido), parts_dir / f"{sido}.xls", label=sido)
+
+    failed = []
+    with ThreadPoolExecutor(max(1, MMA_DOWNLOAD_WORKERS)) as pool:
+        futures = {pool.submit(fetch, sido): sido for sido in pending}
+        for future in as_completed(futures):
+            sido = futures[future]
+            try:
+                sha256 = future.result()
+            except Exception as e:
+                print(f"  [에러] {sido}: {e}")
+                failed.append(sido)
+                continue
+            size = (parts_dir / f"{sido}.xls").stat().st_size
+            print(f"  [완료] {sido} ({size / 1024:.0f}KB)")
+            with lock:
+                parts[sido] = {"sha256": sha256, "fetchedAt": datetime.now().isoformat()}
+                save_manifest({**manifest, "parts": parts})
+
+    if failed:
+        print(f"[에러] {len(failed)}개 지역 다운로드 실패: {', '.join(failed)} (다시 실행하면 이어받음)")
+        return None
+
+    # 지역 순서와 무관한 전체 해시
+    combined = hashlib.sha256()
+    for sido in sorted(sido_addrs()):
+        combined.update(f"{sido}:{parts[sido]['sha256']}\n".encode())
+    return {
+        "mode": "partitioned",
+        "path": str(parts_dir),
+        "sha256": combined.hexdigest(),
+        "downloadedAt": datetime.now().isoformat(),
+        "parts": parts,
+    }
+
+
+def download_all_companies(
+    file_path: Path = MMA_EXCEL_PATH,
+    partitioned: bool = MMA_DOWNLOAD_PARTITIONED,
+    force: bool = False,
+) -> tuple[Path, bool]:
+    """
+    병역지정업체 목록 다운로드
+
+    반환: (파싱할 경로, 내용이 바뀌었는지)
+    MMA_REFRESH_HOURS 안에 받은 적이 있으면 다시 받지 않고,
+    받은 내용의 해시가 이전과 같으면 바뀌지 않은 것으로 봅니다.
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest()
+    mode = "partitioned" if partitioned else "single"
+    source = Path(manifest.get("path") or file_path)
+
+    if (
+        not force
+        and manifest.get("mode") == mode
+        and manifest.get("sha256")
+        and source.exists()
+        and _is_fresh(manifest.get("downloadedAt"))
+    ):
+        print(f"[스킵] {MMA_REFRESH_HOURS:g}시간 안에 받음: {source}")
+        return source, False
 
-    with open(file_path, "wb") as f:
-        f.write(response.content)
+    if partitioned:
+        updated = _download_partitioned(MMA_PARTS_DIR, dict(manifest))
+        if updated is None:
+            return excel_source(), False
+    else:
+        updated = _download_single(file_path)
 
-    print(f"[완료] {file_path}")
-    return file_path
+    changed = updated["sha256"] != manifest.get("sha256")
+    save_manifest(updated)
+    source = Path(updated["path"])
+    if changed:
+        print(f"[완료] {source}")
+    else:
+        print(f"[완료] {source} (이전과 내용 같음)")
+    return source, changed
@@ -1,6 +1,7 @@
 """병무청 엑셀 파싱 모듈"""
 import re
 import hashlib
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional
@@ -15,6 +16,43 @@ def generate_company_id(name: str, address: str) -> str:
     return hashlib.md5(key.encode()).hexdigest()[:12]
 
 
+# 시/도 패턴 (앞의 대안부터 시도 - 기존 패턴 목록 순서 유지)
+_SIDO = re.compile(
+    r"^(서울|부산|대구|인천|광주|대전|울산|세종"
+    r"|경기|강원|충북|충남|전북|전남|경북|경남|제주"
+    r"|충청북도|충청남도|전라북도|전라남도|경상북도|경상남도"
+    r"|서울특별시|부산광역시|대구광역시|인천광역시|광주광역시|대전광역시|울산광역시|세종특별자치시"
+    r"|경기도|강원도|제주특별자치도|제주도)"
+)
+_SIDO_MAP = {
+    "서울특별시": "서울",
+    "부산광역시": "부산",
+    "대구광역시": "대구",
+    "인천광역시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "울산광역시": "울산",
+    "세종특별자치시": "세종",
+    "경기도": "경기",
+    "강원도": "강원",
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "제주특별자치도": "제주",
+    "제주도": "제주",
+}
+_SIGUNGU = re.compile(r"(?:시|도)\s*([가-힣]+(?:시|군|구))")
+# 광역시의 경우: "서울 강남구" 형태
+_METRO_GU = re.compile(r"(?:서울|부산|대구|인천|광주|대전|울산)\s*([가-힣]+구)")
+
+# 인원 정보 컬럼
+_QUOTA_FIELDS = ("activeQuota", "activeServing", "reserveQuota", "reserveServing")
+_TEXT_FIELDS = ("phone", "industry", "companySize", "mainProduct")
+
+
 def extract_region(address: str) -> tuple[Optional[str], Optional[str]]:
     """주소에서 시/도, 시/군/구 추출"""
     if not address:
@@ -23,77 +61,24 @@ def extract_region(address: str) -> tuple[Optional[str], Optional[str]]:
     # 정규화
     address = address.strip()
 
-    # 시/도 패턴
-    sido_patterns = [
-        r"^(서울|부산|대구|인천|광주|대전|울산|세종)",
-        r"^(경기|강원|충북|충남|전북|전남|경북|경남|제주)",
-        r"^(충청북도|충청남도|전라북도|전라남도|경상북도|경상남도)",
-        r"^(서울특별시|부산광역시|대구광역시|인천광역시|광주광역시|대전광역시|울산광역시|세종특별자치시)",
-        r"^(경기도|강원도|제주특별자치도|제주도)",
-    ]
-
     sido = None
-    for pattern in sido_patterns:
-        match = re.match(pattern, address)
-        if match:
-            sido = match.group(1)
-            # 정규화
-            sido_map = {
-                "서울특별시": "서울",
-                "부산광역시": "부산",
-                "대구광역시": "대구",
-                "인천광역시": "인천",
-                "광주광역시": "광주",
-                "대전광역시": "대전",
-                "울산광역시": "울산",
-                "세종특별자치시": "세종",
-                "경기도": "경기",
-                "강원도": "강원",
-                "충청북도": "충북",
-                "충청남도": "충남",
-                "전라북도": "전북",
-                "전라남도": "전남",
-                "경상북도": "경북",
-                "경상남도": "경남",
-                "제주특별자치도": "제주",
-                "제주도": "제주",
-            }
-            sido = sido_map.get(sido, sido)
-            break
+    match = _SIDO.match(address)
+    if match:
+        sido = _SIDO_MAP.get(match.group(1), match.group(1))
 
     # 시/군/구 추출
     sigungu = None
-    sigungu_match = re.search(r"(?:시|도)\s*([가-힣]+(?:시|군|구))", address)
+    sigungu_match = _SIGUNGU.search(address) or _METRO_GU.search(address)
     if sigungu_match:
         sigungu = sigungu_match.group(1)
-    else:
-        # 광역시의 경우: "서울 강남구" 형태
-        sigungu_match = re.search(r"(?:서울|부산|대구|인천|광주|대전|울산)\s*([가-힣]+구)", address)
-        if sigungu_match:
-            sigungu = sigungu_match.group(1)
 
     return sido, sigungu
 
 
-def parse_excel(file_path: Path = MMA_EXCEL_PATH) -> list[Company]:
-    """엑셀 파일을 파싱하여 Company 리스트로 변환"""
-    print(f"엑셀 파일 파싱 중: {file_path}")
-
-    # 엑셀 읽기 (HTML 형식인 경우도 처리)
-    try:
-        df = pd.read_excel(file_path, engine="xlrd")
-    except Exception:
-        # HTML 테이블로 저장된 경우
-        df = pd.read_html(str(file_path))[0]
-
-    print(f"총 {len(df)}개 행 로드됨")
-    print(f"컬럼: {df.columns.tolist()}")
-
-    companies = []
-
-    # 컬럼 매핑 (병무청 엑셀 형식)
+def map_columns(columns) -> dict:
+    """병무청 엑셀 컬럼명 → 필드명 매핑"""
     col_map = {}
-    for col in df.columns:
+    for col in columns:
         col_str = str(col)
         if "업체명" in col_str or "회사명" in col_str or "기업명" in col_str:
             col_map["name"] = col
@@ -111,8 +96,6 @@ def parse_excel(file_path: Path = MMA_EXCEL_PATH) -> list[Company]:
             col_map["industry"] = col
         elif "기업규모" in col_str or col_str == "규모":
             col_map["companySize"] = col
-        elif col_str == "지역":
-            col_map["region"] = col
         elif "주생산품" in col_str or "생산품" in col_str:
             col_map["mainProduct"] = col
         elif "현역" in col_str and "배정" in col_str:
@@ -123,90 +106,121 @@ def parse_excel(file_path: Path = MMA_EXCEL_PATH) -> list[Company]:
             col_map["reserveQuota"] = col
         elif "보충역" in col_str and "복무" in col_str:
             col_map["reserveServing"] = col
+    return col_map
 
-    print(f"컬럼 매핑: {col_map}")
 
-    # 필수 컬럼 확인
-    if "name" not in col_map:
-        # 첫 번째 컬럼을 이름으로 가정
-        col_map["name"] = df.columns[0]
+def _text(df: pd.DataFrame, col) -> pd.Series:
+    """str(값).strip() 컬럼 (없는 컬럼은 빈 문자열)"""
+    if col is None:
+        return pd.Series("", index=df.index, dtype=object)
+    # 빈 프레임이면 map 결과가 원래 dtype(float 등)으로 남아 .str을 못 씀
+    return df[col].map(str).astype(object).str.strip()
 
-    for idx, row in df.iterrows():
-        try:
-            name = str(row.get(col_map.get("name", ""), "")).strip()
-            if not name or name == "nan":
-                continue
-
-            address = str(row.get(col_map.get("address", ""), "")).strip()
-            if address == "nan":
-                address = ""
-
-            region = str(row.get(col_map.get("region", ""), "")).strip()
-            if region == "nan":
-                region = ""
-
-            # 시/도, 시/군/구 추출
-            sido, sigungu = extract_region(address or region)
-
-            # 선정년도
-            year_val = row.get(col_map.get("year", ""), None)
-            year = None
-            if pd.notna(year_val):
-                try:
-                    year = int(float(year_val))
-                except (ValueError, TypeError):
-                    pass
-
-            # 전화번호
-            phone = None
-            if "phone" in col_map:
-                phone_val = row.get(col_map["phone"], "")
-                if pd.notna(phone_val) and str(phone_val).strip() != "nan":
-                    phone = str(phone_val).strip()
-
-            # 업종
-            industry = None
-            if "industry" in col_map:
-                ind_val = row.get(col_map["industry"], "")
-                if pd.notna(ind_val) and str(ind_val).strip() != "nan":
-                    industry = str(ind_val).strip()
-
-            # 기업규모
-            company_size = None
-            if "companySize" in col_map:
-                size_val = row.get(col_map["companySize"], "")
-                if pd.notna(size_val) and str(size_val).strip() != "nan":
-                    company_size = str(size_val).strip()
-
-            # 주생산품
-            main_product = None
-            if "mainProduct" in col_map:
-                prod_val = row.get(col_map["mainProduct"], "")
-                if pd.notna(prod_val) and str(prod_val).strip() != "nan":
-                    main_product = str(prod_val).strip()
-
-            # 인원 정보
-            def safe_int(val):
-                try:
-                    return int(float(val or 0))
-                except (ValueError, TypeError):
-                    return 0
-
-            active_quota = safe_int(row.get(col_map.get("activeQuota", ""), 0))
-            active_serving = safe_int(row.get(col_map.get("activeServing", ""), 0))
-            reserve_quota = safe_int(row.get(col_map.get("reserveQuota", ""), 0))
-            reserve_serving = safe_int(row.get(col_map.get("reserveServing", ""), 0))
-
-            company = Company(
+
+def _to_list(series: pd.Series) -> list:
+    """결측값을 None으로 바꾼 파이썬 리스트"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _scalar_float(value) -> float:
+    """to_numeric이 읽지 못한 값은 float()로 (실패하면 NaN)"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def _to_float(series: pd.Series) -> np.ndarray:
+    """int(float(값))에 쓸 실수 배열 (변환 실패는 NaN)"""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    numeric = pd.to_numeric(series, errors="coerce")
+    # "1_000"처럼 float()만 읽는 문자열
+    retry = numeric.isna() & series.notna()
+    if retry.any():
+        numeric[retry] = series[retry].map(_scalar_float)
+    return numeric.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _to_int(values: np.ndarray) -> np.ndarray:
+    """NaN은 0, 소수점 아래는 버림"""
+    return np.where(np.isnan(values), 0, values).astype(np.int64)
+
+
+def frame_to_companies(df: pd.DataFrame, col_map: dict) -> list[Company]:
+    """
+    DataFrame → Company 리스트 (컬럼 단위 처리)
+
+    정리/정수 변환/지역 추출을 컬럼 전체에 한 번씩 적용하고
+    마지막에 한 번 돌면서 Company/MmaData를 만듭니다.
+    """
+    names = _text(df, col_map["name"])
+    keep = (names != "") & (names != "nan")
+    df = df[keep]
+    names = names[keep]
+
+    addresses = _text(df, col_map.get("address")).replace("nan", "")
+    regions = _text(df, col_map.get("region")).replace("nan", "")
+
+    # 시/도, 시/군/구 추출 (주소가 없으면 지역)
+    keys = addresses.where(addresses != "", regions)
+    sidos = keys.str.extract(_SIDO.pattern)[0].replace(_SIDO_MAP)
+    sigungus = keys.str.extract(_SIGUNGU.pattern)[0]
+    sigungus = sigungus.fillna(keys.str.extract(_METRO_GU.pattern)[0])
+    region_values = regions.where(regions != "", sidos)
+
+    texts = {}
+    for field in _TEXT_FIELDS:
+        if field not in col_map:
+            texts[field] = [None] * len(df)
+            continue
+        values = _text(df, col_map[field])
+        texts[field] = _to_list(values.where(df[col_map[field]].notna() & (values != "nan")))
+
+    numbers = {
+        field: _to_float(df[col_map[field]]) if field in col_map else np.zeros(len(df))
+        for field in ("year",) + _QUOTA_FIELDS
+    }
+    if "year" not in col_map:
+        numbers["year"] = np.full(len(df), np.nan)
+
+    # int()로 바꿀 수 없는 무한대 값이 있는 행은 기존처럼 건너뜀
+    infinite = np.zeros(len(df), dtype=bool)
+    for values in numbers.values():
+        infinite |= np.isinf(values)
+    for idx in df.index[infinite]:
+        print(f"행 {idx} 파싱 오류: 무한대 값은 정수로 바꿀 수 없음")
+    for field, values in numbers.items():
+        numbers[field] = np.where(infinite, 0, values)
+
+    year_values = [None if year != year else int(year) for year in numbers["year"].tolist()]
+    quotas = {field: _to_int(numbers[field]).tolist() for field in _QUOTA_FIELDS}
+
+    companies = []
+    for (
+        skip, name, address, region, sido, sigungu, year,
+        phone, industry, company_size, main_product,
+        active_quota, active_serving, reserve_quota, reserve_serving,
+    ) in zip(
+        infinite.tolist(), names.tolist(), addresses.tolist(), _to_list(region_values),
+        _to_list(sidos), _to_list(sigungus), year_values,
+        texts["phone"], texts["industry"], texts["companySize"], texts["mainProduct"],
+        quotas["activeQuota"], quotas["activeServing"],
+        quotas["reserveQuota"], quotas["reserveServing"],
+    ):
+        if skip:
+            continue
+        companies.append(
+            Company(
                 id=generate_company_id(name, address),
                 name=name,
                 sido=sido,
                 sigungu=sigungu,
-                address=address if address else None,
+                address=address or None,
                 mma=MmaData(
                     selectedYear=year,
-                    address=address if address else None,
-                    region=region if region else sido,
+                    address=address or None,
+                    region=region,
                     phone=phone,
                     industry=industry,
                     companySize=company_size,
@@ -217,12 +231,70 @@ def parse_excel(file_path: Path = MMA_EXCEL_PATH) -> list[Company]:
                     activeServing=active_serving,
                 ),
             )
-            companies.append(company)
+        )
+    return companies
 
-        except Exception as e:
-            print(f"행 {idx} 파싱 오류: {e}")
+
+def read_excel(file_path: Path) -> pd.DataFrame:
+    """엑셀 읽기 (HTML 형식인 경우도 처리, 폴더면 시/도별 파일을 이어 붙임)"""
+    file_path = Path(file_path)
+    if file_path.is_dir():
+        return _read_parts(sorted(file_path.glob("*.xls")))
+    try:
+        return pd.read_excel(file_path, engine="xlrd")
+    except Exception:
+        # HTML 테이블로 저장된 경우
+        return pd.read_html(str(file_path))[0]
+
+
+def _has_no_table(path: Path) -> bool:
+    """업체가 없는 지역 파일인지 (빈 파일, 또는 표가 없는 HTML)"""
+    head = path.read_bytes()
+    if not head.strip():
+        return True
+    text = head.decode("utf-8", errors="ignore").lstrip("\ufeff \r\n\t").lower()
+    return text.startswith("<") and "<table" not in text
+
+
+def _read_parts(paths: list[Path]) -> pd.DataFrame:
+    """
+    시/도별로 나눠 받은 엑셀 합치기 (업체가 없는 지역은 건너뜀)
+
+    그 밖의 읽기 실패는 예외로 중단합니다. 한 지역이 빠진 채 저장하면 스냅샷 비교에서
+    그 지역 회사가 모두 삭제로 기록되기 때문입니다.
+    """
+    frames = []
+    for path in paths:
+        if _has_no_table(path):
+            print(f"  [스킵] {path.name}: 업체 없음")
             continue
+        try:
+            frames.append(read_excel(path))
+        except Exception as e:
+            raise ValueError(f"{path.name} 읽기 실패 (다시 다운로드하세요): {e}") from e
+    if not frames:
+        raise ValueError(f"읽을 수 있는 엑셀이 없습니다: {paths[0].parent if paths else ''}")
+    return pd.concat(frames, ignore_index=True)
+
+
+def parse_excel(file_path: Path = MMA_EXCEL_PATH) -> list[Company]:
+    """엑셀 파일을 파싱하여 Company 리스트로 변환"""
+    print(f"엑셀 파일 파싱 중: {file_path}")
+
+    df = read_excel(file_path)
+    print(f"총 {len(df)}개 행 로드됨")
+    print(f"컬럼: {df.columns.tolist()}")
+
+    # 컬럼 매핑 (병무청 엑셀 형식)
+    col_map = map_columns(df.columns)
+    print(f"컬럼 매핑: {col_map}")
+
+    # 필수 컬럼 확인
+    if "name" not in col_map:
+        # 첫 번째 컬럼을 이름으로 가정
+        col_map["name"] = df.columns[0]
 
+    companies = frame_to_companies(df, col_map)
     print(f"파싱 완료: {len(companies)}개 회사")
     return companies
 
@@ -0,0 +1,255 @@
+"""병무청 목록 스냅샷 모듈 - 파싱할 때마다 이전 목록과 비교해 회사 ID 유지"""
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.config import MMA_SNAPSHOT_DIR, MMA_SNAPSHOT_KEEP, MMA_CHANGES_PATH
+from src.geocoding.address import canonical_address
+from src.models import Company
+from src.mma.parser import generate_company_id
+from src.utils import normalize_company_name
+
+QUOTA_FIELDS = ("activeQuota", "activeServing", "reserveQuota", "reserveServing")
+# 회사명이 바뀌면 다시 검색해야 하는 소스
+RENAME_SOURCES = ("jobplanet", "wanted")
+
+
+def name_key(name: str) -> str:
+    """비교용 회사명 ((주)/주식회사/영문명/공백 제거)"""
+    return re.sub(r"\s+", "", normalize_company_name(name)["korean"]).lower()
+
+
+def snapshot_record(company: Company) -> dict:
+    """스냅샷에 남길 병무청 필드"""
+    mma = company.mma
+    record = {
+        "id": company.id,
+        "name": company.name,
+        # 병합 후 회사 주소는 원티드/잡플래닛 주소일 수 있으므로 병무청 주소 기준
+        "address": (mma.address if mma else company.address) or "",
+        "sido": company.sido,
+        "phone": mma.phone if mma else None,
+        "industry": mma.industry if mma else None,
+    }
+    for field in QUOTA_FIELDS:
+        record[field] = getattr(mma, field, 0) if mma else 0
+    return record
+
+
+class _Entry:
+    """비교용 키를 미리 계산한 스냅샷 레코드"""
+
+    __slots__ = ("record", "key", "address", "phone", "matched")
+
+    def __init__(self, record: dict):
+        self.record = record
+        self.key = name_key(record["name"])
+        self.address = canonical_address(record["address"])
+        self.phone = re.sub(r"\D", "", record.get("phone") or "")
+        self.matched = False
+
+    def field(self, name: str) -> Optional[str]:
+        if name == "address":
+            return self.address
+        if name == "phone":
+            return self.phone
+        return self.record.get(name)
+
+
+def _pick(entry: _Entry, candidates: list[_Entry]) -> Optional[_Entry]:
+    """같은 이름 후보가 여럿이면 주소 → 전화 → 시/도 → 업종 순으로 좁힘 (하나로 안 좁혀지면 None)"""
+    for name in ("address", "phone", "sido", "industry"):
+        if len(candidates) == 1:
+            break
+        value = entry.field(name)
+        narrowed = [c for c in candidates if value and c.field(name) == value]
+        if narrowed:
+            candidates = narrowed
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def diff_companies(companies: list[Company], previous: list[dict]) -> dict:
+    """
+    이전 스냅샷과 비교해 회사 ID를 이어받고 변경 내역 반환
+
+    1. 회사명 + 주소가 같으면 같은 회사
+    2. 정규화한 회사명이 같으면 같은 회사 (여럿이면 주소/전화/시도/업종으로 구분)
+    3. 주소 + 전화번호가 같으면 이름만 바뀐 회사
+    나머지는 추가/삭제. 이어받은 회사는 company.id를 이전 ID로 바꿉니다.
+    """
+    old = [_Entry(record) for record in previous]
+    new = [_Entry(snapshot_record(c)) for c in companies]
+    pairs: list[tuple[Company, _Entry, _Entry]] = []
+
+    def match(company: Company, entry: _Entry, prev: _Entry):
+        prev.matched = entry.matched = True
+        pairs.append((company, entry, prev))
+
+    exact: dict[tuple[str, str], list[_Entry]] = {}
+    for prev in old:
+        exact.setdefault((prev.record["name"], prev.record["address"]), []).append(prev)
+    for company, entry in zip(companies, new):
+        same = exact.get((entry.record["name"], entry.record["address"]))
+        if same:
+            match(company, entry, same.pop(0))
+
+    by_name: dict[str, list[_Entry]] = {}
+    by_place: dict[tuple[str, str], list[_Entry]] = {}
+    for prev in old:
+        if prev.matched:
+            continue
+        by_name.setdefault(prev.key, []).append(prev)
+        if prev.address and prev.phone:
+            by_place.setdefault((prev.address, prev.phone), []).append(prev)
+
+    for company, entry in zip(companies, new):
+        if entry.matched or not entry.key:
+            continue
+        candidates = [c for c in by_name.get(entry.key, []) if not c.matched]
+        prev = _pick(entry, candidates) if candidates else None
+        if prev:
+            match(company, entry, prev)
+
+    for company, entry in zip(companies, new):
+        if entry.matched or not (entry.address and entry.phone):
+            continue
+        candidates = [c for c in by_place.get((entry.address, entry.phone), []) if not c.matched]
+        if len(candidates) == 1:
+            match(company, entry, candidates[0])
+
+    diff = {"added": [], "removed": [], "renamed": [], "moved": [], "quotaChanged": []}
+    used = set()
+    for company, entry, prev in pairs:
+        company.id = prev.record["id"]
+        used.add(company.id)
+        # (주)/주식회사 표기만 바뀐 경우는 검색어가 같으므로 제외
+        if entry.key != prev.key:
+            diff["renamed"].append(
+                {"id": company.id, "from": prev.record["name"], "to": entry.record["name"]}
+            )
+        if entry.address != prev.address:
+            diff["moved"].append(
+                {"id": company.id, "from": prev.record["address"], "to": entry.record["address"]}
+            )
+        quotas = {
+            f: entry.record[f] for f in QUOTA_FIELDS if entry.record[f] != prev.record.get(f, 0)
+        }
+        if quotas:
+            diff["quotaChanged"].append(
+                {
+                    "id": company.id,
+                    "from": {f: prev.record.get(f, 0) for f in quotas},
+                    "to": quotas,
+                }
+            )
+
+    for company, entry in zip(companies, new):
+        if entry.matched:
+            continue
+        # 이사 간 회사의 이전 ID와 겹치지 않도록
+        address = entry.record["address"]
+        company.id = generate_company_id(company.name, address)
+        suffix = 2
+        while company.id in used:
+            company.id = generate_company_id(company.name, f"{address}#{suffix}")
+            suffix += 1
+        used.add(company.id)
+        diff["added"].append(company.id)
+
+    diff["removed"] = [prev.record["id"] for prev in old if not prev.matched]
+    return diff
+
+
+def latest_snapshot(snapshot_dir: Path = MMA_SNAPSHOT_DIR) -> Optional[Path]:
+    """가장 최근 스냅샷 파일"""
+    snapshots = sorted(Path(snapshot_dir).glob("*.json"))
+    return snapshots[-1] if snapshots else None
+
+
+def _write_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def save_snapshot(companies: list[Company], snapshot_dir: Path = MMA_SNAPSHOT_DIR) -> Path:
+    """스냅샷 저장 후 최근 MMA_SNAPSHOT_KEEP개만 남김"""
+    path = Path(snapshot_dir) / f"{datetime.now():%Y%m%d-%H%M%S-%f}.json"
+    _write_json(path, {
+        "createdAt": datetime.now().isoformat(),
+        "companies": [snapshot_record(c) for c in companies],
+    })
+    for old in sorted(Path(snapshot_dir).glob("*.json"))[:-MMA_SNAPSHOT_KEEP]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def load_changes(path: Path = MMA_CHANGES_PATH) -> list[dict]:
+    """저장된 변경 내역 (오래된 순)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("changes", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def changed_ids(source: str, path: Path = MMA_CHANGES_PATH) -> dict[str, datetime]:
+    """source에서 다시 수집해야 하는 회사 ID → 변경 시각 (이 시각 이후 수집했으면 처리 완료)"""
+    if source not in RENAME_SOURCES:
+        return {}
+    changed = {}
+    for change in load_changes(path):
+        created_at = datetime.fromisoformat(change["createdAt"])
+        for renamed in change.get("renamed", []):
+            changed[renamed["id"]] = created_at
+    return changed
+
+
+def apply_snapshot(
+    companies: list[Company], fallback: Optional[list[Company]] = None
+) -> Optional[dict]:
+    """
+    파싱 결과를 직전 스냅샷(없으면 fallback - 기존 companies.json)과 비교
+
+    회사 ID를 이어받고, 변경이 있으면 스냅샷과 변경 내역을 저장합니다.
+    비교할 이전 목록이 없으면 스냅샷만 저장하고 None을 반환합니다.
+    """
+    previous_path = latest_snapshot()
+    if previous_path:
+        with open(previous_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)["companies"]
+        label = previous_path.name
+    elif fallback:
+        previous = [snapshot_record(c) for c in fallback]
+        label = "companies.json"
+    else:
+        save_snapshot(companies)
+        print(f"스냅샷 저장: {len(companies)}개 회사 (비교할 이전 목록 없음)")
+        return None
+
+    diff = diff_companies(companies, previous)
+    print(
+        f"이전 목록({label})과 비교: 추가 {len(diff['added'])}, 삭제 {len(diff['removed'])}, "
+        f"이름 변경 {len(diff['renamed'])}, 주소 변경 {len(diff['moved'])}, "
+        f"인원 변경 {len(diff['quotaChanged'])}"
+    )
+    if previous_path and not any(diff.values()):
+        return diff
+
+    snapshot_path = save_snapshot(companies)
+    changes = load_changes()
+    changes.append({
+        "createdAt": datetime.now().isoformat(),
+        "previous": label,
+        "snapshot": snapshot_path.name,
+        **diff,
+    })
+    _write_json(MMA_CHANGES_PATH, {"changes": changes[-MMA_SNAPSHOT_KEEP:]})
+    if diff["renamed"]:
+        print(f"  이름이 바뀐 {len(diff['renamed'])}개 회사는 잡플래닛/원티드에서 다시 검색합니다.")
+    return diff
@@ -59,6 +59,7 @@ class Company:
     address: Optional[str] = None  # 최종 주소 (우선순위 적용)
     lat: Optional[float] = None  # 위도
     lng: Optional[float] = None  # 경도
+    geoPrecision: Optional[str] = None  # 좌표 정확도 (building/road/dong/sigungu/sido)
     mma: Optional[MmaData] = None  # 병무청 데이터
     jobplanet: Optional[JobplanetData] = None  # 잡플래닛 데이터
     wanted: Optional[WantedData] = None  # 원티드 데이터
@@ -73,6 +74,7 @@ class Company:
             "address": self.address,
             "lat": self.lat,
             "lng": self.lng,
+            "geoPrecision": self.geoPrecision,
         }
 
         if self.mma:
@@ -120,6 +122,7 @@ class Company:
             address=data.get("address"),
             lat=data.get("lat"),
             lng=data.get("lng"),
+            geoPrecision=data.get("geoPrecision"),
             mma=mma,
             jobplanet=jobplanet,
             wanted=wanted,
@@ -0,0 +1,113 @@
+"""크롤링 원본 저장소 모듈 - 추출 로직을 고친 뒤 재크롤링 없이 다시 파싱하기 위한 원본 보관"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.config import RAW_DIR, RAW_ARCHIVE
+
+
+class RawArchive:
+    """
+    크롤러가 받은 원본 HTML/JSON 저장소
+
+    objects/{해시}.gz          - gzip 압축 원본 (같은 내용은 한 번만 저장)
+    {source}.index.jsonl       - 회사별 수집 기록 (한 줄 = 회사 하나 수집)
+        {"companyId", "ts", "pages": {종류: {"url", "hash"}}}
+
+    같은 회사가 여러 번 기록되면 마지막 줄이 최신입니다.
+    """
+
+    # 워커 스레드들이 같은 index 파일에 줄을 추가할 때 보호
+    _lock = threading.Lock()
+
+    def __init__(self, source: str, raw_dir: Path = RAW_DIR):
+        self.source = source
+        self.raw_dir = Path(raw_dir)
+        self.index_path = self.raw_dir / f"{source}.index.jsonl"
+        (self.raw_dir / "objects").mkdir(parents=True, exist_ok=True)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.raw_dir / "objects" / digest[:2] / f"{digest}.gz"
+
+    def put(self, content: str) -> str:
+        """원본 저장 후 해시 반환 (이미 있으면 저장 생략)"""
+        raw = content.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(raw))
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> str:
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def record(self, company_id: str, pages: dict[str, dict]):
+        """
+        회사 하나의 수집 원본 기록
+
+        Args:
+            pages: {종류: {"url": URL, "content": 원본 문자열}}
+        """
+        if not pages:
+            return
+
+        line = {
+            "companyId": company_id,
+            "ts": datetime.now().isoformat(),
+            "pages": {
+                kind: {"url": page.get("url"), "hash": self.put(page["content"])}
+                for kind, page in pages.items()
+            },
+        }
+        with self._lock:
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    def latest(self) -> dict[str, dict]:
+        """회사별 최신 수집 기록 {company_id: 기록}"""
+        captures = {}
+        if not self.index_path.exists():
+            return captures
+
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    capture = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중간에 끊긴 줄
+                captures[capture["companyId"]] = capture
+        return captures
+
+    def load_pages(self, capture: dict) -> dict[str, dict]:
+        """기록의 원본 내용 {종류: {"url", "content"}} (없는 원본은 제외)"""
+        pages = {}
+        for kind, page in capture.get("pages", {}).items():
+            try:
+                pages[kind] = {"url": page.get("url"), "content": self.get(page["hash"])}
+            except OSError:
+                continue
+        return pages
+
+    def get_stats(self) -> dict:
+        captures = self.latest()
+        objects = list((self.raw_dir / "objects").glob("*/*.gz"))
+        return {
+            "companies": len(captures),
+            "objects": len(objects),
+            "bytes": sum(p.stat().st_size for p in objects),
+        }
+
+
+def new_archive(source: str) -> Optional[RawArchive]:
+    """RAW_ARCHIVE 설정이 켜져 있으면 저장소 생성"""
+    return RawArchive(source) if RAW_ARCHIVE else None
@@ -3,13 +3,18 @@ import json
 from pathlib import Path
 from typing import Optional
 
-from src.config import OUTPUT_FILE, DATA_DIR
+from src.config import OUTPUT_FILE, DATA_DIR, STORAGE_BACKEND
+from src.geocoding.gazetteer import is_usable_coords
 from src.models import Company, JobplanetData, WantedData, create_output_data
 from src.pipeline.progress import ProgressTracker
+from src.pipeline.store import SqliteStore
 
 
 def load_companies(file_path: Path = OUTPUT_FILE) -> list[Company]:
-    """JSON 파일에서 회사 목록 로드"""
+    """JSON 파일(또는 SQLite)에서 회사 목록 로드"""
+    if STORAGE_BACKEND == "sqlite":
+        return SqliteStore.open().load_companies()
+
     if not file_path.exists():
         return []
 
@@ -20,7 +25,14 @@ def load_companies(file_path: Path = OUTPUT_FILE) -> list[Company]:
 
 
 def save_companies(companies: list[Company], file_path: Path = OUTPUT_FILE):
-    """회사 목록을 JSON 파일로 저장"""
+    """회사 목록을 JSON 파일로 저장 (sqlite 모드면 DB 저장 후 map.html용 JSON 내보내기)"""
+    if STORAGE_BACKEND == "sqlite":
+        store = SqliteStore.open()
+        store.save_companies(companies)
+        store.export_json(file_path)
+        print(f"저장 완료: {store.db_path}, {file_path} ({len(companies)}개 회사)")
+        return
+
     file_path.parent.mkdir(parents=True, exist_ok=True)
     data = create_output_data(companies)
 
@@ -32,10 +44,10 @@ def save_companies(companies: list[Company], file_path: Path = OUTPUT_FILE):
 
 def merge_jobplanet_data(companies: list[Company]) -> list[Company]:
     """잡플래닛 진행상황에서 데이터 병합"""
-    progress = ProgressTracker("jobplanet")
+    results = ProgressTracker("jobplanet").get_results()
 
     for company in companies:
-        result = progress.get_result(company.id)
+        result = results.get(company.id)
         # URL이나 rating이나 avgSalary 중 하나라도 있으면 병합
         if result and (result.get("url") or result.get("rating") or result.get("avgSalary")):
             company.jobplanet = JobplanetData(
@@ -51,10 +63,10 @@ def merge_jobplanet_data(companies: list[Company]) -> list[Company]:
 
 def merge_wanted_data(companies: list[Company]) -> list[Company]:
     """원티드 진행상황에서 데이터 병합"""
-    progress = ProgressTracker("wanted")
+    results = ProgressTracker("wanted").get_results()
 
     for company in companies:
-        result = progress.get_result(company.id)
+        result = results.get(company.id)
         if result:
             company.wanted = WantedData(
                 isHiring=result.get("isHiring", False),
@@ -75,13 +87,19 @@ def merge_wanted_data(companies: list[Company]) -> list[Company]:
 
 def merge_geocode_data(companies: list[Company]) -> list[Company]:
     """Geocoding 진행상황에서 좌표 병합"""
-    progress = ProgressTracker("geocode")
+    results = ProgressTracker("geocode").get_results()
 
     for company in companies:
-        result = progress.get_result(company.id)
-        if result and result.get("lat"):
+        result = results.get(company.id)
+        if result and result.get("lat") and is_usable_coords(result):
             company.lat = result["lat"]
             company.lng = result["lng"]
+            company.geoPrecision = result.get("precision") or "building"
+        elif result and (result.get("address") or result.get("lat")):
+            # 바뀐 주소의 좌표를 못 구함, 또는 시/도청 같은 너무 대략적인 좌표 → 쓰지 않음
+            company.lat = None
+            company.lng = None
+            company.geoPrecision = None
 
     return companies
 
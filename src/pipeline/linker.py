@@ -0,0 +1,339 @@
+"""회사 연결 모듈 - 병무청 회사와 잡플래닛/원티드 회사 목록을 한 번에 매칭해 연결 테이블 생성"""
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config import LINKS_PATH, LINK_ACCEPT_SCORE, LINK_MAX_BLOCK_PAIRS, MATCH_MIN_SCORE
+from src.mma.parser import extract_region
+from src.models import Company
+from src.utils import normalize_company_name
+
+# 목록 파일에 URL 대신 플랫폼 회사 ID만 있을 때
+PLATFORM_URLS = {
+    "jobplanet": "https://www.jobplanet.co.kr/companies/{}",
+    "wanted": "https://www.wanted.co.kr/company/{}",
+}
+# 목록 파일 컬럼 별칭
+RECORD_COLUMNS = {
+    "name": ("name", "companyName", "company_name", "회사명", "업체명"),
+    "url": ("url", "link"),
+    "id": ("id", "companyId", "company_id"),
+    "region": ("address", "region", "location", "full_location", "주소"),
+    "phone": ("phone", "tel", "전화번호"),
+    "english": ("english", "englishName", "english_name", "영문명"),
+    "foundedYear": ("foundedYear", "founded_year", "설립연도"),
+}
+LINK_COLUMNS = ["platform", "companyId", "name", "url", "score", "block"]
+BLOCK_LABELS = {"t": "전화", "e": "영문명", "s": "시도+이름", "p": "이름"}
+
+MAX_GRAMS = 24  # 회사명 bigram 최대 개수 (넘으면 앞부분만 비교)
+CHUNK_CELLS = 1 << 25  # 한 번에 비교할 (쌍 × bigram × bigram) 수
+# 시도가 다르면 깎는 점수 - 검색어 없이 목록끼리 비교하므로 같은 이름의 다른 지역 회사는
+# 이름이 완전히 같아도 LINK_ACCEPT_SCORE 아래로 (본사/사업장 주소가 달라 생기는 경우는 점수만 기록)
+REGION_MISMATCH = 0.2
+
+
+def _text(values) -> pd.Series:
+    """None/NaN → 빈 문자열, 앞뒤 공백 제거"""
+    series = pd.Series(values, dtype=object)
+    return series.where(series.notna(), "").map(str).str.strip()
+
+
+def prepare_records(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    비교용 컬럼 계산
+
+    입력: name, (sido, sigungu 또는 region), phone, english, foundedYear 컬럼 (name 외에는 선택)
+    출력: key(정규화 회사명, 공백 제거), english, phone(숫자만), sido, sigungu, year
+    """
+    out = df.reset_index(drop=True).copy()
+    normalized = [normalize_company_name(name) for name in _text(out["name"]).tolist()]
+    out["key"] = [n["korean"].replace(" ", "").lower() for n in normalized]
+
+    english = pd.Series([(n["english"] or "").lower() for n in normalized])
+    if "english" in out:
+        given = _text(out["english"]).str.lower()
+        english = given.where(given != "", english)
+    out["english"] = english
+
+    out["phone"] = _text(out["phone"]).str.replace(r"\D", "", regex=True) if "phone" in out else ""
+    if "sido" not in out:
+        regions = [extract_region(r) for r in _text(out["region"]).tolist()] if "region" in out else None
+        out["sido"] = [sido for sido, _ in regions] if regions else ""
+        out["sigungu"] = [sigungu for _, sigungu in regions] if regions else ""
+    out["sido"] = _text(out["sido"])
+    out["sigungu"] = _text(out["sigungu"]) if "sigungu" in out else ""
+    out["year"] = (
+        pd.to_numeric(out["foundedYear"], errors="coerce").astype(float)
+        if "foundedYear" in out else np.nan
+    )
+    return out
+
+
+def company_frame(companies: list[Company]) -> pd.DataFrame:
+    """병무청 회사 목록 → 비교용 DataFrame"""
+    return prepare_records(pd.DataFrame({
+        "id": [c.id for c in companies],
+        "name": [c.name for c in companies],
+        "sido": [c.sido for c in companies],
+        "sigungu": [c.sigungu for c in companies],
+        "phone": [c.mma.phone if c.mma else None for c in companies],
+        "foundedYear": [c.wanted.foundedYear if c.wanted else None for c in companies],
+    }))
+
+
+def read_records(path: Path, platform: str) -> list[dict]:
+    """
+    플랫폼 회사 목록 파일 (CSV 또는 JSON 목록/{"companies": [...]})
+
+    회사명과 URL(또는 플랫폼 회사 ID) 컬럼이 필요하고, 주소/전화/영문명/설립연도는 있으면 사용합니다.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        df = pd.DataFrame(data.get("companies", []) if isinstance(data, dict) else data)
+    else:
+        df = pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+
+    columns = {}
+    for field, aliases in RECORD_COLUMNS.items():
+        found = next((a for a in aliases if a in df.columns), None)
+        if found:
+            columns[field] = df[found]
+    if "name" not in columns or not ("url" in columns or "id" in columns):
+        raise ValueError(f"회사명과 url(또는 id) 컬럼이 필요합니다: {path}")
+
+    records = pd.DataFrame(columns)
+    if "id" in records:
+        ids = _text(records.pop("id"))
+        urls = ids.map(lambda i: PLATFORM_URLS[platform].format(i) if i else "")
+        if "url" in records:
+            given = _text(records["url"])
+            urls = given.where(given != "", urls)
+        records["url"] = urls
+    records = records[_text(records["url"]).ne("").to_numpy()]
+    records = records.astype(object).where(records.notna(), None)
+    return records.to_dict("records")
+
+
+def _block_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    행별 블로킹 키 (row, block) - 같은 키를 가진 행끼리만 비교
+
+    t: 전화번호, e: 영문명, s: 시도 + 회사명 앞 2글자, p: 회사명 앞 3글자 (지역 정보가 없는 쪽 대비)
+    """
+    rows = np.arange(len(df))
+    key = df["key"]
+    parts = [
+        ("t:" + df["phone"], df["phone"].str.len() >= 9),
+        ("e:" + df["english"], df["english"] != ""),
+        ("s:" + df["sido"] + ":" + key.str[:2], (df["sido"] != "") & (key != "")),
+        ("p:" + key.str[:3], key != ""),
+    ]
+    return pd.concat(
+        [pd.DataFrame({"row": rows[mask.values], "block": block[mask].values}) for block, mask in parts],
+        ignore_index=True,
+    )
+
+
+def candidate_pairs(
+    left: pd.DataFrame, right: pd.DataFrame, max_block_pairs: int = LINK_MAX_BLOCK_PAIRS
+) -> tuple[pd.DataFrame, int]:
+    """
+    블로킹 키가 하나라도 같은 (l, r, block) 쌍 (중복 제거, 전화 → 영문명 → 시도 → 이름 순으로 block 표시)
+
+    한 블록의 쌍이 max_block_pairs보다 많으면 (흔한 이름 앞글자 등) 그 블록은 생략하고 수를 반환합니다.
+    """
+    lk = _block_keys(left)
+    rk = _block_keys(right)
+    sizes = lk["block"].value_counts().to_frame("l").join(
+        rk["block"].value_counts().rename("r"), how="inner"
+    )
+    oversized = sizes.index[sizes["l"] * sizes["r"] > max_block_pairs]
+    lk = lk[~lk["block"].isin(oversized)]
+
+    pairs = lk.merge(rk, on="block", suffixes=("_l", "_r"))
+    pairs = pairs.drop_duplicates(["row_l", "row_r"])
+    pairs = pd.DataFrame({
+        "l": pairs["row_l"].to_numpy(),
+        "r": pairs["row_r"].to_numpy(),
+        "block": pairs["block"].str[0].to_numpy(),
+    })
+    return pairs, len(oversized)
+
+
+def _gram_matrix(keys, pad: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    회사명 → (행 × bigram) 정수 행렬 (중복 bigram과 빈칸은 pad), 행별 bigram 수
+
+    문자 코드 두 개를 정수 하나로 묶으므로 name_ngrams와 같은 집합을 파이썬 반복 없이 만듭니다.
+    한 글자 이름은 그 글자 하나, 긴 이름은 앞 MAX_GRAMS + 1글자만 비교합니다.
+    """
+    keys = [k[:MAX_GRAMS + 1] for k in keys]  # 긴 이름은 앞부분만 (메모리 제한)
+    width = max(2, max((len(k) for k in keys), default=0))
+    chars = np.asarray(keys, dtype=f"U{width}").view(np.uint32).reshape(len(keys), width)
+    chars = chars.astype(np.int64)
+    grams = (chars[:, :-1] << 21) | chars[:, 1:]
+    grams[(chars[:, 1:] == 0)] = pad
+    single = (chars[:, 0] != 0) & (chars[:, 1] == 0)
+    grams[single, 0] = chars[single, 0]
+
+    # 행마다 정렬 후 중복 제거 (pad는 음수라 내림차순 정렬하면 뒤로 감)
+    grams = -np.sort(-grams, axis=1)
+    grams[:, 1:][grams[:, 1:] == grams[:, :-1]] = pad
+    grams = -np.sort(-grams, axis=1)
+    return grams, (grams != pad).sum(axis=1)
+
+
+def _jaccard(left: pd.DataFrame, right: pd.DataFrame, l: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """쌍별 회사명 bigram Jaccard 유사도 (bigram 행렬을 블록 단위로 비교)"""
+    lm, ll = _gram_matrix(left["key"].to_numpy(), pad=-1)
+    rm, rl = _gram_matrix(right["key"].to_numpy(), pad=-2)
+
+    inter = np.zeros(len(l), dtype=np.int64)
+    chunk = max(1, CHUNK_CELLS // (lm.shape[1] * rm.shape[1]))
+    for start in range(0, len(l), chunk):
+        a = lm[l[start:start + chunk]]
+        b = rm[r[start:start + chunk]]
+        inter[start:start + chunk] = (a[:, :, None] == b[:, None, :]).sum(axis=(1, 2))
+
+    union = ll[l] + rl[r] - inter
+    return np.divide(inter, union, out=np.zeros(len(l)), where=union > 0)
+
+
+def score_pairs(left: pd.DataFrame, right: pd.DataFrame, pairs: pd.DataFrame) -> np.ndarray:
+    """
+    쌍별 점수 (0~1) - CandidateRanker와 같은 기준에 전화번호를 더하고 다른 시도는 더 깎음
+
+    회사명 bigram Jaccard (정규화 이름이 같으면 1.0) + 영문명 +0.2 + 전화번호 +0.2
+    + 지역 (시군구 +0.1 / 시도 +0.05 / 다른 시도 -REGION_MISMATCH) + 설립연도 (같음 +0.1 / 2년 이상 차이 -0.15)
+    """
+    l = pairs["l"].to_numpy()
+    r = pairs["r"].to_numpy()
+
+    def col(df, name, idx):
+        return df[name].to_numpy()[idx]
+
+    score = _jaccard(left, right, l, r)
+    score[col(left, "key", l) == col(right, "key", r)] = 1.0
+
+    english_l, english_r = col(left, "english", l), col(right, "english", r)
+    score += np.where((english_l != "") & (english_l == english_r), 0.2, 0.0)
+    phone_l, phone_r = col(left, "phone", l), col(right, "phone", r)
+    score += np.where((phone_l != "") & (phone_l == phone_r), 0.2, 0.0)
+
+    sido_l, sido_r = col(left, "sido", l), col(right, "sido", r)
+    sigungu_l, sigungu_r = col(left, "sigungu", l), col(right, "sigungu", r)
+    known = (sido_l != "") & (sido_r != "")
+    same_sido = known & (sido_l == sido_r)
+    same_sigungu = same_sido & (sigungu_l != "") & (sigungu_l == sigungu_r)
+    score += np.select([same_sigungu, same_sido, known], [0.1, 0.05, -REGION_MISMATCH], 0.0)
+
+    gap = np.abs(col(left, "year", l) - col(right, "year", r))
+    score += np.select([gap == 0, gap > 1], [0.1, -0.15], 0.0)  # NaN(모름)은 둘 다 False
+
+    return np.clip(score, 0.0, 1.0)
+
+
+def resolve(
+    left: pd.DataFrame, right: pd.DataFrame, min_score: float = MATCH_MIN_SCORE
+) -> tuple[pd.DataFrame, dict]:
+    """
+    1:1 연결 (l, r, score, block)
+
+    min_score 이상인 쌍 중 점수가 높은 순으로 양쪽 모두 처음 나온 것만 남깁니다.
+    한 회사의 최고 점수 후보가 여럿이면 (같은 이름의 다른 회사) 연결하지 않습니다.
+    """
+    pairs, oversized = candidate_pairs(left, right)
+    pairs["score"] = score_pairs(left, right, pairs) if len(pairs) else []
+    scored = len(pairs)
+
+    pairs = pairs[pairs["score"] >= min_score]
+    ambiguous = {}
+    for side in ("l", "r"):
+        best = pairs[pairs["score"] == pairs.groupby(side)["score"].transform("max")]
+        counts = best.groupby(side).size()
+        ambiguous[side] = counts.index[counts > 1]
+
+    links = pairs[~pairs["l"].isin(ambiguous["l"]) & ~pairs["r"].isin(ambiguous["r"])]
+    links = links.sort_values("score", ascending=False, kind="stable")
+    links = links.drop_duplicates("l").drop_duplicates("r")
+    stats = {
+        "pairs": scored,
+        "oversized": oversized,
+        "ambiguous": len(ambiguous["l"]),
+    }
+    return links.reset_index(drop=True), stats
+
+
+def link_platform(
+    companies: list[Company],
+    platform: str,
+    records: list[dict],
+    path: Path = LINKS_PATH,
+) -> pd.DataFrame:
+    """병무청 회사 ↔ 플랫폼 회사 목록 연결 후 연결 테이블(path)의 해당 플랫폼 부분 교체"""
+    started = time.perf_counter()
+    left = company_frame(companies)
+    right = prepare_records(pd.DataFrame(records or [], columns=None if records else ["name", "url"]))
+    links, stats = resolve(left, right)
+
+    table = pd.DataFrame({
+        "platform": platform,
+        "companyId": left["id"].to_numpy()[links["l"].to_numpy()],
+        "name": right["name"].to_numpy()[links["r"].to_numpy()],
+        "url": right["url"].to_numpy()[links["r"].to_numpy()],
+        "score": links["score"].round(3).to_numpy(),
+        "block": links["block"].map(BLOCK_LABELS).to_numpy(),
+    }, columns=LINK_COLUMNS)
+    save_links(table, platform, path)
+
+    accepted = int((table["score"] >= LINK_ACCEPT_SCORE).sum())
+    print(
+        f"연결({platform}): 병무청 {len(left):,}개 × {platform} {len(right):,}개 → "
+        f"후보 쌍 {stats['pairs']:,}개 → 연결 {len(table):,}개 "
+        f"(크롤링에서 URL로 사용 {accepted:,}개, {time.perf_counter() - started:.1f}초)"
+    )
+    if stats["ambiguous"]:
+        print(f"  같은 점수 후보가 여럿이라 연결하지 않음: {stats['ambiguous']}개")
+    if stats["oversized"]:
+        print(f"  [경고] 너무 큰 블록 {stats['oversized']}개는 비교 생략 (LINK_MAX_BLOCK_PAIRS)")
+    return table
+
+
+def save_links(table: pd.DataFrame, platform: str, path: Path = LINKS_PATH):
+    """연결 테이블 저장 (다른 플랫폼 연결은 유지)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        existing = pd.read_csv(path, dtype={"companyId": str})
+        table = pd.concat([existing[existing["platform"] != platform], table], ignore_index=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    table.to_csv(tmp_path, index=False, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def load_links(
+    path: Path = LINKS_PATH, min_score: float = LINK_ACCEPT_SCORE
+) -> dict[str, dict[str, dict]]:
+    """플랫폼 → 회사 ID → {name, url, score} (min_score 이상만)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    table = pd.read_csv(path, dtype={"companyId": str})
+    table = table[table["score"] >= min_score]
+    links: dict[str, dict[str, dict]] = {}
+    for row in table.itertuples(index=False):
+        links.setdefault(row.platform, {})[row.companyId] = {
+            "name": row.name, "url": row.url, "score": row.score,
+        }
+    return links
+
+
+def linked_urls(platform: str, path: Path = LINKS_PATH) -> dict[str, str]:
+    """크롤러용 회사 ID → 플랫폼 URL (companies.json에는 저장하지 않음)"""
+    return {company_id: link["url"] for company_id, link in load_links(path).get(platform, {}).items()}
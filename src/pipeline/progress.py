@@ -1,69 +1,288 @@
 """진행상황 관리 모듈 - 중단/재시작 지원"""
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from src.config import PROGRESS_DIR
+from src.config import (
+    PROGRESS_DIR,
+    PROGRESS_BACKEND,
+    PROGRESS_JOURNAL_COMPACT_THRESHOLD,
+    STORAGE_BACKEND,
+)
+from src.pipeline.store import SqliteStore
 
 
 class ProgressTracker:
-    """크롤링 진행상황 추적기"""
+    """
+    크롤링 진행상황 추적기
 
-    def __init__(self, name: str):
+    backend:
+        "json"    - 매 결과마다 {name}_progress.json 전체를 다시 씀 (기존 방식)
+        "journal" - 결과를 {name}_progress.jsonl 에 한 줄씩 append 하고,
+                    일정 개수가 쌓이면 {name}_progress.json 스냅샷으로 압축
+        "sqlite"  - data/byjjec.db 의 progress_{name} 테이블 (STORAGE_BACKEND=sqlite)
+    """
+
+    BACKENDS = ("json", "journal", "sqlite")
+
+    def __init__(
+        self,
+        name: str,
+        backend: Optional[str] = None,
+        progress_dir: Path = PROGRESS_DIR,
+    ):
         self.name = name
-        self.file_path = PROGRESS_DIR / f"{name}_progress.json"
-        self.data = self._load()
+        if not backend:
+            backend = "sqlite" if STORAGE_BACKEND == "sqlite" else PROGRESS_BACKEND
+        self.backend = backend
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 backend: {self.backend}")
 
-    def _load(self) -> dict:
-        """진행상황 파일 로드"""
-        if self.file_path.exists():
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+        self.file_path = Path(progress_dir) / f"{name}_progress.json"
+        self.journal_path = Path(progress_dir) / f"{name}_progress.jsonl"
+        self.compact_threshold = PROGRESS_JOURNAL_COMPACT_THRESHOLD
+        self._journal_entries = 0
+        self.store = None
+        # 여러 워커 스레드가 하나의 추적기를 공유할 수 있도록
+        self.lock = threading.RLock()
+
+        if self.backend == "sqlite":
+            # 상태는 DB에만 두고 메모리에 전체를 올리지 않음
+            self.store = SqliteStore.open()
+            self.data = None
+        else:
+            self.data = self._load()
+
+    @staticmethod
+    def _empty() -> dict:
         return {
             "completed": {},  # company_id -> result
             "failed": {},  # company_id -> error message
+            "fetchedAt": {},  # company_id -> 결과 수집 시각
             "lastUpdated": None,
         }
 
+    def _load(self) -> dict:
+        """진행상황 파일 로드 (journal 모드면 스냅샷 + 로그 재생)"""
+        data = self._empty()
+        if self.file_path.exists():
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # 수집 시각이 없던 이전 형식 호환
+            data.setdefault("fetchedAt", {})
+
+        # backend와 무관하게 남아있는 journal은 재생 (backend 전환 시 유실 방지)
+        self._replay_journal(data)
+
+        return data
+
+    def _replay_journal(self, data: dict):
+        """journal 파일을 스냅샷 위에 순서대로 적용"""
+        if not self.journal_path.exists():
+            return
+
+        with open(self.journal_path, "rb") as f:
+            lines = f.readlines()
+
+        good_offset = 0
+        for idx, line in enumerate(lines):
+            try:
+                # 개행으로 끝나지 않은 줄은 쓰다 만 줄
+                if not line.endswith(b"\n"):
+                    raise ValueError("개행 없는 줄")
+                entry = json.loads(line) if line.strip() else None
+            except ValueError:
+                if idx == len(lines) - 1:
+                    # 크래시로 잘린 꼬리 → 잘라내고 이어서 기록
+                    print(f"[경고] {self.journal_path.name}: 손상된 마지막 줄 제거")
+                    with open(self.journal_path, "r+b") as f:
+                        f.truncate(good_offset)
+                    break
+                print(f"[경고] {self.journal_path.name}: 손상된 줄 무시 ({idx + 1}번째)")
+                good_offset += len(line)
+                continue
+
+            if entry:
+                self._apply(data, entry)
+                self._journal_entries += 1
+            good_offset += len(line)
+
+    @staticmethod
+    def _apply(data: dict, entry: dict):
+        """journal 한 줄을 메모리 상태에 반영"""
+        op = entry.get("op")
+        company_id = entry.get("id")
+
+        if op == "completed":
+            data["completed"][company_id] = entry.get("result")
+            data["failed"].pop(company_id, None)
+            data["fetchedAt"][company_id] = entry.get("fetchedAt") or entry.get("ts")
+        elif op == "failed":
+            data["failed"][company_id] = entry.get("error")
+        elif op == "reset":
+            data["completed"] = {}
+            data["failed"] = {}
+            data["fetchedAt"] = {}
+        elif op == "reset_failed":
+            data["failed"] = {}
+
+        if entry.get("ts"):
+            data["lastUpdated"] = entry["ts"]
+
+    def _append(self, entry: dict):
+        """journal 파일에 한 줄 추가"""
+        entry.setdefault("ts", datetime.now().isoformat())
+        self.data["lastUpdated"] = entry["ts"]
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+
+        self._journal_entries += 1
+        # 스냅샷 크기에 비례해 압축 주기를 늘려 전체 쓰기량을 O(n)으로 유지
+        threshold = max(self.compact_threshold, len(self.data["completed"]))
+        if self._journal_entries >= threshold:
+            self.compact()
+
+    def _write_snapshot(self):
+        """스냅샷을 임시 파일에 쓰고 원자적으로 교체"""
+        tmp_path = self.file_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+
+    def compact(self):
+        """journal을 스냅샷으로 압축하고 로그를 비움"""
+        with self.lock:
+            self._write_snapshot()
+            # 스냅샷 교체 후 로그를 비움 (그 사이 크래시가 나도 재생은 멱등)
+            with open(self.journal_path, "w", encoding="utf-8"):
+                pass
+            self._journal_entries = 0
+
     def save(self):
         """진행상황 저장"""
+        if self.store:
+            return  # sqlite는 매 호출마다 커밋됨
         self.data["lastUpdated"] = datetime.now().isoformat()
+        if self.backend == "journal":
+            self.compact()
+            return
         with open(self.file_path, "w", encoding="utf-8") as f:
             json.dump(self.data, f, ensure_ascii=False, indent=2)
+        if self._journal_entries:
+            # journal 내용은 방금 쓴 파일에 포함됨
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_entries = 0
 
     def is_completed(self, company_id: str) -> bool:
         """회사가 이미 처리되었는지 확인"""
+        if self.store:
+            return self.store.get_status(self.name, company_id) == "completed"
         return company_id in self.data["completed"]
 
     def is_failed(self, company_id: str) -> bool:
-        """회사 처리가 실패했는지 확인"""
+        """회사 처리가 실패했는지 확인 (완료 결과가 있어도 마지막 갱신이 실패면 True)"""
+        if self.store:
+            return self.store.has_error(self.name, company_id)
         return company_id in self.data["failed"]
 
     def get_result(self, company_id: str) -> Optional[dict]:
         """처리 결과 조회"""
+        if self.store:
+            return self.store.get_result(self.name, company_id)
         return self.data["completed"].get(company_id)
 
-    def mark_completed(self, company_id: str, result: dict):
-        """처리 완료로 표시"""
-        self.data["completed"][company_id] = result
-        # 실패 목록에서 제거
-        if company_id in self.data["failed"]:
-            del self.data["failed"][company_id]
-        self.save()
+    def get_results(self) -> dict[str, dict]:
+        """완료된 결과 전체 조회 (company_id -> result)"""
+        with self.lock:
+            if self.store:
+                return self.store.get_results(self.name)
+            return dict(self.data["completed"])
+
+    def get_fetched_at(self, company_id: str) -> Optional[datetime]:
+        """결과 수집 시각 (완료되지 않았으면 None)"""
+        if self.store:
+            fetched_at = self.store.get_fetched_at(self.name, company_id)
+        elif company_id in self.data["completed"]:
+            # 수집 시각 없이 저장된 이전 결과는 마지막 저장 시각으로 간주
+            fetched_at = (
+                self.data["fetchedAt"].get(company_id) or self.data["lastUpdated"]
+            )
+        else:
+            return None
+        return datetime.fromisoformat(fetched_at) if fetched_at else datetime.min
+
+    def get_stale(self, all_ids: list[str], max_age: timedelta) -> list[str]:
+        """완료됐지만 max_age보다 오래된 ID 목록 (오래된 순)"""
+        cutoff = datetime.now() - max_age
+        if self.store:
+            return self.store.get_stale(self.name, all_ids, cutoff.isoformat())
+
+        stale = []
+        for company_id in all_ids:
+            fetched_at = self.get_fetched_at(company_id)
+            if fetched_at is not None and fetched_at < cutoff:
+                stale.append((fetched_at, company_id))
+        stale.sort()
+        return [company_id for _, company_id in stale]
+
+    def mark_completed(
+        self, company_id: str, result: dict, fetched_at: Optional[str] = None
+    ):
+        """처리 완료로 표시 (fetched_at: 원본 수집 시각, 기본값은 지금)"""
+        with self.lock:
+            if self.store:
+                self.store.mark_completed(self.name, company_id, result, fetched_at)
+                return
+
+            now = datetime.now().isoformat()
+            self.data["completed"][company_id] = result
+            self.data["fetchedAt"][company_id] = fetched_at or now
+            # 실패 목록에서 제거
+            if company_id in self.data["failed"]:
+                del self.data["failed"][company_id]
+
+            if self.backend == "journal":
+                entry = {"op": "completed", "id": company_id, "result": result, "ts": now}
+                if fetched_at:
+                    entry["fetchedAt"] = fetched_at
+                self._append(entry)
+            else:
+                self.save()
 
     def mark_failed(self, company_id: str, error: str):
         """처리 실패로 표시"""
-        self.data["failed"][company_id] = error
-        self.save()
+        with self.lock:
+            if self.store:
+                self.store.mark_failed(self.name, company_id, error)
+                return
+
+            self.data["failed"][company_id] = error
+
+            if self.backend == "journal":
+                self._append({"op": "failed", "id": company_id, "error": error})
+            else:
+                self.save()
 
     def get_pending(self, all_ids: list[str]) -> list[str]:
         """아직 처리하지 않은 ID 목록 반환"""
-        completed = set(self.data["completed"].keys())
-        return [id for id in all_ids if id not in completed]
+        with self.lock:
+            if self.store:
+                return self.store.get_pending(self.name, all_ids)
+            completed = set(self.data["completed"].keys())
+            return [id for id in all_ids if id not in completed]
 
     def get_stats(self) -> dict:
         """통계 반환"""
+        if self.store:
+            return self.store.get_stats(self.name)
         return {
             "completed": len(self.data["completed"]),
             "failed": len(self.data["failed"]),
@@ -72,14 +291,25 @@ class ProgressTracker:
 
     def reset(self):
         """진행상황 초기화"""
-        self.data = {
-            "completed": {},
-            "failed": {},
-            "lastUpdated": None,
-        }
-        self.save()
+        with self.lock:
+            if self.store:
+                self.store.reset(self.name)
+                return
+
+            self.data = self._empty()
+            if self.backend == "journal":
+                # 압축 도중 크래시가 나도 재생 결과가 비도록 reset을 먼저 기록
+                self._append({"op": "reset"})
+            self.save()
 
     def reset_failed(self):
         """실패한 항목만 재시도 가능하게 초기화"""
-        self.data["failed"] = {}
-        self.save()
+        with self.lock:
+            if self.store:
+                self.store.reset_failed(self.name)
+                return
+
+            self.data["failed"] = {}
+            if self.backend == "journal":
+                self._append({"op": "reset_failed"})
+            self.save()
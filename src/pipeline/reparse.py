@@ -0,0 +1,44 @@
+"""재파싱 모듈 - 보관된 원본(data/raw/)으로 추출 로직만 다시 실행 (브라우저/네트워크 없음)"""
+import time
+from typing import Any, Callable, Optional
+
+from src.pipeline.archive import RawArchive
+from src.pipeline.progress import ProgressTracker
+
+
+def reparse_source(source: str, parse: Callable[[dict], Optional[Any]]) -> dict:
+    """
+    source의 회사별 최신 원본을 parse로 다시 추출해 진행상황 갱신
+
+    결과가 바뀐 회사만 기록하고, 수집 시각은 원본을 받은 시각으로 유지합니다
+    (재파싱 때문에 재수집 주기가 밀리지 않도록).
+
+    Args:
+        parse: {종류: {"url", "content"}} -> 데이터 객체 (추출 실패 시 None)
+    """
+    archive = RawArchive(source)
+    progress = ProgressTracker(source)
+    stats = {"parsed": 0, "changed": 0, "empty": 0, "error": 0}
+    started = time.perf_counter()
+
+    for company_id, capture in archive.latest().items():
+        try:
+            data = parse(archive.load_pages(capture))
+        except Exception as e:
+            stats["error"] += 1
+            print(f"  [에러] {source} {company_id}: {e}")
+            continue
+
+        if data is None:
+            # 새 추출 로직으로 못 찾으면 기존 결과 유지
+            stats["empty"] += 1
+            continue
+
+        stats["parsed"] += 1
+        result = data.__dict__
+        if progress.get_result(company_id) != result:
+            progress.mark_completed(company_id, result, fetched_at=capture["ts"])
+            stats["changed"] += 1
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
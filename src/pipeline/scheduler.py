@@ -0,0 +1,53 @@
+"""재수집 스케줄러 - 미처리 + 병무청 목록에서 바뀐 + 오래된(TTL 초과) 결과만 선택"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.config import REFRESH_TTL_DAYS
+from src.mma.snapshot import changed_ids
+from src.pipeline.progress import ProgressTracker
+
+
+class RefreshScheduler:
+    """소스별 TTL에 따라 이번 실행에서 처리할 회사 선택"""
+
+    def __init__(self, progress: ProgressTracker, ttl_days: Optional[float] = None):
+        self.progress = progress
+        if ttl_days is None:
+            ttl_days = REFRESH_TTL_DAYS.get(progress.name)
+        # TTL이 없으면 한 번 수집한 결과는 다시 수집하지 않음 (기존 동작)
+        self.ttl_days = ttl_days
+        self.ttl = timedelta(days=ttl_days) if ttl_days else None
+
+    def changed(self, all_ids: list[str], skip: list[str]) -> list[str]:
+        """병무청 목록에서 바뀐 뒤(예: 회사명 변경) 아직 다시 수집하지 않은 ID"""
+        changed_at = changed_ids(self.progress.name)
+        if not changed_at:
+            return []
+        skip = set(skip)
+        return [
+            company_id for company_id in all_ids
+            if company_id in changed_at
+            and company_id not in skip
+            and (self.progress.get_fetched_at(company_id) or datetime.min) < changed_at[company_id]
+        ]
+
+    def select(self, all_ids: list[str], limit: Optional[int] = None) -> list[str]:
+        """처리할 ID 목록: 미처리 먼저(입력 순서), 그다음 오래된 순"""
+        pending = self.progress.get_pending(all_ids)
+        changed = self.changed(all_ids, skip=pending)
+        stale = self.progress.get_stale(all_ids, self.ttl) if self.ttl else []
+        if changed:
+            changed_set = set(changed)
+            stale = [company_id for company_id in stale if company_id not in changed_set]
+
+        if stale or changed:
+            ttl = f" (TTL {self.ttl_days:g}일)" if stale else ""
+            print(
+                f"  재수집 대상: 미처리 {len(pending)}개 + 병무청 변경 {len(changed)}개 "
+                f"+ 만료 {len(stale)}개{ttl}"
+            )
+
+        selected = pending + changed + stale
+        if limit:
+            selected = selected[:limit]
+        return selected
@@ -0,0 +1,346 @@
+"""SQLite 저장소 모듈 - 회사 목록과 소스별 진행상황을 하나의 DB에 저장"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+from datetime import datetime
+
+from src.config import SQLITE_PATH, PROGRESS_DIR, OUTPUT_FILE
+from src.models import Company, create_output_data
+
+
+class SqliteStore:
+    """
+    companies 테이블 + 소스별 progress_{name} 테이블
+
+    progress_{name}:
+        company_id  TEXT PRIMARY KEY
+        status      'completed' | 'failed'
+        result      JSON (completed)
+        error       TEXT (마지막 실패, 완료된 결과의 갱신 실패도 기록)
+        updated_at  ISO 시각 (마지막 기록)
+        fetched_at  ISO 시각 (결과 수집, completed)
+    """
+
+    SOURCES = ("jobplanet", "wanted", "geocode")
+
+    _instances: dict = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: Path = SQLITE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self._tables = set()
+        self._create_companies_table()
+
+    @classmethod
+    def open(cls, db_path: Path = SQLITE_PATH) -> "SqliteStore":
+        """경로별로 하나의 연결을 공유"""
+        key = str(Path(db_path).resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(db_path)
+            return cls._instances[key]
+
+    def _create_companies_table(self):
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS companies (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    updated_at TEXT
+                )
+                """
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_companies_updated ON companies(updated_at)"
+            )
+
+    def _table(self, source: str) -> str:
+        """소스별 progress 테이블 이름 (없으면 생성)"""
+        if not source.replace("_", "").isalnum():
+            raise ValueError(f"잘못된 소스 이름: {source}")
+
+        table = f"progress_{source}"
+        if table in self._tables:
+            return table
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    company_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at TEXT,
+                    fetched_at TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if "fetched_at" not in columns:
+                # fetched_at 이전에 만든 DB
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN fetched_at TEXT")
+                self.conn.execute(
+                    f"UPDATE {table} SET fetched_at = updated_at WHERE status = 'completed'"
+                )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_status ON {table}(status)"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_updated ON {table}(updated_at)"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_fetched ON {table}(fetched_at)"
+            )
+        self._tables.add(table)
+        return table
+
+    # ============================================================
+    # 진행상황
+    # ============================================================
+
+    def get_status(self, source: str, company_id: str) -> Optional[str]:
+        table = self._table(source)
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT status FROM {table} WHERE company_id = ?", (company_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def has_error(self, source: str, company_id: str) -> bool:
+        """실패 기록이 있는지 (완료 결과가 있어도 갱신 실패면 True)"""
+        table = self._table(source)
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT 1 FROM {table} WHERE company_id = ? AND error IS NOT NULL",
+                (company_id,),
+            ).fetchone()
+        return row is not None
+
+    def get_result(self, source: str, company_id: str) -> Optional[dict]:
+        table = self._table(source)
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT result FROM {table} WHERE company_id = ? AND status = 'completed'",
+                (company_id,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_results(self, source: str) -> dict[str, dict]:
+        """완료된 결과 전체 (company_id -> result)"""
+        table = self._table(source)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT company_id, result FROM {table} WHERE status = 'completed'"
+            ).fetchall()
+        return {company_id: json.loads(result) for company_id, result in rows}
+
+    def get_fetched_at(self, source: str, company_id: str) -> Optional[str]:
+        table = self._table(source)
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT fetched_at FROM {table} WHERE company_id = ? AND status = 'completed'",
+                (company_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return row[0] or ""
+
+    def get_stale(self, source: str, all_ids: list[str], cutoff: str) -> list[str]:
+        """cutoff 이전에 수집된 완료 ID (오래된 순)"""
+        table = self._table(source)
+        with self.lock, self.conn:
+            self._fill_ids(all_ids)
+            rows = self.conn.execute(
+                f"""
+                SELECT p.id FROM pending_ids p
+                JOIN {table} t ON t.company_id = p.id AND t.status = 'completed'
+                WHERE t.fetched_at IS NULL OR t.fetched_at < ?
+                ORDER BY t.fetched_at, p.pos
+                """,
+                (cutoff,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_completed(
+        self, source: str, company_id: str, result: dict, fetched_at: Optional[str] = None
+    ):
+        table = self._table(source)
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"""
+                INSERT INTO {table} (company_id, status, result, error, updated_at, fetched_at)
+                VALUES (?, 'completed', ?, NULL, ?, ?)
+                ON CONFLICT(company_id) DO UPDATE SET
+                    status = 'completed', result = excluded.result,
+                    error = NULL, updated_at = excluded.updated_at,
+                    fetched_at = excluded.fetched_at
+                """,
+                (company_id, json.dumps(result, ensure_ascii=False), now, fetched_at or now),
+            )
+
+    def mark_failed(self, source: str, company_id: str, error: str):
+        """실패로 표시 (이미 완료된 결과가 있으면 결과는 유지하고 error만 기록)"""
+        table = self._table(source)
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"""
+                INSERT INTO {table} (company_id, status, result, error, updated_at)
+                VALUES (?, 'failed', NULL, ?, ?)
+                ON CONFLICT(company_id) DO UPDATE SET
+                    error = excluded.error, updated_at = excluded.updated_at,
+                    status = CASE WHEN status = 'completed' THEN status ELSE 'failed' END
+                """,
+                (company_id, error, datetime.now().isoformat()),
+            )
+
+    def get_pending(self, source: str, all_ids: list[str]) -> list[str]:
+        """완료되지 않은 ID (입력 순서 유지)"""
+        table = self._table(source)
+        with self.lock, self.conn:
+            self._fill_ids(all_ids)
+            rows = self.conn.execute(
+                f"""
+                SELECT p.id FROM pending_ids p
+                LEFT JOIN {table} t ON t.company_id = p.id AND t.status = 'completed'
+                WHERE t.company_id IS NULL
+                ORDER BY p.pos
+                """
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _fill_ids(self, all_ids: list[str]):
+        """조회 대상 ID를 임시 테이블에 채움 (lock 안에서 호출)"""
+        self.conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS pending_ids (pos INTEGER, id TEXT)"
+        )
+        self.conn.execute("DELETE FROM pending_ids")
+        self.conn.executemany(
+            "INSERT INTO pending_ids (pos, id) VALUES (?, ?)", enumerate(all_ids)
+        )
+
+    def get_stats(self, source: str) -> dict:
+        table = self._table(source)
+        with self.lock:
+            counts = dict(
+                self.conn.execute(
+                    f"SELECT status, COUNT(*) FROM {table} GROUP BY status"
+                ).fetchall()
+            )
+            failed, last_updated = self.conn.execute(
+                f"SELECT COUNT(error), MAX(updated_at) FROM {table}"
+            ).fetchone()
+        return {
+            "completed": counts.get("completed", 0),
+            "failed": failed,
+            "lastUpdated": last_updated,
+        }
+
+    def reset(self, source: str):
+        table = self._table(source)
+        with self.lock, self.conn:
+            self.conn.execute(f"DELETE FROM {table}")
+
+    def reset_failed(self, source: str):
+        table = self._table(source)
+        with self.lock, self.conn:
+            self.conn.execute(f"DELETE FROM {table} WHERE status = 'failed'")
+            self.conn.execute(f"UPDATE {table} SET error = NULL")
+
+    # ============================================================
+    # 회사 목록
+    # ============================================================
+
+    def load_companies(self) -> list[Company]:
+        with self.lock:
+            rows = self.conn.execute("SELECT data FROM companies ORDER BY rowid").fetchall()
+        return [Company.from_dict(json.loads(row[0])) for row in rows]
+
+    def save_companies(self, companies: list[Company]):
+        """회사 목록 전체 교체"""
+        now = datetime.now().isoformat()
+        rows = [
+            (c.id, c.name, json.dumps(c.to_dict(), ensure_ascii=False), now)
+            for c in companies
+        ]
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM companies")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO companies (id, name, data, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def export_json(self, file_path: Path = OUTPUT_FILE) -> int:
+        """map.html용 companies.json 내보내기"""
+        companies = self.load_companies()
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(create_output_data(companies), f, ensure_ascii=False, indent=2)
+        return len(companies)
+
+    def import_json(
+        self,
+        companies_file: Path = OUTPUT_FILE,
+        progress_dir: Path = PROGRESS_DIR,
+    ) -> dict:
+        """기존 companies.json 및 {source}_progress.json(+jsonl) 가져오기"""
+        # 순환 import 방지
+        from src.pipeline.progress import ProgressTracker
+
+        imported = {}
+
+        if companies_file.exists():
+            with open(companies_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            companies = [Company.from_dict(c) for c in data.get("companies", [])]
+            self.save_companies(companies)
+            imported["companies"] = len(companies)
+
+        for source in self.SOURCES:
+            tracker = ProgressTracker(source, backend="journal", progress_dir=progress_dir)
+            completed = tracker.data["completed"]
+            failed = tracker.data["failed"]
+            if not completed and not failed:
+                continue
+
+            table = self._table(source)
+            now = tracker.data.get("lastUpdated") or datetime.now().isoformat()
+            fetched_at = tracker.data.get("fetchedAt", {})
+            with self.lock, self.conn:
+                self.conn.executemany(
+                    f"""
+                    INSERT OR REPLACE INTO {table} (company_id, status, result, error, updated_at)
+                    VALUES (?, 'failed', NULL, ?, ?)
+                    """,
+                    [(cid, err, now) for cid, err in failed.items() if cid not in completed],
+                )
+                self.conn.executemany(
+                    f"""
+                    INSERT OR REPLACE INTO {table}
+                        (company_id, status, result, error, updated_at, fetched_at)
+                    VALUES (?, 'completed', ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            cid,
+                            json.dumps(result, ensure_ascii=False),
+                            failed.get(cid),
+                            now,
+                            fetched_at.get(cid) or now,
+                        )
+                        for cid, result in completed.items()
+                    ],
+                )
+            imported[source] = len(completed) + len(failed)
+
+        return imported
@@ -0,0 +1,357 @@
+"""요청 속도 제한 모듈"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from src.config import RATE_LIMITS, RATE_LEDGER_PATH, RATE_SHARED, DAILY_QUOTAS
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate개, 최대 burst개까지 몰아서 허용)
+
+    스레드와 asyncio 태스크가 함께 써도 되도록 예약 방식으로 동작:
+    토큰이 모자라면 잔고를 음수로 만들고 그만큼 기다림 → 호출 순서대로 공정하게 분배
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약, 기다려야 할 시간(초) 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기 (동기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 대기 (asyncio)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class QuotaExceeded(Exception):
+    """일일 요청 한도 소진 (reset_at 이후 다시 시도)"""
+
+    def __init__(self, name: str, quota: int, reset_at: datetime):
+        self.name = name
+        self.quota = quota
+        self.reset_at = reset_at
+        super().__init__(
+            f"{name} 일일 요청 한도 {quota}회 소진 ({reset_at:%m-%d %H:%M} 이후 재개 가능)"
+        )
+
+
+class RateLedger:
+    """
+    프로세스 간 공유 요청 장부 (SQLite)
+
+    여러 프로세스(예: wanted와 geocode 단계를 동시에 실행)가 같은 호스트 속도와
+    일일 한도를 나눠 쓰도록, 요청마다 BEGIN IMMEDIATE 트랜잭션 안에서
+    다음 요청 시각을 예약하고 오늘 사용량을 올립니다.
+
+    slots:  name, next_at (다음 요청 가능 시각, epoch 초)
+    quota:  name, day (YYYY-MM-DD), used
+    """
+
+    _instances: dict = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: Path = RATE_LEDGER_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: 트랜잭션을 직접 관리 (BEGIN IMMEDIATE로 쓰기 잠금)
+        self.conn = sqlite3.connect(
+            str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS slots (name TEXT PRIMARY KEY, next_at REAL NOT NULL)"
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quota (
+                name TEXT NOT NULL,
+                day TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (name, day)
+            )
+            """
+        )
+
+    @classmethod
+    def open(cls, db_path: Path = RATE_LEDGER_PATH) -> "RateLedger":
+        """경로별로 하나의 연결을 공유"""
+        key = str(Path(db_path).resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(db_path)
+            return cls._instances[key]
+
+    @staticmethod
+    def next_reset() -> datetime:
+        """일일 한도 초기화 시각 (다음 자정)"""
+        return datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+
+    def reserve(self, name: str, interval: float, daily_quota: int = 0) -> float:
+        """
+        요청 1회 예약, 기다려야 할 시간(초) 반환
+
+        daily_quota가 있고 오늘 사용량이 다 찼으면 QuotaExceeded
+        """
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if daily_quota:
+                    today = date.today().isoformat()
+                    row = self.conn.execute(
+                        "SELECT used FROM quota WHERE name = ? AND day = ?", (name, today)
+                    ).fetchone()
+                    used = row[0] if row else 0
+                    if used >= daily_quota:
+                        raise QuotaExceeded(name, daily_quota, self.next_reset())
+                    if not row:
+                        self.conn.execute(
+                            "DELETE FROM quota WHERE name = ? AND day < ?", (name, today)
+                        )
+                    self.conn.execute(
+                        """
+                        INSERT INTO quota (name, day, used) VALUES (?, ?, 1)
+                        ON CONFLICT(name, day) DO UPDATE SET used = used + 1
+                        """,
+                        (name, today),
+                    )
+
+                now = time.time()
+                row = self.conn.execute(
+                    "SELECT next_at FROM slots WHERE name = ?", (name,)
+                ).fetchone()
+                slot = max(now, row[0]) if row else now
+                self.conn.execute(
+                    """
+                    INSERT INTO slots (name, next_at) VALUES (?, ?)
+                    ON CONFLICT(name) DO UPDATE SET next_at = excluded.next_at
+                    """,
+                    (name, slot + interval),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return slot - now
+
+    def used_today(self, name: str) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT used FROM quota WHERE name = ? AND day = ?",
+                (name, date.today().isoformat()),
+            ).fetchone()
+        return row[0] if row else 0
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    호스트별 AIMD 속도 제한
+
+    응답이 정상이고 빠르면 응답마다 increase만큼 속도를 올리고 (최대 max_rate),
+    429/5xx/연결 오류 또는 평소보다 slow_factor배 이상 느린 응답이 오면
+    속도를 decrease배로 줄입니다 (최소 min_rate). 한 번 줄인 뒤에는
+    요청 간격(최소 1초) 동안 추가로 줄이지 않아 동시에 돌아온 응답에 과잉 반응하지 않습니다.
+
+    일일 한도는 ledger가 있으면 프로세스 간 공유로, 없으면(RATE_SHARED=0) 이 프로세스 안에서만
+    셉니다 (같은 날 이전 실행에서 쓴 양은 모름).
+    """
+
+    LATENCY_WARMUP = 5  # 지연 기준값을 잡기 전 최소 응답 수
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        max_rate: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: float = 0.5,
+        slow_factor: float = 2.0,
+        ledger: Optional[RateLedger] = None,
+        daily_quota: int = 0,
+    ):
+        super().__init__(rate, burst=1)
+        self.name = name
+        self.ledger = ledger
+        self.daily_quota = daily_quota
+        self.quota_day: Optional[date] = None  # ledger가 없을 때 이 프로세스의 오늘 사용량
+        self.quota_used = 0
+        self.start_rate = rate
+        self.max_rate = max(rate, max_rate or rate)
+        self.min_rate = min(rate, min_rate or rate / 10)
+        self.increase = increase or rate * 0.02
+        self.decrease = decrease
+        self.slow_factor = slow_factor
+        self.latency_avg: Optional[float] = None
+        self.latencies: deque = deque(maxlen=500)  # 최근 정상 응답 시간 (분위수용)
+        self.responses = 0
+        self.decreases = 0
+        self.last_decrease = 0.0
+
+    def _reserve(self) -> float:
+        """ledger가 있으면 프로세스 간 공유 예약 (간격은 이 프로세스의 현재 속도 기준)"""
+        if self.ledger is None:
+            self._use_quota()
+            return super()._reserve()
+        return self.ledger.reserve(self.name, 1 / self.rate, self.daily_quota)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 대기 (asyncio, ledger 예약은 SQLite 잠금을 기다릴 수 있어 스레드에서)"""
+        if self.ledger is None:
+            return await super().acquire_async()
+        wait = await asyncio.to_thread(self._reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _use_quota(self):
+        """ledger 없이 일일 한도 1회 사용 (다 찼으면 QuotaExceeded)"""
+        if not self.daily_quota:
+            return
+        with self.lock:
+            today = date.today()
+            if self.quota_day != today:
+                self.quota_day, self.quota_used = today, 0
+            if self.quota_used >= self.daily_quota:
+                raise QuotaExceeded(self.name, self.daily_quota, RateLedger.next_reset())
+            self.quota_used += 1
+
+    def used_today(self) -> int:
+        """오늘 요청 수 (ledger가 없으면 이 프로세스에서 보낸 수)"""
+        if self.ledger:
+            return self.ledger.used_today(self.name)
+        with self.lock:
+            return self.quota_used if self.quota_day == date.today() else 0
+
+    def record(self, latency: float, status: Optional[int] = None, error: bool = False):
+        """응답 결과 반영 (status가 없으면 정상 응답으로 간주)"""
+        throttled = error or status == 429 or (status or 0) >= 500
+        with self.lock:
+            self.responses += 1
+            slow = (
+                not throttled
+                and self.latency_avg is not None
+                and self.responses > self.LATENCY_WARMUP
+                and latency > self.latency_avg * self.slow_factor
+            )
+            if not throttled:
+                self.latencies.append(latency)
+                if self.latency_avg is None:
+                    self.latency_avg = latency
+                else:
+                    self.latency_avg = 0.8 * self.latency_avg + 0.2 * latency
+
+            if not (throttled or slow):
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                return
+
+            now = time.monotonic()
+            if now - self.last_decrease < max(1.0, 1 / self.rate):
+                return
+            old_rate = self.rate
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.last_decrease = now
+            self.decreases += 1
+
+        reason = f"HTTP {status}" if status else ("오류" if error else f"응답 지연 {latency:.1f}초")
+        print(f"  [속도] {self.name}: 초당 {old_rate:.2f} → {self.rate:.2f}회 ({reason})")
+
+    def latency_percentile(self, p: float) -> Optional[float]:
+        """최근 정상 응답 시간의 p 분위수 (응답이 충분히 쌓이기 전에는 None)"""
+        with self.lock:
+            samples = sorted(self.latencies)
+        if len(samples) < self.LATENCY_WARMUP * 4:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+    def report(self) -> str:
+        """현재 속도 요약 (일일 한도가 있으면 오늘 사용량 포함)"""
+        text = (
+            f"{self.name} 요청 속도: 초당 {self.rate:.2f}회 "
+            f"(시작 {self.start_rate:.2f}, 최대 {self.max_rate:.2f}, 감속 {self.decreases}회)"
+        )
+        if self.daily_quota:
+            text += f", 오늘 {self.used_today()}/{self.daily_quota}회"
+        return text
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_overrides: dict[str, tuple[float, Optional[float]]] = {}
+_limiters_lock = threading.Lock()
+
+
+def parse_rate_spec(spec: str) -> tuple[float, Optional[float]]:
+    """"시작[:최대]" (초당 요청 수) → (시작, 최대)"""
+    start, _, maximum = spec.partition(":")
+    return float(start), float(maximum) if maximum else None
+
+
+def set_rate_override(name: str, start: float, maximum: Optional[float] = None):
+    """호스트 속도 재정의 (run.py --rate, limiter를 쓰기 전에 호출)"""
+    if name not in RATE_LIMITS:
+        raise ValueError(f"알 수 없는 이름: {name} (가능: {', '.join(RATE_LIMITS)})")
+    with _limiters_lock:
+        _overrides[name] = (start, maximum)
+        _limiters.pop(name, None)
+
+
+def get_limiter(name: str) -> AdaptiveRateLimiter:
+    """
+    이름별 공용 limiter (모든 크롤러/geocoder가 같은 호스트 제한을 공유)
+
+    우선순위: set_rate_override > .env의 {NAME}_RATE=시작[:최대] > config.RATE_LIMITS
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            start, maximum = RATE_LIMITS[name]
+            env_spec = os.getenv(f"{name.upper()}_RATE")
+            if env_spec:
+                start, env_max = parse_rate_spec(env_spec)
+                maximum = env_max or max(start, maximum)
+            if name in _overrides:
+                start, override_max = _overrides[name]
+                maximum = override_max or max(start, maximum)
+            _limiters[name] = AdaptiveRateLimiter(
+                name,
+                start,
+                max_rate=maximum,
+                ledger=RateLedger.open() if RATE_SHARED else None,
+                daily_quota=DAILY_QUOTAS.get(name, 0),
+            )
+        return _limiters[name]
+
+
+def rate_report() -> list[str]:
+    """사용한 limiter들의 현재 속도"""
+    with _limiters_lock:
+        return [limiter.report() for limiter in _limiters.values()]
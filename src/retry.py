@@ -0,0 +1,231 @@
+"""재시도 정책 모듈 - 지터 백오프, Retry-After, 회사별 제한 시간"""
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from src.config import (
+    MAX_RETRIES,
+    RETRY_BACKOFF,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    COMPANY_DEADLINES,
+)
+from src.http_cache import OfflineCacheMiss
+from src.ratelimit import QuotaExceeded
+
+T = TypeVar("T")
+
+
+class RetryableStatus(Exception):
+    """재시도할 HTTP 응답 (429, 5xx)"""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status}")
+
+
+class DeadlineExceeded(Exception):
+    """회사 하나에 주어진 처리 시간 초과"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 시간(초)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def raise_for_retry(status: int, headers=None):
+    """429/5xx 응답이면 RetryableStatus (requests/aiohttp 응답 모두 사용)"""
+    if status == 429 or status >= 500:
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        raise RetryableStatus(status, retry_after)
+
+
+class Deadline:
+    """제한 시간 (time.monotonic 기준)"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self):
+        if self.expired:
+            raise DeadlineExceeded(f"처리 시간 {self.seconds:.0f}초 초과")
+
+    async def wait_for(self, awaitable: Awaitable[T]) -> T:
+        """남은 시간 안에 끝나지 않으면 취소하고 DeadlineExceeded"""
+        try:
+            return await asyncio.wait_for(awaitable, max(0.0, self.remaining()))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"처리 시간 {self.seconds:.0f}초 초과") from None
+
+
+# 현재 처리 중인 회사의 제한 시간 (스레드/asyncio 태스크별로 따로 유지)
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def check_deadline():
+    """현재 회사의 제한 시간이 지났으면 DeadlineExceeded"""
+    deadline = _current_deadline.get()
+    if deadline:
+        deadline.check()
+
+
+def request_timeout(default: float = 10) -> float:
+    """요청 timeout (현재 회사의 남은 시간을 넘지 않도록)"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    deadline.check()
+    return max(0.1, min(default, deadline.remaining()))
+
+
+class RetryPolicy:
+    """
+    공용 재시도 정책
+
+    - 재시도 대기: full jitter (0 ~ min(max_delay, base_delay * backoff^시도))
+    - RetryableStatus에 Retry-After가 있으면 그보다 먼저 재시도하지 않음
+    - 일일 한도 소진/오프라인 캐시 없음/제한 시간 초과는 재시도하지 않음
+    - 다음 시도가 현재 회사의 제한 시간을 넘기면 바로 DeadlineExceeded
+    """
+
+    FATAL = (QuotaExceeded, OfflineCacheMiss, DeadlineExceeded)
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRIES,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        backoff: float = RETRY_BACKOFF,
+        retry_on: tuple = (Exception,),
+        verbose: bool = True,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.retry_on = retry_on
+        self.verbose = verbose
+
+    def is_retryable(self, error: BaseException) -> bool:
+        return isinstance(error, self.retry_on) and not isinstance(error, self.FATAL)
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간"""
+        ceiling = min(self.max_delay, self.base_delay * self.backoff ** attempt)
+        delay = random.uniform(0, ceiling)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _next_delay(self, attempt: int, error: Exception, label: str) -> float:
+        """재시도 전 대기 시간 (재시도하지 않을 거면 error를 다시 던짐)"""
+        if not self.is_retryable(error) or attempt + 1 >= self.max_attempts:
+            raise error
+        delay = self.delay(attempt, error)
+        deadline = _current_deadline.get()
+        if deadline and delay >= deadline.remaining():
+            raise DeadlineExceeded(
+                f"처리 시간 {deadline.seconds:.0f}초 안에 재시도 불가 ({error})"
+            ) from error
+        if self.verbose:
+            prefix = f"{label}: " if label else ""
+            print(f"  [재시도 {attempt + 1}/{self.max_attempts}] {prefix}{error} ({delay:.1f}초 후)")
+        return delay
+
+    def call(self, fn: Callable[[], T], label: str = "") -> T:
+        """fn 실행 (재시도 가능한 오류면 대기 후 다시 실행, 마지막 오류는 그대로 던짐)"""
+        for attempt in range(self.max_attempts):
+            check_deadline()
+            try:
+                return fn()
+            except Exception as e:
+                time.sleep(self._next_delay(attempt, e, label))
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]], label: str = "") -> T:
+        """call의 asyncio 버전"""
+        for attempt in range(self.max_attempts):
+            check_deadline()
+            try:
+                return await fn()
+            except Exception as e:
+                await asyncio.sleep(self._next_delay(attempt, e, label))
+
+
+class LatencyStats:
+    """
+    회사별 처리 시간 기록 (꼬리 지연 확인용)
+
+    with stats.company(): 안에서 회사 하나를 처리하면 제한 시간을 설정하고
+    걸린 시간을 기록합니다. 여러 워커 스레드가 함께 써도 됩니다.
+    """
+
+    def __init__(self, name: str, deadline: Optional[float] = None):
+        self.name = name
+        self.deadline = deadline or COMPANY_DEADLINES.get(name, COMPANY_DEADLINES["default"])
+        self.samples: list[float] = []
+        self.timeouts = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def company(self):
+        """회사 하나 처리 (제한 시간 설정 + 소요 시간 기록)"""
+        deadline = Deadline(self.deadline)
+        token = _current_deadline.set(deadline)
+        started = time.monotonic()
+        timed_out = False
+        try:
+            yield deadline
+        except DeadlineExceeded:
+            timed_out = True
+            raise
+        finally:
+            _current_deadline.reset(token)
+            with self.lock:
+                self.samples.append(time.monotonic() - started)
+                self.timeouts += int(timed_out)
+
+    def percentile(self, p: float) -> float:
+        with self.lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+    def summary(self) -> str:
+        if not self.samples:
+            return f"회사당 처리 시간({self.name}): 기록 없음"
+        return (
+            f"회사당 처리 시간({self.name}): p50 {self.percentile(0.5):.1f}초, "
+            f"p95 {self.percentile(0.95):.1f}초, p99 {self.percentile(0.99):.1f}초, "
+            f"최대 {max(self.samples):.1f}초 "
+            f"({len(self.samples)}개, 제한 {self.deadline:.0f}초 초과 {self.timeouts}개)"
+        )
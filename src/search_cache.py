@@ -0,0 +1,208 @@
+"""검색 결과 캐시 모듈 - 플랫폼별 검색어 → 후보 목록을 실행 간에 재사용"""
+import asyncio
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from src.config import (
+    SEARCH_CACHE_PATH,
+    SEARCH_CACHE_TTL_DAYS,
+    SEARCH_CACHE_NEGATIVE_TTL_DAYS,
+)
+
+
+class _Flight:
+    """진행 중인 검색 하나 (같은 검색어를 기다리는 스레드와 결과 공유)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[list] = None
+
+
+class SearchCache:
+    """
+    검색어 → 후보 목록 캐시 (SQLite)
+
+    - 결과가 있는 검색은 SEARCH_CACHE_TTL_DAYS, 결과가 없는 검색(빈 목록)은
+      SEARCH_CACHE_NEGATIVE_TTL_DAYS 동안 다시 검색하지 않습니다.
+    - 같은 검색어를 동시에 요청하면 한 번만 검색하고 결과를 나눠 씁니다.
+    - fetch가 None을 반환하거나 예외를 던지면 (요청 실패) 저장하지 않습니다.
+
+    search_cache:
+        platform    TEXT ("wanted" | "jobplanet" | "kakao" | "geocode")
+        query       TEXT (앞뒤 공백 제거, 소문자)
+        candidates  JSON 목록 (geocode는 [lat, lng])
+        fetched_at  ISO 시각
+    """
+
+    _instances: dict = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        platform: str,
+        db_path: Path = SEARCH_CACHE_PATH,
+        ttl_days: Optional[float] = None,
+        negative_ttl_days: Optional[float] = None,
+    ):
+        self.platform = platform
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self.ttl = timedelta(days=ttl_days or SEARCH_CACHE_TTL_DAYS)
+        self.negative_ttl = timedelta(days=negative_ttl_days or SEARCH_CACHE_NEGATIVE_TTL_DAYS)
+        self.stats = {"hit": 0, "negative_hit": 0, "shared": 0, "miss": 0}
+        self._inflight: dict[str, _Flight] = {}
+        self._inflight_async: dict[str, asyncio.Future] = {}
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    platform TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    candidates TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    PRIMARY KEY (platform, query)
+                )
+                """
+            )
+
+    @classmethod
+    def open(
+        cls,
+        platform: str,
+        db_path: Path = SEARCH_CACHE_PATH,
+        ttl_days: Optional[float] = None,
+        negative_ttl_days: Optional[float] = None,
+    ) -> "SearchCache":
+        """플랫폼별로 하나의 캐시를 공유 (워커 간 진행 중 검색 공유를 위해)"""
+        key = (platform, str(Path(db_path).resolve()))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(platform, db_path, ttl_days, negative_ttl_days)
+            return cls._instances[key]
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return " ".join(query.split()).lower()
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def get(self, query: str) -> Optional[list]:
+        """유효한 캐시 결과 (없거나 만료되면 None, 결과 없음은 빈 목록)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT candidates, fetched_at FROM search_cache WHERE platform = ? AND query = ?",
+                (self.platform, self._key(query)),
+            ).fetchone()
+        if not row:
+            return None
+
+        candidates = json.loads(row[0])
+        ttl = self.ttl if candidates else self.negative_ttl
+        if datetime.now() - datetime.fromisoformat(row[1]) >= ttl:
+            return None
+        return candidates
+
+    def put(self, query: str, candidates: list):
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO search_cache (platform, query, candidates, fetched_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(platform, query) DO UPDATE SET
+                    candidates = excluded.candidates, fetched_at = excluded.fetched_at
+                """,
+                (
+                    self.platform,
+                    self._key(query),
+                    json.dumps(candidates, ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+    def _cached(self, query: str) -> Optional[list]:
+        candidates = self.get(query)
+        if candidates is not None:
+            self._count("hit" if candidates else "negative_hit")
+        return candidates
+
+    def get_or_fetch(self, query: str, fetch: Callable[[], Optional[list]]) -> Optional[list]:
+        """캐시에 없으면 fetch로 검색 (같은 검색어를 검색 중인 스레드가 있으면 그 결과를 기다림)"""
+        candidates = self._cached(query)
+        if candidates is not None:
+            return candidates
+
+        key = self._key(query)
+        with self.lock:
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = _Flight()
+
+        if not owner:
+            flight.event.wait()
+            if flight.result is not None:
+                self._count("shared")
+                return flight.result
+            # 먼저 검색한 쪽이 실패하면 직접 검색
+
+        try:
+            self._count("miss")
+            candidates = fetch()
+            if candidates is not None:
+                self.put(query, candidates)
+            flight.result = candidates
+            return candidates
+        finally:
+            if owner:
+                with self.lock:
+                    self._inflight.pop(key, None)
+                flight.event.set()
+
+    async def get_or_fetch_async(
+        self, query: str, fetch: Callable[[], Awaitable[Optional[list]]]
+    ) -> Optional[list]:
+        """get_or_fetch의 asyncio 버전 (같은 이벤트 루프의 코루틴끼리 검색 공유, SQLite는 스레드에서)"""
+        candidates = await asyncio.to_thread(self._cached, query)
+        if candidates is not None:
+            return candidates
+
+        key = self._key(query)
+        future = self._inflight_async.get(key)
+        if future is not None:
+            result = await asyncio.shield(future)
+            if result is not None:
+                self._count("shared")
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_async[key] = future
+        candidates = None
+        try:
+            self._count("miss")
+            candidates = await fetch()
+            if candidates is not None:
+                await asyncio.to_thread(self.put, query, candidates)
+            return candidates
+        finally:
+            if self._inflight_async.get(key) is future:
+                del self._inflight_async[key]
+            future.set_result(candidates)
+
+    def summary(self) -> str:
+        s = self.stats
+        saved = s["hit"] + s["negative_hit"] + s["shared"]
+        return (
+            f"검색 캐시({self.platform}): 검색 {s['miss']}회, 생략 {saved}회 "
+            f"(적중 {s['hit']}, 결과 없음 {s['negative_hit']}, 동시 요청 공유 {s['shared']})"
+        )
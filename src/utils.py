@@ -2,13 +2,36 @@
 import csv
 import os
 import re
+import threading
+from functools import lru_cache
+from typing import Optional
+
 import pandas as pd
 
+from src.config import MATCH_ACCEPT_SCORE, MATCH_MIN_SCORE
+from src.geocoding.address import SIDO_ALIASES
+
 
 # ============================================================
 # 회사명 정규화 함수
 # ============================================================
 
+# 회사명 정규화 패턴 (미리 컴파일)
+ENGLISH_NAME_RE = re.compile(r'\(([A-Za-z][A-Za-z0-9\s.,&]+(?:Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)?)\s*\)')
+ENGLISH_SUFFIX_RE = re.compile(r'\s*(Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)\s*$', re.IGNORECASE)
+KOREAN_STRIP_PATTERNS = [
+    re.compile(r'^(?:[\(（]주[\)）]?|주[\)）])\s*'),  # (주), 주) - 주로 시작하는 이름(주원산업)은 그대로
+    re.compile(r'^㈜\s*'),
+    re.compile(r'\s*주식회사\s*'),
+    re.compile(r'\s*유한회사\s*'),
+    re.compile(r'\s*유한책임회사\s*'),
+    re.compile(r'\s*\([A-Za-z][^)]*\)\s*'),  # 영문 괄호 부분
+    re.compile(r'\s*[\(（]주[\)）]$'),  # 끝에 붙은 (주)
+]
+WHITESPACE_RE = re.compile(r'\s+')
+SPECIAL_CHARS_RE = re.compile(r'[&\-.,]')
+
+
 def normalize_company_name(name: str) -> dict:
     """
     회사명을 정규화하여 검색에 적합한 형태로 변환
@@ -28,30 +51,19 @@ def normalize_company_name(name: str) -> dict:
 
     # 1. 영문명 추출 (괄호 안의 영문)
     english = None
-    eng_match = re.search(r'\(([A-Za-z][A-Za-z0-9\s.,&]+(?:Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)?)\s*\)', name)
+    eng_match = ENGLISH_NAME_RE.search(name)
     if eng_match:
         english = eng_match.group(1).strip()
         # 영문명에서 법인 형태 제거
-        english = re.sub(r'\s*(Co\.?,?\s*Ltd\.?|Inc\.?|LLC|Corp\.?)\s*$', '', english, flags=re.IGNORECASE).strip()
+        english = ENGLISH_SUFFIX_RE.sub('', english).strip()
 
-    # 2. 한글 이름 정규화
+    # 2. 한글 이름 정규화 (접두어/접미어, 영문 괄호 제거)
     korean = name
-
-    # 접두어/접미어 제거
-    korean = re.sub(r'^[\(（]?주[\)）]?\s*', '', korean)  # (주), ㈜
-    korean = re.sub(r'^㈜\s*', '', korean)
-    korean = re.sub(r'\s*주식회사\s*', '', korean)
-    korean = re.sub(r'\s*유한회사\s*', '', korean)
-    korean = re.sub(r'\s*유한책임회사\s*', '', korean)
-
-    # 영문 괄호 부분 제거
-    korean = re.sub(r'\s*\([A-Za-z][^)]*\)\s*', '', korean)
-
-    # 끝에 붙은 (주) 제거
-    korean = re.sub(r'\s*[\(（]주[\)）]$', '', korean)
+    for pattern in KOREAN_STRIP_PATTERNS:
+        korean = pattern.sub('', korean)
 
     # 공백 정규화
-    korean = re.sub(r'\s+', ' ', korean).strip()
+    korean = WHITESPACE_RE.sub(' ', korean).strip()
 
     # 3. 검색 변형 생성
     search_variants = []
@@ -70,7 +82,7 @@ def normalize_company_name(name: str) -> dict:
         search_variants.append(no_space)
 
     # 특수문자 제거 버전
-    clean = re.sub(r'[&\-.,]', '', korean)
+    clean = SPECIAL_CHARS_RE.sub('', korean)
     if clean != korean and clean:
         search_variants.append(clean)
 
@@ -85,66 +97,288 @@ def normalize_company_name(name: str) -> dict:
     }
 
 
-def similarity_score(name1: str, name2: str) -> float:
-    """두 회사명의 유사도 점수 계산 (0.0 ~ 1.0)"""
-    if not name1 or not name2:
-        return 0.0
+class _NormalizedName:
+    """비교에 필요한 정규화 결과 (캐시 보관용, 변경 불가)"""
 
-    # 정규화
-    n1 = normalize_company_name(name1)['korean'].lower()
-    n2 = normalize_company_name(name2)['korean'].lower()
+    __slots__ = ('korean', 'lower', 'chars', 'english')
 
-    if not n1 or not n2:
-        return 0.0
+    def __init__(self, name: str):
+        normalized = normalize_company_name(name)
+        self.korean = normalized['korean']
+        self.lower = self.korean.lower()
+        self.chars = frozenset(self.lower.replace(' ', ''))
+        self.english = normalized['english'].lower() if normalized['english'] else None
 
-    # 완전 일치
-    if n1 == n2:
-        return 1.0
 
-    # 포함 관계
-    if n1 in n2:
-        return len(n1) / len(n2)
-    if n2 in n1:
-        return len(n2) / len(n1)
+class NameMatcher:
+    """
+    회사명 매칭기
 
-    # 공통 문자 비율 (간단한 유사도)
-    set1 = set(n1.replace(' ', ''))
-    set2 = set(n2.replace(' ', ''))
-    if not set1 or not set2:
-        return 0.0
+    회사명마다 정규화 결과를 LRU 캐시(cache_size개)에 보관하므로 같은 검색어/후보를
+    여러 번 비교해도 정규화는 한 번만 합니다. matches()는 검색어 하나와
+    후보 목록 전체를 한 번에 비교합니다. 결과는 similarity_score/is_good_match와 같습니다.
+    """
 
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
+    def __init__(self, threshold: float = 0.6, cache_size: int = 8192):
+        self.threshold = threshold
+        self._normalized = lru_cache(maxsize=cache_size)(_NormalizedName)
+
+    def normalized(self, name: str) -> _NormalizedName:
+        """캐시된 정규화 결과 (korean, lower, chars, english)"""
+        return self._normalized(name)
+
+    def korean(self, name: str) -> str:
+        """한글 핵심 이름 (normalize_company_name(name)['korean'])"""
+        return self._normalized(name or '').korean
+
+    def cache_info(self):
+        return self._normalized.cache_info()
+
+    @staticmethod
+    def _score(n1: _NormalizedName, n2: _NormalizedName) -> float:
+        a, b = n1.lower, n2.lower
+        if not a or not b:
+            return 0.0
+        # 완전 일치
+        if a == b:
+            return 1.0
+        # 포함 관계
+        if a in b:
+            return len(a) / len(b)
+        if b in a:
+            return len(b) / len(a)
+        # 공통 문자 비율
+        union = len(n1.chars | n2.chars)
+        return len(n1.chars & n2.chars) / union if union else 0.0
+
+    def is_normalized_match(
+        self, n1: _NormalizedName, n2: _NormalizedName, threshold: Optional[float] = None
+    ) -> bool:
+        """정규화 결과(normalized())끼리 좋은 매칭인지"""
+        threshold = self.threshold if threshold is None else threshold
+        if self._score(n1, n2) >= threshold:
+            return True
+        # 한글 이름 포함 관계
+        if n1.korean and n2.korean and (n1.korean in n2.korean or n2.korean in n1.korean):
+            return True
+        # 영문명 일치
+        return bool(n1.english and n2.english and n1.english == n2.english)
+
+    def score(self, name1: str, name2: str) -> float:
+        """두 회사명의 유사도 점수 (0.0 ~ 1.0)"""
+        if not name1 or not name2:
+            return 0.0
+        return self._score(self._normalized(name1), self._normalized(name2))
+
+    def scores(self, query: str, candidates: list[str]) -> list[float]:
+        """검색어와 후보 목록 전체의 유사도 점수"""
+        if not query:
+            return [0.0] * len(candidates)
+        n1 = self._normalized(query)
+        return [self._score(n1, self._normalized(c)) if c else 0.0 for c in candidates]
+
+    def is_match(self, query: str, candidate: str, threshold: Optional[float] = None) -> bool:
+        """검색 결과가 좋은 매칭인지 판단"""
+        return self.is_normalized_match(
+            self._normalized(query or ''),
+            self._normalized(candidate or ''),
+            threshold,
+        )
+
+    def matches(
+        self, query: str, candidates: list[str], threshold: Optional[float] = None
+    ) -> list[bool]:
+        """후보마다 좋은 매칭인지"""
+        threshold = self.threshold if threshold is None else threshold
+        n1 = self._normalized(query or '')
+        return [self.is_normalized_match(n1, self._normalized(c or ''), threshold) for c in candidates]
+
+
+# 크롤러가 함께 쓰는 매칭기 (정규화 캐시 공유)
+name_matcher = NameMatcher()
 
-    return intersection / union if union > 0 else 0.0
+
+def similarity_score(name1: str, name2: str) -> float:
+    """두 회사명의 유사도 점수 계산 (0.0 ~ 1.0)"""
+    return name_matcher.score(name1, name2)
 
 
 def is_good_match(search_name: str, result_name: str, threshold: float = 0.6) -> bool:
     """검색 결과가 좋은 매칭인지 판단"""
-    score = similarity_score(search_name, result_name)
+    return name_matcher.is_match(search_name, result_name, threshold)
 
-    # 점수 기반 판단
-    if score >= threshold:
-        return True
 
-    # 정규화된 이름 비교
-    s_norm = normalize_company_name(search_name)
-    r_norm = normalize_company_name(result_name)
+def name_ngrams(text: str, n: int = 2) -> frozenset:
+    """공백을 뺀 문자 n-gram 집합 (n보다 짧으면 문자열 자체)"""
+    text = text.replace(' ', '').lower()
+    if len(text) < n:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
 
-    # 한글 이름 포함 관계
-    s_korean = s_norm['korean']
-    r_korean = r_norm['korean']
 
-    if s_korean and r_korean:
-        if s_korean in r_korean or r_korean in s_korean:
-            return True
+# 시/도 약칭 → 정식 명칭들 (후보 지역 비교용)
+SIDO_FORMS: dict[str, list[str]] = {}
+for _full, _short in SIDO_ALIASES.items():
+    SIDO_FORMS.setdefault(_short, [_short]).append(_full)
+
+
+class CandidateRanker:
+    """
+    검색 결과 후보 순위 매기기
+
+    회사 하나에 대해 검색어마다 받은 후보를 offer()로 넘기면, 후보마다
+    정규화 회사명의 문자 bigram Jaccard 유사도에 영문명/지역/설립연도 보너스를 더해
+    점수(0~1)를 매기고 지금까지의 최고 후보를 기억합니다.
+    최고 점수가 accept 이상이면 offer()가 True를 반환하므로 남은 검색어는 생략합니다.
+
+    choice(): 최고 후보 (minimum 미만이면 첫 검색 결과가 3개 이하일 때만 첫 번째 후보)
+    """
 
-    # 영문명 일치
-    if s_norm['english'] and r_norm['english']:
-        if s_norm['english'].lower() == r_norm['english'].lower():
+    def __init__(
+        self,
+        company_name: str,
+        sido: Optional[str] = None,
+        sigungu: Optional[str] = None,
+        founded_year: Optional[int] = None,
+        accept: float = MATCH_ACCEPT_SCORE,
+        minimum: float = MATCH_MIN_SCORE,
+        matcher: Optional['NameMatcher'] = None,
+    ):
+        self.company_name = company_name
+        self.matcher = matcher or name_matcher
+        self.query = self.matcher.normalized(company_name or '')
+        self.grams = name_ngrams(self.query.korean)
+        self.sido_forms = SIDO_FORMS.get(sido, [sido]) if sido else []
+        self.sigungu = sigungu
+        self.founded_year = founded_year
+        self.accept = accept
+        self.minimum = minimum
+        self.best = None
+        self.best_score = 0.0
+        self.searches = 0
+        self.accepted_at: Optional[int] = None  # 몇 번째 검색어에서 확정했는지
+        self._first_results: Optional[list] = None
+
+    @classmethod
+    def for_company(cls, company, founded_year: Optional[int] = None) -> 'CandidateRanker':
+        """Company의 이름/시도/시군구로 생성"""
+        return cls(
+            company.name,
+            sido=getattr(company, 'sido', None),
+            sigungu=getattr(company, 'sigungu', None),
+            founded_year=founded_year,
+        )
+
+    def score(
+        self,
+        name: str,
+        query: str = '',
+        region: Optional[str] = None,
+        founded_year: Optional[int] = None,
+    ) -> float:
+        """후보 하나의 점수 (0~1)"""
+        candidate = self.matcher.normalized(name or '')
+        if not candidate.korean:
+            return 0.0
+
+        if candidate.lower == self.query.lower:
+            score = 1.0
+        else:
+            grams = name_ngrams(candidate.korean)
+            union = len(self.grams | grams)
+            score = len(self.grams & grams) / union if union else 0.0
+            # 기존 기준(is_good_match, 검색어 포함)을 통과하면 최소 점수는 보장
+            if self.matcher.is_normalized_match(self.query, candidate) or (
+                query and query.lower() in candidate.lower
+            ):
+                score = max(score, self.minimum)
+
+        # 영문명 일치
+        if self.query.english and self.query.english in (
+            candidate.english, (name or '').strip().lower()
+        ):
+            score += 0.2
+
+        # 지역 (후보에 지역 정보가 있을 때만)
+        if region and self.sido_forms:
+            if self.sigungu and self.sigungu in region:
+                score += 0.1
+            elif any(form in region for form in self.sido_forms):
+                score += 0.05
+            else:
+                score -= 0.1
+
+        # 설립연도 (양쪽 다 알 때만)
+        if self.founded_year and founded_year:
+            try:
+                gap = abs(int(founded_year) - int(self.founded_year))
+            except (TypeError, ValueError):
+                gap = None
+            if gap == 0:
+                score += 0.1
+            elif gap is not None and gap > 1:
+                score -= 0.15
+
+        return max(0.0, min(1.0, score))
+
+    def offer(self, query: str, candidates: list, name=None, region=None, founded_year=None) -> bool:
+        """
+        검색어 하나의 후보 목록 평가 (확정할 만큼 좋은 후보가 있으면 True)
+
+        name/region/founded_year: 후보에서 회사명/지역/설립연도를 꺼내는 함수 (name 기본값은 후보 자체)
+        """
+        self.searches += 1
+        if candidates and self._first_results is None:
+            self._first_results = candidates
+        for candidate in candidates:
+            score = self.score(
+                name(candidate) if name else candidate,
+                query,
+                region(candidate) if region else None,
+                founded_year(candidate) if founded_year else None,
+            )
+            if score > self.best_score:
+                self.best, self.best_score = candidate, score
+        if self.best_score >= self.accept:
+            self.accepted_at = self.searches
             return True
+        return False
+
+    def choice(self):
+        """선택한 후보 (없으면 None)"""
+        if self.best is not None and self.best_score >= self.minimum:
+            return self.best
+        # 매칭 실패해도 첫 검색 결과가 3개 이하면 첫 번째 사용 (기존 규칙)
+        if self._first_results and len(self._first_results) <= 3:
+            print(f"    (검색 결과 {len(self._first_results)}개, 첫 번째 사용)")
+            return self._first_results[0]
+        return None
+
 
-    return False
+class SearchStats:
+    """회사당 검색어 수 집계 (워커 간 공유)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.companies = 0
+        self.searches = 0
+        self.first_accepted = 0  # 첫 검색어에서 확정
+        self.lock = threading.Lock()
+
+    def record(self, ranker: CandidateRanker):
+        with self.lock:
+            self.companies += 1
+            self.searches += ranker.searches
+            if ranker.accepted_at == 1:
+                self.first_accepted += 1
+
+    def summary(self) -> str:
+        if not self.companies:
+            return f"검색({self.name}): 기록 없음"
+        return (
+            f"검색({self.name}): 회사당 평균 {self.searches / self.companies:.2f}회 "
+            f"({self.companies}개 회사, 첫 검색어에서 확정 {self.first_accepted}개)"
+        )
 
 
 # ============================================================
@@ -0,0 +1,270 @@
+"""원티드 비동기 크롤러 모듈 - 여러 회사를 동시에 처리"""
+import asyncio
+import json
+import time
+from typing import Optional
+
+from src.config import WANTED_CONCURRENCY
+from src.http_cache import OfflineCacheMiss, is_offline
+from src.models import WantedData
+from src.pipeline.scheduler import RefreshScheduler
+from src.ratelimit import QuotaExceeded
+from src.retry import DeadlineExceeded, raise_for_retry
+from src.utils import normalize_company_name
+from src.wanted.crawler import WantedCrawler
+
+
+class AsyncWantedCrawler(WantedCrawler):
+    """
+    원티드 비동기 크롤러
+
+    API 요청은 concurrency개 회사를 동시에 처리하고, 요청 속도는 동기 크롤러와 같은
+    원티드 호스트 limiter로 제한합니다. API로 못 찾은 회사만 마지막에
+    기존 Selenium 백업으로 순차 처리합니다.
+    """
+
+    def __init__(self, headless: bool = True, concurrency: int = WANTED_CONCURRENCY):
+        super().__init__(headless=headless)
+        self.concurrency = concurrency
+        self.limiter = self.session.limiter
+        self.http = None  # aiohttp.ClientSession (crawl 중에만)
+
+    async def _get_json(self, url: str, params: dict = None) -> Optional[dict]:
+        """GET 요청 (200이 아니면 None, 연결 오류/429/5xx는 재시도 정책에 따라 재시도)"""
+        return await self.retry.call_async(
+            lambda: self._get_json_once(url, params), label=url.replace(self.BASE_URL, "")
+        )
+
+    async def _get_json_once(self, url: str, params: dict = None) -> Optional[dict]:
+        """GET 요청 1회 (동기 크롤러와 같은 HTTP 캐시 사용, 캐시 파일 읽기/쓰기는 스레드에서)"""
+        cache = self.session.cache
+        full_url = cache.request_url(url, params)
+        key = cache.key("GET", full_url)
+        entry = await asyncio.to_thread(cache.load, key)
+
+        if entry and (is_offline() or cache.is_fresh(entry)):
+            cache.count("hit")
+            return json.loads(entry["body"])
+        if is_offline():
+            raise OfflineCacheMiss(f"오프라인 모드: 캐시 없음 ({full_url})")
+
+        await self.limiter.acquire_async()
+        cache.count("miss")
+        started = time.monotonic()
+        try:
+            response = await self.http.get(full_url, headers=cache.conditional_headers(entry))
+        except Exception:
+            self.limiter.record(time.monotonic() - started, error=True)
+            raise
+        self.limiter.record(time.monotonic() - started, response.status)
+
+        async with response:
+            raise_for_retry(response.status, response.headers)
+            if response.status == 304 and entry:
+                cache.count("revalidated")
+                await asyncio.to_thread(cache.touch, key, entry)
+                return json.loads(entry["body"])
+            if response.status != 200:
+                return None
+            body = await response.read()
+            await asyncio.to_thread(cache.store, key, full_url, 200, response.headers, body)
+            return json.loads(body)
+
+    async def search_company_api_async(self, company_name: str, company=None) -> Optional[dict]:
+        """API로 회사 검색 (search_company_api와 동일한 선택 규칙)"""
+        ranker = self._new_ranker(company_name, company)
+
+        for search_query in normalize_company_name(company_name)['search_variants']:
+            try:
+                companies = await self.search_cache.get_or_fetch_async(
+                    search_query, lambda: self._search_api_async(search_query)
+                )
+            except (QuotaExceeded, DeadlineExceeded):
+                raise
+            except Exception as e:
+                print(f"  API 검색 실패 ({search_query}): {e}")
+                continue
+            await asyncio.to_thread(self.remember, companies)
+            if self._offer(ranker, search_query, companies):
+                break
+
+        self.search_stats.record(ranker)
+        return ranker.choice()
+
+    async def _search_api_async(self, search_query: str) -> Optional[list]:
+        """검색 API 호출 (검색 결과 회사 목록, 요청 실패 시 None)"""
+        data = await self._get_json(
+            self.SEARCH_API, params={"query": search_query, "country": "kr"}
+        )
+        if data is None:
+            return None
+        return data.get("data", {}).get("companies", [])
+
+    async def get_company_detail_api_async(
+        self, company_id: int, search_data: dict = None, pages: Optional[dict] = None
+    ) -> Optional[WantedData]:
+        """API로 회사 상세 정보 + 채용공고 동시 조회 (pages: 원본 보관용)"""
+        detail_url = f"{self.COMPANY_API}/{company_id}"
+        jobs_url = f"{self.COMPANY_API}/{company_id}/jobs"
+        detail, jobs_json = await asyncio.gather(
+            self._get_json(detail_url),
+            self._get_json(jobs_url),
+            return_exceptions=True,
+        )
+
+        for result in (detail, jobs_json):
+            if isinstance(result, (QuotaExceeded, DeadlineExceeded)):
+                raise result
+        if isinstance(detail, Exception):
+            print(f"  API 상세 조회 실패: {detail}")
+            return None
+        if detail is None:
+            return None
+
+        jobs = []
+        if isinstance(jobs_json, dict):
+            try:
+                jobs = self._parse_jobs(jobs_json)
+            except Exception:
+                pass
+
+        if pages is not None:
+            self._capture("detail", detail_url, json.dumps(detail, ensure_ascii=False), pages)
+            if isinstance(jobs_json, dict):
+                self._capture("jobs", jobs_url, json.dumps(jobs_json, ensure_ascii=False), pages)
+            if search_data:
+                self._capture(
+                    "search", self.SEARCH_API, json.dumps(search_data, ensure_ascii=False), pages
+                )
+
+        return self._parse_api_response(detail.get("company", {}), search_data, jobs)
+
+    async def _crawl_one(self, company, pages: dict) -> Optional[WantedData]:
+        """회사 하나 처리 (API만, 받은 원본은 pages에 보관)"""
+        data = None
+
+        # 1단계: 이미 URL이 있으면 바로 사용
+        existing_url = self.known_url(company)
+        if existing_url:
+            company_id = self._company_id_from_url(existing_url)
+            if company_id:
+                data = await self.get_company_detail_api_async(company_id, pages=pages)
+
+        # 2단계: 이전 검색 결과에서 본 회사면 검색 생략
+        if not data:
+            index_url = await asyncio.to_thread(self.find_in_index, company)
+            company_id = self._company_id_from_url(index_url)
+            if company_id:
+                data = await self.get_company_detail_api_async(company_id, pages=pages)
+
+        # 3단계: 못 찾으면 검색
+        if not data:
+            company_data = await self.search_company_api_async(company.name, company)
+            if company_data and company_data.get("id"):
+                data = await self.get_company_detail_api_async(
+                    company_data["id"], company_data, pages
+                )
+
+        return data
+
+    async def _crawl_async(self, targets: list) -> tuple[dict, list, Optional[QuotaExceeded]]:
+        """API 단계: (결과, Selenium 백업이 필요한 회사 목록, 일일 한도 소진 여부)"""
+        import aiohttp
+
+        results = {}
+        fallback = []
+        deferred: list[QuotaExceeded] = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = 0
+        total = len(targets)
+
+        async def worker(company):
+            nonlocal done
+            async with semaphore:
+                if deferred:
+                    return  # 한도 소진 후 남은 회사는 다음 실행으로
+                pages = {}
+                try:
+                    with self.latency.company() as deadline:
+                        data = await deadline.wait_for(self._crawl_one(company, pages))
+                except QuotaExceeded as e:
+                    deferred.append(e)
+                    return
+                except Exception as e:
+                    self.progress.mark_failed(company.id, str(e))
+                    print(f"  [에러] {company.name}: {e}")
+                    return
+
+            done += 1
+            print(f"[{done}/{total}] {company.name}")
+            if data:
+                self._record_result(company.id, data, results, pages)
+            else:
+                fallback.append(company)
+                print("  API 검색 결과 없음 (Selenium 백업 예정)")
+
+        headers = dict(self.session.headers)
+        connector = aiohttp.TCPConnector(limit=self.concurrency * 2)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(
+            headers=headers, connector=connector, timeout=timeout
+        ) as http:
+            self.http = http
+            try:
+                await asyncio.gather(*(worker(c) for c in targets))
+            finally:
+                self.http = None
+
+        return results, fallback, deferred[0] if deferred else None
+
+    def crawl_companies(
+        self, companies: list, limit: Optional[int] = None, links: Optional[dict] = None
+    ) -> dict[str, WantedData]:
+        """여러 회사 동시 크롤링 (links: 연결 테이블의 회사 ID -> URL)"""
+        self.links = links or {}
+        company_ids = [c.id for c in companies]
+        pending = RefreshScheduler(self.progress).select(company_ids, limit=limit)
+
+        by_id = {c.id: c for c in companies}
+        targets = [by_id[company_id] for company_id in pending if company_id in by_id]
+        print(
+            f"원티드 비동기 크롤링 시작: {len(targets)}개 회사 "
+            f"(동시 {self.concurrency}개, 시작 속도 초당 {self.limiter.rate:.2f}회)"
+        )
+
+        results, fallback, deferred = asyncio.run(self._crawl_async(targets))
+        if deferred:
+            # 실패로 기록하지 않고 남은 회사는 다음 실행으로 미룸
+            remaining = len(targets) - len(results) - len(fallback)
+            print(f"  [대기] {deferred}")
+            print(
+                f"  남은 {remaining}개 회사는 "
+                f"{deferred.reset_at:%m-%d %H:%M} 이후 다시 실행하세요."
+            )
+
+        # API로 못 찾은 회사는 Selenium 백업 (순차)
+        if fallback:
+            print(f"\nSelenium 백업: {len(fallback)}개 회사")
+        for idx, company in enumerate(fallback, 1):
+            print(f"[{idx}/{len(fallback)}] {company.name}")
+            self._captured = {}
+            try:
+                data = self.search_company_selenium(company.name)
+                self._record_result(company.id, data, results)
+            except Exception as e:
+                self.progress.mark_failed(company.id, str(e))
+                print(f"  [에러] {e}")
+
+        stats = self.progress.get_stats()
+        print(f"\n원티드 크롤링 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+        print(f"  {self.session.cache.summary()}")
+        print(f"  {self.search_cache.summary()}")
+        print(f"  {self.search_stats.summary()}")
+        if self.company_index:
+            print(f"  {self.company_index.summary()}")
+        print(f"  {self.limiter.report()}")
+        print(f"  {self.latency.summary()}")
+        if self.driver:
+            print(f"  {self.driver.report()}")
+
+        return results
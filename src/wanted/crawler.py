@@ -1,21 +1,33 @@
 """원티드 크롤러 모듈"""
+import json
 import time
 import re
-import requests
 from typing import Optional
-from selenium import webdriver
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from src.config import WANTED_RATE_LIMIT, MAX_RETRIES, RETRY_BACKOFF
+from src.browser import ManagedDriver, create_chrome
+from src.company_index import CompanyIndex
+from src.http_cache import CachedSession, is_offline
+from src.config import BROWSER_RECYCLE_PAGES, COMPANY_INDEX_ENABLED
 from src.models import WantedData, WantedJob
+from src.pipeline.archive import new_archive
 from src.pipeline.progress import ProgressTracker
-from src.utils import normalize_company_name, is_good_match
+from src.ratelimit import QuotaExceeded, get_limiter
+from src.retry import (
+    DeadlineExceeded,
+    LatencyStats,
+    RetryPolicy,
+    check_deadline,
+    raise_for_retry,
+    request_timeout,
+)
+from src.search_cache import SearchCache
+from src.pipeline.scheduler import RefreshScheduler
+from src.utils import CandidateRanker, SearchStats, normalize_company_name, is_good_match
 
 
 class WantedCrawler:
@@ -24,9 +36,11 @@ class WantedCrawler:
     BASE_URL = "https://www.wanted.co.kr"
     SEARCH_API = "https://www.wanted.co.kr/api/v4/search"
     COMPANY_API = "https://www.wanted.co.kr/api/v4/companies"
+    # 차단하지 않을 리소스 종류 (텍스트와 링크만 읽으므로 모두 차단)
+    ALLOWED_RESOURCES = ()
 
     def __init__(self, headless: bool = True):
-        self.session = requests.Session()
+        self.session = CachedSession(limiter=get_limiter("wanted"))
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -36,107 +50,179 @@ class WantedCrawler:
         self.driver = None
         self.headless = headless
         self.progress = ProgressTracker("wanted")
+        self.archive = new_archive("wanted")
+        self.search_cache = SearchCache.open("wanted")
+        self.company_index = CompanyIndex.open("wanted") if COMPANY_INDEX_ENABLED else None
+        self.retry = RetryPolicy()
+        self.latency = LatencyStats("wanted")
+        self.search_stats = SearchStats("wanted")
+        self.links: dict[str, str] = {}  # 연결 테이블의 회사 ID -> 원티드 URL
+        self._captured: dict[str, dict] = {}  # 현재 회사의 원본 응답 (종류 -> url, content)
+
+    def _capture(self, kind: str, url: str, content: str, pages: Optional[dict] = None):
+        """현재 회사의 원본 응답 보관 (_record_result에서 RawArchive에 기록)"""
+        if self.archive and content:
+            (self._captured if pages is None else pages)[kind] = {"url": url, "content": content}
 
     def _init_driver(self):
         """Selenium 드라이버 초기화 (API 실패시 백업)"""
         if self.driver:
             return
 
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.implicitly_wait(5)
+        self.driver = ManagedDriver(
+            lambda: create_chrome(headless=self.headless, allow=self.ALLOWED_RESOURCES),
+            recycle_every=BROWSER_RECYCLE_PAGES,
+        )
 
-    def search_company_api(self, company_name: str) -> Optional[dict]:
-        """API로 회사 검색 (다양한 검색어 시도)"""
-        normalized = normalize_company_name(company_name)
-        search_variants = normalized['search_variants']
+    def search_company_api(self, company_name: str, company=None) -> Optional[dict]:
+        """API로 회사 검색 (검색어마다 후보 점수를 매기고, 확실한 후보가 나오면 중단)"""
+        ranker = self._new_ranker(company_name, company)
 
-        for search_query in search_variants:
+        for search_query in normalize_company_name(company_name)['search_variants']:
             try:
-                params = {"query": search_query, "country": "kr"}
-                response = self.session.get(
-                    self.SEARCH_API, params=params, timeout=10
+                companies = self.search_cache.get_or_fetch(
+                    search_query, lambda: self._search_api(search_query)
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    companies = data.get("data", {}).get("companies", [])
-                    if companies:
-                        # 회사명과 가장 유사한 결과 선택
-                        for company in companies:
-                            result_name = company.get("name", "")
-                            if is_good_match(company_name, result_name):
-                                return company
-                        # 검색어와 정확히 일치하는 경우
-                        for company in companies:
-                            result_name = company.get("name", "")
-                            if search_query.lower() in result_name.lower():
-                                return company
-                        # 매칭 실패해도 검색 결과가 3개 이하면 첫 번째 사용
-                        if len(companies) <= 3:
-                            print(f"    (검색 결과 {len(companies)}개, 첫 번째 사용)")
-                            return companies[0]
+            except (QuotaExceeded, DeadlineExceeded):
+                raise
             except Exception as e:
                 print(f"  API 검색 실패 ({search_query}): {e}")
+                continue
+            self.remember(companies)
+            if self._offer(ranker, search_query, companies):
+                break
+
+        self.search_stats.record(ranker)
+        return ranker.choice()
+
+    def _get(self, url: str, params: Optional[dict] = None):
+        """GET 요청 (연결 오류/429/5xx는 재시도 정책에 따라 재시도)"""
+        def request():
+            response = self.session.get(url, params=params, timeout=request_timeout(10))
+            raise_for_retry(response.status_code, response.headers)
+            return response
+
+        return self.retry.call(request, label=url.replace(self.BASE_URL, ""))
+
+    def _search_api(self, search_query: str) -> Optional[list]:
+        """검색 API 호출 (검색 결과 회사 목록, 요청 실패 시 None)"""
+        params = {"query": search_query, "country": "kr"}
+        response = self._get(self.SEARCH_API, params=params)
+        if response.status_code != 200:
+            return None
+        return response.json().get("data", {}).get("companies", [])
+
+    @staticmethod
+    def _new_ranker(company_name: str, company=None) -> CandidateRanker:
+        """회사 검색용 후보 순위 (이전에 수집한 설립연도가 있으면 비교에 사용)"""
+        if not company:
+            return CandidateRanker(company_name)
+        founded_year = getattr(getattr(company, 'wanted', None), 'foundedYear', None)
+        return CandidateRanker.for_company(company, founded_year)
+
+    @staticmethod
+    def _offer(ranker: CandidateRanker, search_query: str, companies: Optional[list]) -> bool:
+        """검색 결과 후보를 ranker에 넘김 (확정할 후보가 있으면 True)"""
+        return ranker.offer(
+            search_query,
+            companies or [],
+            name=lambda c: c.get("name", ""),
+            region=lambda c: c.get("address") or c.get("location"),
+            founded_year=lambda c: c.get("founded_year"),
+        )
 
+    def remember(self, companies: Optional[list]):
+        """검색 결과의 회사를 모두 회사 인덱스에 기록"""
+        if not self.company_index or not companies:
+            return
+        self.company_index.add([
+            {
+                "name": c.get("name", ""),
+                "url": f"{self.BASE_URL}/company/{c['id']}" if c.get("id") else None,
+                "region": c.get("address") or c.get("location"),
+                "foundedYear": c.get("founded_year"),
+            }
+            for c in companies
+        ])
+
+    def known_url(self, company) -> Optional[str]:
+        """이미 아는 원티드 URL (수집 결과, 없으면 연결 테이블)"""
+        existing = getattr(company, 'wanted', None)
+        return getattr(existing, 'url', None) or self.links.get(company.id)
+
+    def find_in_index(self, company) -> Optional[str]:
+        """검색 전에 회사 인덱스에서 확실한 회사 URL 찾기"""
+        if not self.company_index:
+            return None
+        hit = self.company_index.lookup(self._new_ranker(company.name, company))
+        if hit:
+            print(f"  인덱스에서 찾음: {hit['name']} ({hit['score']:.2f})")
+            return hit["url"]
         return None
 
     def get_company_by_url(self, url: str) -> Optional[WantedData]:
         """이미 알고 있는 URL로 회사 정보 조회"""
         try:
-            # URL에서 company_id 추출
-            match = re.search(r'/company/(\d+)', url)
-            if match:
-                company_id = int(match.group(1))
+            company_id = self._company_id_from_url(url)
+            if company_id:
                 return self.get_company_detail_api(company_id)
+        except (QuotaExceeded, DeadlineExceeded):
+            raise
         except Exception as e:
             print(f"  URL 직접 조회 실패: {e}")
         return None
 
+    @staticmethod
+    def _company_id_from_url(url: str) -> Optional[int]:
+        """URL에서 company_id 추출"""
+        match = re.search(r'/company/(\d+)', url or "")
+        return int(match.group(1)) if match else None
+
     def get_company_detail_api(self, company_id: int, search_data: dict = None) -> Optional[WantedData]:
         """API로 회사 상세 정보 조회"""
         try:
             # 회사 정보 조회
-            response = self.session.get(
-                f"{self.COMPANY_API}/{company_id}", timeout=10
-            )
+            response = self._get(f"{self.COMPANY_API}/{company_id}")
 
             if response.status_code == 200:
                 data = response.json().get("company", {})
+                self._capture("detail", response.url, response.text)
+                if search_data:
+                    self._capture(
+                        "search", self.SEARCH_API, json.dumps(search_data, ensure_ascii=False)
+                    )
 
                 # 채용공고 목록 조회
                 jobs = []
                 try:
-                    jobs_response = self.session.get(
-                        f"{self.COMPANY_API}/{company_id}/jobs", timeout=10
-                    )
+                    jobs_response = self._get(f"{self.COMPANY_API}/{company_id}/jobs")
                     if jobs_response.status_code == 200:
-                        jobs_data = jobs_response.json().get("data", [])
-                        if jobs_data:
-                            jobs = [
-                                {
-                                    "title": j.get("position", ""),
-                                    "url": f"{self.BASE_URL}/wd/{j.get('id')}"
-                                }
-                                for j in jobs_data[:5]  # 최대 5개
-                            ]
+                        jobs = self._parse_jobs(jobs_response.json())
+                        self._capture("jobs", jobs_response.url, jobs_response.text)
+                except (QuotaExceeded, DeadlineExceeded):
+                    raise
                 except:
                     pass
 
                 return self._parse_api_response(data, search_data, jobs)
+        except (QuotaExceeded, DeadlineExceeded):
+            raise
         except Exception as e:
             print(f"  API 상세 조회 실패: {e}")
 
         return None
 
+    def _parse_jobs(self, jobs_json: dict) -> list:
+        """채용공고 API 응답 파싱"""
+        jobs_data = jobs_json.get("data") or []
+        return [
+            {
+                "title": j.get("position", ""),
+                "url": f"{self.BASE_URL}/wd/{j.get('id')}"
+            }
+            for j in jobs_data[:5]  # 최대 5개
+        ]
+
     def _parse_api_response(self, data: dict, search_data: dict = None, jobs: list = None) -> WantedData:
         """API 응답 파싱"""
         company_id = data.get("id")
@@ -176,12 +262,15 @@ class WantedCrawler:
 
     def search_company_selenium(self, company_name: str) -> Optional[WantedData]:
         """Selenium으로 회사 검색 (API 백업)"""
+        if is_offline():
+            return None
         self._init_driver()
 
         normalized = normalize_company_name(company_name)
         search_variants = normalized['search_variants']
 
         for search_query in search_variants:
+            check_deadline()
             try:
                 # URL 인코딩
                 from urllib.parse import quote
@@ -229,11 +318,31 @@ class WantedCrawler:
 
     def _extract_selenium_data(self, company_url: str) -> WantedData:
         """Selenium으로 회사 정보 추출"""
-        data = WantedData(url=company_url)
-
         try:
             page_text = self.driver.find_element(By.TAG_NAME, "body").text
+        except Exception as e:
+            print(f"  데이터 추출 실패: {e}")
+            return WantedData(url=company_url)
 
+        # 채용공고 링크
+        job_links = []
+        try:
+            for link in self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/wd/']")[:5]:
+                job_links.append((link.text.strip(), link.get_attribute("href")))
+        except:
+            pass
+
+        if self.archive:
+            self._capture("page", company_url, self.driver.page_source)
+        return self._parse_company_page(company_url, page_text, job_links)
+
+    def _parse_company_page(
+        self, company_url: str, page_text: str, job_links: list[tuple[str, str]]
+    ) -> WantedData:
+        """회사 페이지 텍스트/채용공고 링크에서 회사 정보 추출"""
+        data = WantedData(url=company_url)
+
+        try:
             # 채용공고 수 (페이지 텍스트에서)
             job_match = re.search(r'채용.*?(\d+)', page_text)
             if job_match:
@@ -272,27 +381,47 @@ class WantedCrawler:
                 data.employees = emp_match.group(1) + "명"
 
             # 채용공고 목록
-            try:
-                job_links = self.driver.find_elements(
-                    By.CSS_SELECTOR, "a[href*='/wd/']"
-                )[:5]
-                for link in job_links:
-                    title = link.text.strip()
-                    url = link.get_attribute("href")
-                    if title and url and len(title) > 3:
-                        data.jobs.append({"title": title, "url": url})
-            except:
-                pass
+            for title, url in job_links:
+                if title and url and len(title) > 3:
+                    data.jobs.append({"title": title, "url": url})
 
         except Exception as e:
             print(f"  데이터 추출 실패: {e}")
 
         return data
 
-    def search_company(self, company_name: str) -> Optional[WantedData]:
+    def parse_archived_pages(self, pages: dict[str, dict]) -> Optional[WantedData]:
+        """RawArchive에 보관한 API 응답/페이지 HTML에서 데이터 다시 추출"""
+        if "detail" in pages:
+            detail = json.loads(pages["detail"]["content"]).get("company", {})
+            jobs = []
+            if "jobs" in pages:
+                jobs = self._parse_jobs(json.loads(pages["jobs"]["content"]))
+            search_data = None
+            if "search" in pages:
+                search_data = json.loads(pages["search"]["content"])
+            return self._parse_api_response(detail, search_data, jobs)
+
+        if "page" in pages:
+            from lxml import html as lxml_html
+
+            doc = lxml_html.fromstring(pages["page"]["content"])
+            for elem in doc.xpath("//script | //style | //noscript"):
+                elem.drop_tree()
+            body = doc.find("body")
+            page_text = (body if body is not None else doc).text_content()
+            job_links = [
+                (link.text_content().strip(), urljoin(pages["page"]["url"], link.get("href")))
+                for link in doc.xpath("//a[contains(@href, '/wd/')]")[:5]
+            ]
+            return self._parse_company_page(pages["page"]["url"], page_text, job_links)
+
+        return None
+
+    def search_company(self, company_name: str, company=None) -> Optional[WantedData]:
         """회사 검색 (API 우선, 실패시 Selenium)"""
         # 1. API 시도
-        company_data = self.search_company_api(company_name)
+        company_data = self.search_company_api(company_name, company)
         if company_data:
             company_id = company_data.get("id")
             if company_id:
@@ -303,19 +432,38 @@ class WantedCrawler:
         # 2. Selenium 백업
         return self.search_company_selenium(company_name)
 
+    def _record_result(
+        self,
+        company_id: str,
+        data: Optional[WantedData],
+        results: dict,
+        pages: Optional[dict] = None,
+    ):
+        """크롤링 결과를 진행상황에 기록 (pages: 보관할 원본, 기본값은 self._captured)"""
+        if data:
+            results[company_id] = data
+            self.progress.mark_completed(company_id, data.__dict__)
+            if self.archive:
+                self.archive.record(company_id, self._captured if pages is None else pages)
+            print(f"  채용: {data.jobCount}건, 채용중: {data.isHiring}")
+        else:
+            # 재수집에서 못 찾으면 기존 결과 유지 (수집 시각만 갱신)
+            previous = self.progress.get_result(company_id) or {}
+            self.progress.mark_completed(company_id, previous)
+            print("  검색 결과 없음")
+
     def crawl_companies(
-        self, companies: list, limit: Optional[int] = None
+        self, companies: list, limit: Optional[int] = None, links: Optional[dict] = None
     ) -> dict[str, WantedData]:
-        """여러 회사 크롤링"""
+        """여러 회사 크롤링 (links: 연결 테이블의 회사 ID -> URL)"""
+        self.links = links or {}
         results = {}
         company_ids = [c.id for c in companies]
-        pending = self.progress.get_pending(company_ids)
-
-        if limit:
-            pending = pending[:limit]
+        pending = RefreshScheduler(self.progress).select(company_ids, limit=limit)
 
         total = len(pending)
         print(f"원티드 크롤링 시작: {total}개 회사")
+        deferred = None
 
         for idx, company_id in enumerate(pending, 1):
             company = next((c for c in companies if c.id == company_id), None)
@@ -324,41 +472,56 @@ class WantedCrawler:
 
             print(f"[{idx}/{total}] {company.name}")
 
-            for attempt in range(MAX_RETRIES):
-                try:
-                    time.sleep(WANTED_RATE_LIMIT)
-
-                    data = None
+            self._captured = {}
+            try:
+                data = None
 
+                with self.latency.company():
                     # 1단계: 이미 URL이 있으면 바로 사용
-                    existing_url = getattr(company, 'wanted', None)
-                    if existing_url and hasattr(existing_url, 'url') and existing_url.url:
-                        print(f"  기존 URL 사용: {existing_url.url}")
-                        data = self.get_company_by_url(existing_url.url)
+                    existing_url = self.known_url(company)
+                    if existing_url:
+                        print(f"  기존 URL 사용: {existing_url}")
+                        data = self.get_company_by_url(existing_url)
+
+                    # 2단계: 이전 검색 결과에서 본 회사면 검색 생략
+                    if not data:
+                        index_url = self.find_in_index(company)
+                        if index_url:
+                            data = self.get_company_by_url(index_url)
 
-                    # 2단계: URL 없으면 검색
+                    # 3단계: 못 찾으면 검색
                     if not data:
-                        data = self.search_company(company.name)
-
-                    if data:
-                        results[company_id] = data
-                        self.progress.mark_completed(company_id, data.__dict__)
-                        print(f"  채용: {data.jobCount}건, 채용중: {data.isHiring}")
-                    else:
-                        self.progress.mark_completed(company_id, {})
-                        print("  검색 결과 없음")
-                    break
-
-                except Exception as e:
-                    if attempt < MAX_RETRIES - 1:
-                        print(f"  [재시도 {attempt + 1}/{MAX_RETRIES}] {e}")
-                        time.sleep(RETRY_BACKOFF ** (attempt + 1))
-                    else:
-                        self.progress.mark_failed(company_id, str(e))
-                        print(f"  [에러] {e}")
+                        data = self.search_company(company.name, company)
+
+                self._record_result(company_id, data, results)
+
+            except QuotaExceeded as e:
+                deferred = e
+
+            except Exception as e:
+                self.progress.mark_failed(company_id, str(e))
+                print(f"  [에러] {e}")
+
+            if deferred:
+                # 실패로 기록하지 않고 남은 회사는 다음 실행으로 미룸
+                print(f"  [대기] {deferred}")
+                print(
+                    f"  남은 {total - idx + 1}개 회사는 "
+                    f"{deferred.reset_at:%m-%d %H:%M} 이후 다시 실행하세요."
+                )
+                break
 
         stats = self.progress.get_stats()
         print(f"\n원티드 크롤링 완료: 성공 {stats['completed']}, 실패 {stats['failed']}")
+        print(f"  {self.session.cache.summary()}")
+        print(f"  {self.search_cache.summary()}")
+        print(f"  {self.search_stats.summary()}")
+        if self.company_index:
+            print(f"  {self.company_index.summary()}")
+        print(f"  {self.session.limiter.report()}")
+        print(f"  {self.latency.summary()}")
+        if self.driver:
+            print(f"  {self.driver.report()}")
 
         return results
 